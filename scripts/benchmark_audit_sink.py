@@ -0,0 +1,78 @@
+"""
+Benchmark the durable audit sink under a sustained event rate.
+
+Emits events at `--rate` per second from several threads, then reports
+emit() latency on the caller side and how many batches (write + fsync)
+the writer needed to make everything durable:
+
+    python scripts/benchmark_audit_sink.py
+    python scripts/benchmark_audit_sink.py --rate 20000 --seconds 5 --dir /var/tmp/audit-bench
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from agentic_platform.audit.file_sink import FileAuditSink
+from agentic_platform.core.types import AuditEvent
+
+
+def producer(sink, count, interval, latencies):
+    next_at = time.perf_counter()
+    for i in range(count):
+        event = AuditEvent(event_type="STEP_STARTED", job_id=f"job-{i % 100}", node_id=f"node-{i}",
+                           timestamp="2026-01-31T00:00:00Z", status="started")
+        start = time.perf_counter()
+        sink.emit(event)
+        latencies.append(time.perf_counter() - start)
+        next_at += interval
+        delay = next_at - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=int, default=10_000, help="Events per second across all threads")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--dir", default=None, help="Segment directory (default: a temp dir)")
+    args = parser.parse_args()
+
+    directory = args.dir or tempfile.mkdtemp(prefix="audit-bench-")
+    sink = FileAuditSink(directory)
+    per_thread = int(args.rate * args.seconds / args.threads)
+    interval = args.threads / args.rate
+    latencies = [[] for _ in range(args.threads)]
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=producer, args=(sink, per_thread, interval, latencies[i]))
+               for i in range(args.threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    emitted_in = time.perf_counter() - start
+    sink.flush()
+    durable_in = time.perf_counter() - start
+    sink.close()
+
+    samples = sorted(l for thread in latencies for l in thread)
+    total = len(samples)
+    print(f"Events:        {total} in {emitted_in:.2f}s ({total / emitted_in:.0f}/s offered), durable after {durable_in:.2f}s")
+    print(f"emit():        median {statistics.median(samples) * 1e6:.1f} us, "
+          f"p99 {samples[int(total * 0.99)] * 1e6:.1f} us, max {samples[-1] * 1e6:.1f} us")
+    print(f"Group commit:  {sink.batches} batches, {total / max(sink.batches, 1):.0f} events per fsync")
+    print(f"Segments:      {len(sink.segments())} in {directory}")
+    return 0 if sink.failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Benchmark BM25 index search against a brute-force scan.
+
+Builds a synthetic corpus (words drawn from a Zipf-like vocabulary plus
+ticket IDs and error codes), then times the same queries through the
+inverted index and through a scan that scores every document, and checks
+that both return the same top scores (documents may differ on ties):
+
+    python scripts/benchmark_kb_search.py
+    python scripts/benchmark_kb_search.py --docs 200000 --queries 50
+"""
+
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from agentic_platform.integrations.base import Document
+from agentic_platform.integrations.lexical_index import BM25Index, tokenize
+
+
+def make_corpus(n_docs, vocab_size, doc_words, rng):
+    vocab = [f"w{i}" for i in range(vocab_size)]
+    weights = [1 / (rank + 1) for rank in range(vocab_size)]
+    for i in range(n_docs):
+        words = rng.choices(vocab, weights=weights, k=doc_words)
+        words.append(f"TICKET-{i}")
+        if rng.random() < 0.01:
+            words.append(f"ERR-{rng.randrange(100)}")
+        yield Document(f"doc-{i}", " ".join(words))
+
+
+def brute_force(corpus_terms, query, k, k1=1.2, b=0.75):
+    """Score every document: what search costs without an index."""
+    terms = Counter(tokenize(query))
+    n_docs = len(corpus_terms)
+    avgdl = sum(length for _, length in corpus_terms) / n_docs
+    df = {t: sum(1 for counts, _ in corpus_terms if t in counts) for t in terms}
+    scores = []
+    for docno, (counts, length) in enumerate(corpus_terms):
+        score = 0.0
+        for term, qtf in terms.items():
+            tf = counts.get(term)
+            if tf:
+                idf = math.log1p((n_docs - df[term] + 0.5) / (df[term] + 0.5))
+                score += qtf * idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avgdl))
+        if score:
+            scores.append((score, docno))
+    return [score for score, _ in sorted(scores, reverse=True)[:k]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=50_000)
+    parser.add_argument("--vocab", type=int, default=20_000)
+    parser.add_argument("--doc-words", type=int, default=60)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    docs = list(make_corpus(args.docs, args.vocab, args.doc_words, rng))
+
+    start = time.perf_counter()
+    index = BM25Index()
+    index.add(docs)
+    index._flush()
+    print(f"Indexed {len(docs)} docs into {len(index.segments)} segments in {time.perf_counter() - start:.2f}s")
+
+    corpus_terms = []
+    for doc in docs:
+        counts = Counter(tokenize(doc.text))
+        corpus_terms.append((counts, sum(counts.values())))
+
+    queries = []
+    for i in range(args.queries):
+        if i % 2:
+            queries.append(f"TICKET-{rng.randrange(args.docs)} ERR-{rng.randrange(100)}")
+        else:
+            queries.append(" ".join(f"w{rng.randrange(args.vocab // 10)}" for _ in range(3)))
+
+    index_ms, scan_ms, agree = [], [], 0
+    for query in queries:
+        start = time.perf_counter()
+        hits = index.search(query, args.k)
+        index_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        expected = brute_force(corpus_terms, query, args.k)
+        scan_ms.append((time.perf_counter() - start) * 1000)
+
+        agree += [round(score, 6) for _, score in hits] == [round(score, 6) for score in expected]
+
+    print(f"Queries:       {len(queries)} (top {args.k}), identical scores for {agree}")
+    print(f"Index search:  median {statistics.median(index_ms):.2f} ms, max {max(index_ms):.2f} ms")
+    print(f"Brute force:   median {statistics.median(scan_ms):.2f} ms, max {max(scan_ms):.2f} ms")
+    print(f"Speedup:       {statistics.median(scan_ms) / statistics.median(index_ms):.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
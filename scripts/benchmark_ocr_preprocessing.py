@@ -0,0 +1,73 @@
+"""
+Benchmark the OCR preprocessing stage over the images in sample_data.
+
+Reports the payload size before and after preprocess_image and the time
+spent per image, so option changes can be compared:
+
+    python scripts/benchmark_ocr_preprocessing.py
+    python scripts/benchmark_ocr_preprocessing.py --max-side 1600 --no-grayscale
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from agentic_platform.integrations.ocr import PreprocessOptions, preprocess_image
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tif", ".tiff"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", default=Path(__file__).parent.parent / "sample_data", type=Path)
+    parser.add_argument("--max-side", type=int, default=PreprocessOptions.max_side)
+    parser.add_argument("--target-dpi", type=int, default=None)
+    parser.add_argument("--quality", type=int, default=PreprocessOptions.jpeg_quality)
+    parser.add_argument("--no-grayscale", action="store_true")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per image (the fastest is reported)")
+    args = parser.parse_args()
+
+    options = PreprocessOptions(
+        max_side=args.max_side,
+        target_dpi=args.target_dpi,
+        grayscale=not args.no_grayscale,
+        jpeg_quality=args.quality,
+    )
+    images = sorted(p for p in args.dir.rglob("*") if p.suffix.lower() in IMAGE_SUFFIXES)
+    if not images:
+        print(f"No images found under {args.dir}")
+        return 1
+
+    print(f"Options: {options}")
+    print(f"{'image':<40} {'before':>10} {'after':>10} {'ratio':>7} {'ms':>8}")
+    total_before = total_after = 0
+    timings = []
+    for path in images:
+        content = path.read_bytes()
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = preprocess_image(content, options)
+            best = min(best, time.perf_counter() - start)
+        total_before += len(content)
+        total_after += len(result)
+        timings.append(best * 1000)
+        print(f"{str(path.relative_to(args.dir)):<40} {len(content):>10} {len(result):>10} "
+              f"{len(result) / len(content):>7.2f} {best * 1000:>8.1f}")
+
+    print()
+    print(f"Images:        {len(images)}")
+    print(f"Payload:       {total_before / 1024:.1f} KiB -> {total_after / 1024:.1f} KiB "
+          f"({100 * (1 - total_after / total_before):.1f}% smaller)")
+    print(f"Time/image:    median {statistics.median(timings):.1f} ms, max {max(timings):.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
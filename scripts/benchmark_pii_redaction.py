@@ -0,0 +1,95 @@
+"""
+Benchmark PII redaction throughput in MB/s.
+
+Compares the previous one-pass-per-pattern approach with the combined
+single-pass redactor on plain text, chunked streams and nested tool
+results, and checks that both produce the same output:
+
+    python scripts/benchmark_pii_redaction.py
+    python scripts/benchmark_pii_redaction.py --mb 50 --pii-rate 0.001
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from agentic_platform.tools.pii_redactor import PiiRedactor
+
+WORDS = ("invoice total amount due payment received order shipped customer account "
+         "reference number page section table figure confidence text block line").split()
+
+
+def make_text(n_bytes, pii_rate, rng):
+    words, size = [], 0
+    while size < n_bytes:
+        roll = rng.random()
+        if roll < pii_rate:
+            word = f"user{rng.randrange(10**6)}@example{rng.randrange(100)}.com"
+        elif roll < 2 * pii_rate:
+            word = f"{rng.randrange(200, 999)}-{rng.randrange(100, 999)}-{rng.randrange(1000, 9999)}"
+        elif roll < 0.1:
+            word = str(rng.randrange(10**6))
+        else:
+            word = rng.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def legacy_redact(text):
+    """One regex pass per pattern, as before."""
+    text = PiiRedactor.EMAIL_PATTERN.sub("<REDACTED:EMAIL>", text)
+    return PiiRedactor.PHONE_PATTERN.sub("<REDACTED:PHONE>", text)
+
+
+def throughput(label, n_bytes, func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {n_bytes / best / 1e6:8.1f} MB/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mb", type=float, default=10.0, help="Size of the text corpus")
+    parser.add_argument("--pii-rate", type=float, default=0.002, help="Fraction of words that are PII")
+    parser.add_argument("--chunk", type=int, default=64 * 1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    text = make_text(int(args.mb * 1e6), args.pii_rate, rng)
+    n_bytes = len(text.encode())
+    redactor = PiiRedactor()
+    chunks = [text[i:i + args.chunk] for i in range(0, len(text), args.chunk)]
+
+    # Tool-result shaped payloads: mostly clean, nested
+    results = [{"node_id": f"n{i}", "result": {"text": make_text(2000, args.pii_rate, rng),
+                                               "lines": [make_text(80, args.pii_rate, rng) for _ in range(5)],
+                                               "confidence": 0.9}} for i in range(500)]
+    results_bytes = len(json.dumps(results).encode())
+
+    print(f"Corpus: {n_bytes / 1e6:.1f} MB, PII rate {args.pii_rate}")
+    expected = throughput("per-pattern passes (before)", n_bytes, lambda: legacy_redact(text), args.repeat)
+    combined = throughput("single pass", n_bytes, lambda: redactor.redact(text), args.repeat)
+    streamed = throughput(f"stream ({args.chunk // 1024} KiB chunks)", n_bytes,
+                          lambda: "".join(redactor.redact_stream(chunks)), args.repeat)
+    throughput("nested tool results", results_bytes, lambda: redactor.redact_value(results), args.repeat)
+
+    identical = combined == expected and streamed == expected
+    print(f"Outputs identical to per-pattern redaction: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Ingest text files into a tenant's local knowledge base index (vector, BM25 or both).
+
+Each .txt/.md file becomes one document keyed by its path relative to the
+source directory; re-running replaces changed documents:
+
+    python scripts/build_kb_index.py --tenant startup_inc docs/
+    python scripts/build_kb_index.py --kind bm25 --tenant startup_inc docs/
+    python scripts/build_kb_index.py --kind hybrid --tenant startup_inc docs/
+    python scripts/build_kb_index.py --index-dir /tmp/kb docs/architecture.md
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from agentic_platform.integrations.base import Document
+from agentic_platform.integrations.factory import kb_index_dir
+from agentic_platform.integrations.knowledge_base import BM25KnowledgeBase, HybridKnowledgeBase, LocalVectorKnowledgeBase
+
+TEXT_SUFFIXES = {".txt", ".md"}
+
+
+def iter_documents(sources):
+    for source in sources:
+        source = Path(source)
+        files = [source] if source.is_file() else sorted(
+            p for p in source.rglob("*") if p.suffix.lower() in TEXT_SUFFIXES
+        )
+        for path in files:
+            doc_id = path.relative_to(source).as_posix() if source.is_dir() else path.name
+            yield Document(doc_id, path.read_text(encoding="utf-8", errors="replace"), {"title": path.stem})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("sources", nargs="+", help="Files or directories to ingest")
+    parser.add_argument("--tenant", default="default")
+    parser.add_argument("--kind", choices=["vector", "bm25", "hybrid"], default="vector")
+    parser.add_argument("--index-dir", type=Path, default=None,
+                        help="Defaults to $KB_INDEX_DIR/<tenant>/<kind> (hybrid: <dir>/bm25 and <dir>/vector)")
+    parser.add_argument("--query", help="Run a query against the index afterwards")
+    args = parser.parse_args()
+
+    def make(kind, index_dir):
+        index_dir = index_dir or Path(kb_index_dir(args.tenant, kind))
+        provider = BM25KnowledgeBase(index_dir) if kind == "bm25" else LocalVectorKnowledgeBase(index_dir)
+        return provider, index_dir
+
+    if args.kind == "hybrid":
+        bm25, bm25_dir = make("bm25", args.index_dir and args.index_dir / "bm25")
+        vector, vector_dir = make("vector", args.index_dir and args.index_dir / "vector")
+        kb, index_dir = HybridKnowledgeBase([bm25, vector]), f"{bm25_dir} and {vector_dir}"
+    else:
+        kb, index_dir = make(args.kind, args.index_dir)
+
+    start = time.perf_counter()
+    count = kb.ingest(iter_documents(args.sources))
+    print(f"Ingested {count} documents into {index_dir} in {time.perf_counter() - start:.2f}s")
+
+    if args.query:
+        start = time.perf_counter()
+        result = kb.search(args.query)
+        print(f"\n{result}\n\n({(time.perf_counter() - start) * 1000:.2f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,7 +15,7 @@ def verify_tenant(tenant_id: str, expected_kb_type: str, expected_ocr_type: str)
         current = get_current_tenant_id()
         assert current == tenant_id, f"Context did not stick! Got {current}"
         
-        # Clear lru_cache to ensure we resolve fresh
+        # Clear the provider cache to ensure we resolve fresh
         get_knowledge_base_provider.cache_clear()
         get_ocr_provider.cache_clear()
 
@@ -24,7 +24,8 @@ def verify_tenant(tenant_id: str, expected_kb_type: str, expected_ocr_type: str)
         ocr = get_ocr_provider()
         
         kb_name = kb.__class__.__name__
-        ocr_name = ocr.__class__.__name__
+        # Look through the OCR result cache wrapper
+        ocr_name = getattr(ocr, "provider", ocr).__class__.__name__
         
         print(f"KB Provider:  {kb_name}")
         print(f"OCR Provider: {ocr_name}")
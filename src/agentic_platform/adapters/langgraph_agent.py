@@ -11,13 +11,20 @@ Implements a reasoning agent that:
 Usage:
     agent = LangGraphAgent(model="claude-3.5-sonnet", tools=[ocr_tool])
     result = agent.execute("Extract text from document.jpg")
+
+    # Or receive reasoning steps, tool calls and LLM tokens as they happen
+    for event in agent.stream("Extract text from document.jpg"):
+        print(event["event"], event["data"])
 """
 
+import contextvars
 import logging
+import queue
 import re
 import json
-from typing import Dict, Any, List, Optional, Callable
-from dataclasses import dataclass
+import threading
+from typing import Dict, Any, Iterator, List, Optional, Callable
+from dataclasses import dataclass, asdict
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage
 from langgraph.graph import StateGraph, END
 
@@ -86,6 +93,11 @@ class LangGraphAgent:
         self.reasoning_steps: List[str] = []
         self.tool_calls: List[Dict[str, Any]] = []
         
+        # Set while stream() is running; receives (event_name, data) pairs
+        self._event_sink: Optional[Callable[[str, Dict[str, Any]], None]] = None
+        # Set by stream() when its consumer goes away; stops the graph loop
+        self._cancelled: Optional[threading.Event] = None
+        
         logger.info(f"Initialized LangGraphAgent (model={model}, tools={len(self.tools)}, max_iter={max_iterations})")
     
     def with_tools(self, tools: List) -> "LangGraphAgent":
@@ -104,6 +116,35 @@ class LangGraphAgent:
         """Record a reasoning step."""
         step_num = len(self.reasoning_steps)
         self.reasoning_steps.append(f"Step {step_num}: {step}")
+        self._emit("reasoning_step", {"step": self.reasoning_steps[-1]})
+    
+    def _emit(self, event: str, data: Dict[str, Any]) -> None:
+        """Forward an execution event to the active stream, if any."""
+        if self._event_sink is not None:
+            self._event_sink(event, data)
+    
+    def _is_cancelled(self) -> bool:
+        return self._cancelled is not None and self._cancelled.is_set()
+    
+    def _call_llm(self, messages: List[BaseMessage]) -> Optional[Any]:
+        """
+        Call the LLM.
+        
+        While streaming, the response is consumed chunk by chunk so tokens
+        reach the client as soon as the model produces them.
+        """
+        if self._event_sink is None:
+            return self.llm.invoke(messages)
+        
+        parts = []
+        for chunk in self.llm.stream(messages):
+            if self._is_cancelled():
+                break
+            text = chunk.content if hasattr(chunk, 'content') else str(chunk)
+            if isinstance(text, str) and text:
+                parts.append(text)
+                self._emit("token", {"text": text})
+        return AIMessage(content="".join(parts))
     
     def agent_node(self, state: AgentState) -> Dict[str, Any]:
         """
@@ -123,9 +164,16 @@ class LangGraphAgent:
         
         logger.debug(f"Agent node: iteration {iteration}")
         
+        if self._is_cancelled():
+            return {
+                "messages": messages,
+                "iteration_count": iteration,
+                "error": "Cancelled: stream consumer went away"
+            }
+        
         try:
             # Get LLM response
-            response = self.llm.invoke(messages)
+            response = self._call_llm(messages)
             
             if response is None:
                 logger.warning("LLM returned None")
@@ -146,6 +194,7 @@ class LangGraphAgent:
             # Detect Persona Switch
             persona = self._extract_persona(response_text)
             if persona:
+                self._emit("persona_handoff", {"to": persona})
                 self.add_reasoning_step(f"**Persona Switch**: 🔄 Handing off to *{persona}*")
                 # Add a specific event for UI to render a handoff node
                 self.tool_calls.append({
@@ -238,6 +287,7 @@ class LangGraphAgent:
                 "args": tool_input,
                 "result": result
             })
+            self._emit("tool_call", self.tool_calls[-1])
             self.add_reasoning_step(f"Tool result: {str(result)[:100]}")
             self.memory.add_tool_result(tool_name, result)
             
@@ -282,6 +332,11 @@ class LangGraphAgent:
         iteration = state["iteration_count"]
         max_iter = state["max_iterations"]
         
+        # Stop if the stream consumer went away
+        if self._is_cancelled():
+            logger.info("Stream cancelled, ending agent loop")
+            return END
+        
         # Check if max iterations reached
         if iteration >= max_iter:
             logger.info(f"Max iterations ({max_iter}) reached")
@@ -427,6 +482,61 @@ class LangGraphAgent:
                 error=str(e)
             )
     
+    def stream(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Execute agent on prompt, yielding events while it runs.
+        
+        Events are dicts of the form {"event": name, "data": {...}} with names:
+        - token: LLM output chunk
+        - reasoning_step: entry appended to reasoning_steps
+        - persona_handoff: agent switched persona
+        - tool_call: tool executed (tool, args, result)
+        - result: final AgentExecutionResult (always last)
+        
+        The graph runs on a worker thread so events emitted from inside a node
+        (e.g. tokens) are delivered before the node returns. If the consumer
+        stops iterating (e.g. an SSE client disconnects), the worker stops
+        reading the LLM and ends the graph at its next step.
+        
+        Args:
+            prompt: User prompt
+            context: Additional context
+        
+        Yields:
+            Event dicts in the order they occurred
+        """
+        events: "queue.Queue" = queue.Queue()
+        done = object()
+        cancelled = threading.Event()
+        
+        def sink(event: str, data: Dict[str, Any]) -> None:
+            if not cancelled.is_set():
+                events.put({"event": event, "data": data})
+        
+        def run() -> None:
+            self._event_sink = sink
+            self._cancelled = cancelled
+            try:
+                result = self.execute(prompt, context)
+                sink("result", asdict(result))
+            finally:
+                self._event_sink = None
+                self._cancelled = None
+                events.put(done)
+        
+        worker = threading.Thread(target=contextvars.copy_context().run, args=(run,), daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = events.get()
+                if item is done:
+                    break
+                yield item
+            worker.join()
+        finally:
+            # Reached early on GeneratorExit: nobody reads further events
+            cancelled.set()
+    
     def _get_llm_response(self, messages: List[BaseMessage]) -> Optional[Any]:
         """Get response from LLM."""
         try:
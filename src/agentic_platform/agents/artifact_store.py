@@ -1,19 +1,121 @@
+"""
+Content-addressed in-memory artifact store.
+
+Artifacts are hashed over their canonical (sorted-key JSON) form and
+stored once per SHA-256 digest; refs (`artifact:<job_id>:<sha256>`) map to
+that digest, so `get` is a dict lookup however many artifacts are stored.
+A job may hold several versions (refs), in put order. Blobs are
+reference-counted: one shared by many jobs is kept until the last ref to it
+is deleted or its jobs are evicted (`max_jobs`, oldest first).
+
+Stored artifacts are private deep copies and get() returns a deep copy, so
+values keep their types (tuples, non-string keys) and jobs sharing a blob
+cannot change each other's artifacts. Artifacts with the same JSON form
+(e.g. a tuple and a list) share one blob: the first one stored.
+"""
+
+import copy
 import hashlib
 import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+
+class _Blob:
+    __slots__ = ("artifact", "size", "refcount")
+
+    def __init__(self, artifact: Any, size: int):
+        self.artifact = artifact
+        self.size = size  # bytes of the canonical JSON form
+        self.refcount = 0
+
 
 class InMemoryArtifactStore:
-    def __init__(self):
-        self._store = {}
+    """
+    Args:
+        max_jobs: Jobs kept at most; the oldest job's refs are dropped beyond it (None = unbounded)
+    """
+
+    def __init__(self, max_jobs: Optional[int] = None):
+        self.max_jobs = max_jobs
+        self._blobs: Dict[str, _Blob] = {}                         # sha256 -> blob
+        self._refs: Dict[str, str] = {}                            # ref -> sha256
+        self._jobs: "OrderedDict[str, List[str]]" = OrderedDict()  # job_id -> refs, oldest version first
+        self._lock = threading.Lock()
+
     def put(self, job_id, artifact):
-        if job_id in self._store:
-            raise ValueError(f"Artifact for job {job_id} already exists")
+        """Store a version of `job_id`'s artifact; storing identical content again returns the same ref."""
         # Compute deterministic hash for artifact
-        artifact_hash = hashlib.sha256(json.dumps(artifact, sort_keys=True).encode()).hexdigest()
+        payload = json.dumps(artifact, sort_keys=True).encode()
+        artifact_hash = hashlib.sha256(payload).hexdigest()
         ref = f"artifact:{job_id}:{artifact_hash}"
-        self._store[job_id] = (ref, artifact)
+        with self._lock:
+            if ref in self._refs:
+                return ref
+            blob = self._blobs.get(artifact_hash)
+            if blob is None:
+                blob = self._blobs[artifact_hash] = _Blob(copy.deepcopy(artifact), len(payload))
+            blob.refcount += 1
+            self._refs[ref] = artifact_hash
+            self._jobs.setdefault(job_id, []).append(ref)
+            if self.max_jobs is not None:
+                while len(self._jobs) > self.max_jobs:
+                    _, refs = self._jobs.popitem(last=False)
+                    for old in refs:
+                        self._release(old)
         return ref
+
     def get(self, ref):
-        for job_id, (stored_ref, artifact) in self._store.items():
-            if stored_ref == ref:
-                return artifact
-        raise KeyError(f"Artifact ref {ref} not found")
+        """The artifact stored under `ref` (a copy: stored artifacts are immutable)."""
+        with self._lock:
+            artifact_hash = self._refs.get(ref)
+            if artifact_hash is None:
+                raise KeyError(f"Artifact ref {ref} not found")
+            artifact = self._blobs[artifact_hash].artifact
+        return copy.deepcopy(artifact)
+
+    def versions(self, job_id) -> List[str]:
+        """Refs stored for `job_id`, oldest first."""
+        with self._lock:
+            return list(self._jobs.get(job_id, ()))
+
+    def latest(self, job_id) -> Optional[str]:
+        """The most recently stored ref of `job_id`, if any."""
+        with self._lock:
+            refs = self._jobs.get(job_id)
+            return refs[-1] if refs else None
+
+    def delete(self, ref) -> None:
+        """Drop one ref; its blob goes once no other ref points to it."""
+        with self._lock:
+            if ref not in self._refs:
+                raise KeyError(f"Artifact ref {ref} not found")
+            job_id = ref[len("artifact:"):].rsplit(":", 1)[0]
+            refs = self._jobs.get(job_id, [])
+            refs.remove(ref)
+            if not refs:
+                self._jobs.pop(job_id, None)
+            self._release(ref)
+
+    def delete_job(self, job_id) -> None:
+        """Drop every version of `job_id`."""
+        with self._lock:
+            for ref in self._jobs.pop(job_id, ()):
+                self._release(ref)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "jobs": len(self._jobs),
+                "refs": len(self._refs),
+                "blobs": len(self._blobs),
+                "bytes": sum(blob.size for blob in self._blobs.values())
+            }
+
+    def _release(self, ref: str) -> None:
+        artifact_hash = self._refs.pop(ref)
+        blob = self._blobs[artifact_hash]
+        blob.refcount -= 1
+        if blob.refcount == 0:
+            del self._blobs[artifact_hash]
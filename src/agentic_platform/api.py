@@ -5,14 +5,20 @@ Provides:
 - POST /run-ocr/ : Extract text from images using Google Vision API
 - POST /run-workflow/ : Execute YAML-defined workflows with pluggable adapters
 - POST /mcp/request : Handle MCP (Model Context Protocol) requests
+- POST /agent/execute/stream : Run the agent, streaming progress as Server-Sent Events
+- POST /jobs : Queue a workflow or agent run; poll GET /jobs/{id} for the result
 """
 
+import asyncio
 import json
 import logging
+import mimetypes
 import os
+import shutil
 import tempfile
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from dotenv import load_dotenv
 from agentic_platform.core.secrets import SecretManager
@@ -27,19 +33,30 @@ SecretManager.load_secrets([
     "OPENAI_API_KEY"
 ])
 
-import yaml
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Body, Request
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Body, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import iterate_in_threadpool
 
-from agentic_platform.audit.audit_log import InMemoryAuditLog
+from agentic_platform.audit.audit_log import InMemoryAuditLog, event_record, parse_timestamp
+from agentic_platform.audit.file_sink import close_audit_sinks
+from agentic_platform.audit.redaction import tenant_redaction_stage, close_redaction_stages
+from agentic_platform.audit.registry import tenant_audit_log
+from agentic_platform.core.tenancy import get_current_tenant_id
 from agentic_platform.tools.tool_registry import ToolRegistry
 from agentic_platform.adapters.mcp_server import MCPServer
 # from agentic_platform.adapters.mcp_adapter import MCPAdapter
 # from agentic_platform.adapters.langgraph_adapter import LangGraphAdapter
 from agentic_platform.workflow import engine
+from agentic_platform.workflow.cache import WorkflowCache
+from agentic_platform.workflow.definition import CompiledWorkflow, compile_workflow
 from agentic_platform.core.trace import init_trace, get_trace, add_trace_step
+from agentic_platform.core.blobs import blob_store
+from agentic_platform.integrations.factory import get_ocr_provider, warm_up_providers
+from agentic_platform.jobs import JobQueue, QueueFullError, create_job_store, report_progress
+from agentic_platform.samples import SampleCatalog, SampleDownloader, ThumbnailCache
+from agentic_platform.jobs.store import SUCCEEDED, FAILED
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +70,41 @@ app = FastAPI(
 tool_registry = ToolRegistry()
 mcp_server = MCPServer(tool_registry, version="0.1.0")
 
+# Parsed and compiled workflow definitions, keyed by file mtime or content hash
+workflow_cache = WorkflowCache(max_entries=int(os.getenv("WORKFLOW_CACHE_SIZE", "128")))
+
+# Images up to this size are OCR'd from memory; larger ones are spooled to disk
+OCR_INLINE_MAX_BYTES = int(os.getenv("OCR_INLINE_MAX_BYTES", str(10 * 1024 * 1024)))
+
+# Remote images (file_path URLs) larger than this are rejected with 413;
+# downloads time out after OCR_REMOTE_TIMEOUT seconds
+OCR_REMOTE_MAX_BYTES = int(os.getenv("OCR_REMOTE_MAX_BYTES", str(20 * 1024 * 1024)))
+OCR_REMOTE_TIMEOUT = float(os.getenv("OCR_REMOTE_TIMEOUT", "30"))
+
+# Maximum images accepted by /run-ocr/batch
+OCR_BATCH_MAX_FILES = int(os.getenv("OCR_BATCH_MAX_FILES", "64"))
+
+# Background job execution (POST /jobs)
+job_store = create_job_store()
+job_queue = JobQueue(
+    job_store,
+    workers=int(os.getenv("JOB_WORKERS", "4")),
+    max_queue_size=int(os.getenv("JOB_QUEUE_SIZE", "100"))
+)
+
+# Indexed listing of sample_data for /list-samples/
+sample_catalog = SampleCatalog(
+    Path(__file__).parent.parent.parent / "sample_data",
+    poll_interval=float(os.getenv("SAMPLE_CATALOG_POLL_INTERVAL", "2.0"))
+)
+
+# Content-addressed cache of downscaled sample images (/sample_data/...?w=&h=)
+thumbnail_cache = ThumbnailCache(
+    Path(os.getenv("SAMPLE_THUMBNAIL_DIR", os.path.join(tempfile.gettempdir(), "agentic-platform-thumbnails"))),
+    content_hash=sample_catalog.content_hash
+)
+SAMPLE_CACHE_MAX_AGE = int(os.getenv("SAMPLE_CACHE_MAX_AGE", "3600"))
+
 # CORS configuration for development
 app.add_middleware(
     CORSMiddleware,
@@ -63,6 +115,37 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def warm_up_tenant_providers():
+    """Build providers for PROVIDER_WARMUP_TENANTS before the first request."""
+    tenants = os.getenv("PROVIDER_WARMUP_TENANTS", "").strip()
+    if not tenants:
+        return
+    tenant_ids = None if tenants == "*" else [t.strip() for t in tenants.split(",") if t.strip()]
+    await asyncio.to_thread(warm_up_providers, tenant_ids)
+
+
+@app.on_event("shutdown")
+async def close_audit_log_sinks():
+    """Finish queued background jobs, then commit their audit events before exiting."""
+    # Jobs emit audit events, so they must finish before the stages and
+    # sinks close; events still being redacted must reach the sinks too
+    await asyncio.to_thread(job_queue.shutdown)
+    await asyncio.to_thread(close_redaction_stages)
+    await asyncio.to_thread(close_audit_sinks)
+
+
+def _new_audit_log() -> InMemoryAuditLog:
+    """
+    Audit log of one request.
+
+    Holds the request's own trail for its response and forwards every event
+    to the tenant's shared log (GET /audit/events), which redacts PII first
+    for tenants with `pii_redaction`.
+    """
+    return InMemoryAuditLog(sink=tenant_audit_log(get_current_tenant_id()))
+
+
 @app.get("/")
 async def root():
     """Serve UI or return API welcome message."""
@@ -83,7 +166,8 @@ async def root():
             "ocr": "/run-ocr",
             "workflow": "/run-workflow/",
             "mcp_tools": "/mcp/tools",
-            "mcp_request": "/mcp/request"
+            "mcp_request": "/mcp/request",
+            "jobs": "/jobs"
         },
         "docs_url": "https://agentic-platform-api-7erqohmwxa-uc.a.run.app/docs"
     }
@@ -108,8 +192,20 @@ async def get_demo_input():
 
 
 @app.get("/sample_data/{file_path:path}")
-async def get_sample_data(file_path: str):
-    """Serve sample data files (images, etc.)."""
+async def get_sample_data(
+    request: Request,
+    file_path: str,
+    w: Optional[int] = Query(None, ge=1, le=2048),
+    h: Optional[int] = Query(None, ge=1, le=2048)
+):
+    """
+    Serve sample data files (images, etc.).
+
+    With `w` and/or `h` the image is downscaled to fit (aspect ratio kept)
+    and served from the thumbnail cache, so gallery tiles never transfer or
+    decode the original. Responses carry ETag and Cache-Control and honour
+    If-None-Match and single byte-range requests.
+    """
     sample_file = Path(__file__).parent.parent.parent / "sample_data" / file_path
     
     # Security check: prevent directory traversal
@@ -121,145 +217,181 @@ async def get_sample_data(file_path: str):
     except Exception:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    if sample_file.exists() and sample_file.is_file():
-        return FileResponse(sample_file)
-    raise HTTPException(status_code=404, detail="Sample file not found")
+    if not (sample_file.exists() and sample_file.is_file()):
+        raise HTTPException(status_code=404, detail="Sample file not found")
+
+    if w is None and h is None:
+        stat = sample_file.stat()
+        return _serve_file(
+            request,
+            sample_file,
+            etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            cache_control=f"public, max-age={SAMPLE_CACHE_MAX_AGE}"
+        )
+
+    try:
+        rendition = await asyncio.to_thread(thumbnail_cache.get, sample_file, w, h)
+    except Exception as e:
+        logger.error(f"Failed to resize {sample_file}: {e}")
+        raise HTTPException(status_code=422, detail=f"Cannot resize {file_path}: {str(e)}")
+    return _serve_file(
+        request,
+        rendition.path,
+        etag=rendition.etag,
+        cache_control=f"public, max-age={SAMPLE_CACHE_MAX_AGE}",
+        media_type="image/jpeg"
+    )
+
+
+def _serve_file(
+    request: Request,
+    path: Path,
+    etag: str,
+    cache_control: str,
+    media_type: Optional[str] = None
+) -> Response:
+    """
+    FileResponse with conditional and single byte-range support.
+
+    Multi-range requests fall through to FileResponse.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Accept-Ranges": "bytes"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    size = path.stat().st_size
+    range_header = request.headers.get("range", "")
+    if_range = request.headers.get("if-range")
+    if range_header.startswith("bytes=") and "," not in range_header and if_range in (None, etag):
+        start_text, _, end_text = range_header[len("bytes="):].strip().partition("-")
+        try:
+            if start_text:
+                start = int(start_text)
+                end = min(int(end_text), size - 1) if end_text else size - 1
+            else:
+                # Suffix range: the last N bytes
+                start = max(size - int(end_text), 0)
+                end = size - 1
+        except ValueError:
+            start, end = 0, -1
+        if start > end or start >= size:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+        def read_range(chunk_size: int = 64 * 1024):
+            with open(path, "rb") as f:
+                f.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = f.read(min(chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+
+        headers.update({"Content-Range": f"bytes {start}-{end}/{size}", "Content-Length": str(end - start + 1)})
+        return StreamingResponse(
+            read_range(),
+            status_code=206,
+            headers=headers,
+            media_type=media_type or mimetypes.guess_type(str(path))[0] or "application/octet-stream"
+        )
+
+    return FileResponse(path, headers=headers, media_type=media_type)
 
 @app.post("/download-samples/")
 async def download_samples(
     count: int = Body(100),
-    keywords: str = Body("handwriting,letter,script,paper,document")
+    keywords: str = Body("handwriting,letter,script,paper,document"),
+    background: bool = Body(False)
 ):
     """
     Download real sample images from the internet to the server.
-    """
-    import urllib.request
-    import shutil
-    import ssl
-    import random
-    
-    # 1. Setup SSL Context (Fix for Mac/Dev environments)
-    ssl_context = ssl.create_default_context()
-    try:
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-    except Exception:
-        pass
 
-    # 2. Setup Directory
-    base_dir = Path(__file__).parent.parent.parent / "sample_data"
-    download_dir = base_dir / "downloaded"
-    download_dir.mkdir(parents=True, exist_ok=True)
-    
-    # 3. Download Images
-    downloaded_files = []
-    
-    logger.info(f"Starting download of {count} samples with keywords: {keywords}")
-    
+    Images are fetched concurrently (SAMPLE_DOWNLOAD_CONCURRENCY at a time,
+    requests to one host spaced SAMPLE_DOWNLOAD_HOST_INTERVAL seconds apart).
+    With `background: true` the batch runs as a job and the response is 202
+    with the job record; poll `GET /jobs/{job_id}` for progress.
+
+    Raises:
+    - 429: If background mode is requested while the job queue is full
+    """
+    download_dir = Path(__file__).parent.parent.parent / "sample_data" / "downloaded"
     safe_count = min(count, 100) # Cap at 100 as requested
-    
-    headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'}
-    
-    import time
-    
-    for i in range(safe_count):
-        filename = f"sample_{i+1}.jpg"
-        file_path = download_dir / filename
-        
+    downloader = SampleDownloader(
+        download_dir,
+        concurrency=int(os.getenv("SAMPLE_DOWNLOAD_CONCURRENCY", "8")),
+        per_host_interval=float(os.getenv("SAMPLE_DOWNLOAD_HOST_INTERVAL", "0.2"))
+    )
+
+    def summarize(files):
+        sample_catalog.invalidate()
+        return {
+            "status": "success",
+            "message": f"Downloaded {len(files)} images",
+            "files": files
+        }
+
+    if background:
+        def on_progress(completed, total, succeeded, failed):
+            report_progress({"completed": completed, "total": total, "succeeded": succeeded, "failed": failed})
+
+        def run_download():
+            return summarize(asyncio.run(downloader.download(safe_count, keywords, on_progress=on_progress)))
+
         try:
-            # Use random lock + timestamp to defeat aggressive caching
-            lock_id = random.randint(1, 100000)
-            timestamp = int(time.time() * 1000)
-            
-            # Alternate between keywords to get diversity
-            keyword_list = keywords.split(',')
-            current_keyword = keyword_list[i % len(keyword_list)]
-            
-            url = f"https://loremflickr.com/600/800/{current_keyword}?lock={lock_id}&v={timestamp}"
-            
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10, context=ssl_context) as response, open(file_path, 'wb') as out_file:
-                shutil.copyfileobj(response, out_file)
-            
-            downloaded_files.append({
-                "name": f"Internet Sample {i+1} ({current_keyword})",
-                "path": f"sample_data/downloaded/{filename}",
-                "type": "downloaded"
-            })
-            
-            # Small sleep to be polite and avoid rate limits
-            time.sleep(0.2)
-            
-        except Exception as e:
-            logger.error(f"LoremFlickr failed for {i}: {e}. Trying fallback.")
-            # Fallback to Picsum (more reliable random images) or Dummy
-            try:
-                # Picsum Photos
-                fallback_url = f"https://picsum.photos/600/800?random={i}"
-                req = urllib.request.Request(fallback_url, headers=headers)
-                with urllib.request.urlopen(req, timeout=10, context=ssl_context) as response, open(file_path, 'wb') as out_file:
-                    shutil.copyfileobj(response, out_file)
-                
-                downloaded_files.append({
-                    "name": f"Random Sample {i+1}",
-                    "path": f"sample_data/downloaded/{filename}",
-                    "type": "downloaded"
-                })
-            except Exception as e2:
-                logger.error(f"Fallback failed too: {e2}")
+            record = job_queue.submit("download_samples", run_download)
+        except QueueFullError as e:
+            raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+        return JSONResponse(record.to_dict(), status_code=202)
 
-    return {
-        "status": "success",
-        "message": f"Downloaded {len(downloaded_files)} images",
-        "files": downloaded_files
-    }
+    return summarize(await downloader.download(safe_count, keywords))
 
 
 @app.get("/list-samples/")
-async def list_samples():
+async def list_samples(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1)
+):
     """
     List all available sample images (Curated + Downloaded).
+
+    Served from the sample catalog index with ETag/Last-Modified validators,
+    so clients revalidate with If-None-Match and get 304 while nothing changed.
+    `offset`/`limit` page through the listing; without `limit` everything
+    from `offset` on is returned.
     """
-    base_dir = Path(__file__).parent.parent.parent / "sample_data"
-    download_dir = base_dir / "downloaded"
-    
-    samples = []
-    
-    # 1. Curated (Static List) - Keep these for consistency
-    curated = [
-        {"name": "Letter (handwritten)", "path": "sample_data/letter.jpg"},
-        {"name": "Handwriting Sample", "path": "sample_data/handwriting.jpg"},
-        {"name": "Numbers Document", "path": "sample_data/numbers_gs150.jpg"},
-        {"name": "Stock Image", "path": "sample_data/stock_gs200.jpg"},
-        {"name": "Plaid Pattern", "path": "sample_data/ocr_sample_plaid.jpg"},
-        # Copies for padding if downloads don't exist
-        {"name": "Sample Image PNG", "path": "sample_data/ocr_sample_image.png"},
-    ]
-    samples.extend(curated)
-    
-    # 2. Downloaded Files
-    if download_dir.exists():
-        # Sort by integer number in filename (sample_N.jpg) to correct "off by 1" logic
-        def get_sample_num(f):
+    snapshot = await asyncio.to_thread(sample_catalog.snapshot)
+    headers = {
+        "ETag": snapshot.etag,
+        "Last-Modified": formatdate(snapshot.last_modified, usegmt=True),
+        "Cache-Control": "no-cache"
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if snapshot.etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since:
             try:
-                # Extract N from sample_N.jpg
-                return int(f.stem.split('_')[-1])
-            except:
-                return 0
-                
-        files = sorted(list(download_dir.glob("*.jpg")), key=get_sample_num)
-        for i, f in enumerate(files):
-            # Use the actual file number in the display name to match reality
-            # or just use loop index if we trust the sort
-            name = f"Internet Sample {get_sample_num(f)} ({f.stem})"
-            path = f"sample_data/downloaded/{f.name}"
-            samples.append({
-                "name": f"Internet Sample {i+1}", 
-                "path": path,
-                "type": "downloaded"
-            })
-            
-    return {"samples": samples}
+                if int(snapshot.last_modified) <= parsedate_to_datetime(if_modified_since).timestamp():
+                    return Response(status_code=304, headers=headers)
+            except (TypeError, ValueError):
+                pass
+
+    end = offset + limit if limit is not None else None
+    return JSONResponse(
+        {
+            "samples": list(snapshot.samples[offset:end]),
+            "total": len(snapshot.samples),
+            "offset": offset,
+            "limit": limit
+        },
+        headers=headers
+    )
 
 
 @app.post("/run-ocr/")
@@ -280,7 +412,9 @@ async def run_ocr_workflow(
     Raises:
         HTTPException: If workflow execution fails
     """
-    import random
+    img_ref = None  # mem:// reference for images kept in memory
+    img_tmp_path = None  # temp file for images above OCR_INLINE_MAX_BYTES
+    creds_path = None
     try:
         # Parse form data manually
         form = await request.form()
@@ -291,23 +425,34 @@ async def run_ocr_workflow(
             # Handle remote URLs
             if file_path.startswith(('http://', 'https://')):
                 import urllib.request
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as img_tmp:
-                    # Download the image from the URL
-                    try:
-                        # Add User-Agent to avoid some blocking
-                        req = urllib.request.Request(
-                            file_path, 
-                            data=None, 
-                            headers={
-                                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                            }
-                        )
-                        with urllib.request.urlopen(req) as response:
-                            img_tmp.write(response.read())
-                        img_path = img_tmp.name
-                        logger.info(f"Downloaded remote image from: {file_path}")
-                    except Exception as e:
-                        raise HTTPException(status_code=400, detail=f"Failed to download remote image: {str(e)}")
+                # Download the image from the URL
+                try:
+                    # Add User-Agent to avoid some blocking
+                    req = urllib.request.Request(
+                        file_path, 
+                        data=None, 
+                        headers={
+                            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+                        }
+                    )
+                    with urllib.request.urlopen(req, timeout=OCR_REMOTE_TIMEOUT) as response:
+                        # Never buffer more than the limit, whatever the server sends
+                        img_bytes = response.read(OCR_REMOTE_MAX_BYTES + 1)
+                    logger.info(f"Downloaded remote image from: {file_path}")
+                except Exception as e:
+                    raise HTTPException(status_code=400, detail=f"Failed to download remote image: {str(e)}")
+                if len(img_bytes) > OCR_REMOTE_MAX_BYTES:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Remote image exceeds {OCR_REMOTE_MAX_BYTES} bytes"
+                    )
+                if len(img_bytes) <= OCR_INLINE_MAX_BYTES:
+                    # No name: the provider's demo fallback is keyed on sample filenames
+                    img_path = img_ref = blob_store.put(img_bytes)
+                else:
+                    with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as img_tmp:
+                        img_tmp.write(img_bytes)
+                    img_path = img_tmp_path = img_tmp.name
             else:
                 # Use provided file path (for sample files)
                 # Convert relative path to absolute path relative to project root
@@ -317,19 +462,23 @@ async def run_ocr_workflow(
                     img_path = os.path.join(project_root, file_path)
                 else:
                     img_path = file_path
-            creds_path = None
         else:
             # Handle uploaded image
             if not image:
                 raise HTTPException(status_code=400, detail="Either image file or file_path must be provided")
             
-            # Save uploaded image to a temp file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as img_tmp:
+            # Small uploads go straight from the multipart buffer to OCR;
+            # only large ones are spooled to a temp file
+            if image.size is not None and image.size > OCR_INLINE_MAX_BYTES:
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as img_tmp:
+                    shutil.copyfileobj(image.file, img_tmp)
+                img_path = img_tmp_path = img_tmp.name
+            else:
                 img_bytes = await image.read()
-                img_tmp.write(img_bytes)
-                img_path = img_tmp.name
+                # The client's filename is not passed on, so an upload named
+                # like a bundled sample never gets the sample's demo text
+                img_path = img_ref = blob_store.put(img_bytes)
 
-            creds_path = None
             if credentials_json:
                 with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as creds_tmp:
                     creds_bytes = await credentials_json.read()
@@ -340,8 +489,7 @@ async def run_ocr_workflow(
         workflow_path = os.path.join(
             os.path.dirname(os.path.dirname(__file__)), "workflows/ocr_mvp.yaml"
         )
-        with open(workflow_path, "r") as wf_file:
-            wf_def = yaml.safe_load(wf_file)
+        wf_def = workflow_cache.load_file(workflow_path)
 
         # Prepare workflow input - wrap in "inputs" to match YAML template references
         input_data = {
@@ -352,7 +500,7 @@ async def run_ocr_workflow(
         }
 
         # Execute workflow
-        audit_log = InMemoryAuditLog()
+        audit_log = _new_audit_log()
         tool_client = ToolRegistry()
         result = engine.run(
             wf_def,
@@ -363,25 +511,22 @@ async def run_ocr_workflow(
 
         # Format results
         job_id = result.get("job_id", "job-1")
-        audit_events = [vars(e) for e in audit_log.get_events(job_id)]
+        audit_events = [event_record(e) for e in audit_log.get_events(job_id)]
         tool_results = result.get("tool_results", [])
 
         formatted_lines = []
         ocr_error = None
-        # Generate a mock confidence score if one isn't available from the tool
-        # In a real impl, this would be extracted from the Google Vision response
         confidence_score = 0.0
-        
+        confidence_stats = None
+
         if tool_results:
             first_res = tool_results[0].get("result", {})
             text = first_res.get("text", "")
             ocr_error = first_res.get("error")
-            # Mock confidence for demo purposes (high confidence for success)
             if text:
                 formatted_lines = text.splitlines()
-                confidence_score = round(random.uniform(0.85, 0.99), 2)
-            else:
-                confidence_score = 0.0
+                confidence_score = round(float(first_res.get("confidence", 0.0)), 4)
+                confidence_stats = first_res.get("confidence_stats")
 
         logger.info(f"OCR workflow completed successfully for image: {image.filename if image else 'sample file'}")
         return JSONResponse({
@@ -390,23 +535,104 @@ async def run_ocr_workflow(
             "audit_log": audit_events,
             "formatted_text_lines": formatted_lines,
             "confidence": confidence_score,
+            "confidence_stats": confidence_stats,
             "error": ocr_error
         })
 
     except Exception as e:
+        if isinstance(e, HTTPException) and e.status_code == 413:
+            raise
         logger.error(f"OCR workflow execution error: {str(e)}", exc_info=True)
         raise HTTPException(
             status_code=422,
             detail=f"OCR workflow execution error: {str(e)}"
         )
     finally:
-        # Clean up temporary files
-        if os.path.exists(img_path):
-            os.remove(img_path)
+        # Release in-memory uploads and clean up temporary files
+        if img_ref:
+            blob_store.discard(img_ref)
+        if img_tmp_path and os.path.exists(img_tmp_path):
+            os.remove(img_tmp_path)
         if creds_path and os.path.exists(creds_path):
             os.remove(creds_path)
 
 
+@app.post("/run-ocr/batch")
+async def run_ocr_batch(
+    files: Optional[List[UploadFile]] = File(None),
+    file_paths: Optional[List[str]] = Form(None)
+) -> JSONResponse:
+    """
+    OCR many images in one call.
+
+    Accepts uploaded `files` and/or `file_paths` of sample images (relative
+    to the project root, inside sample_data). Images are sent to the OCR
+    provider as batches (16 per Vision request), and results come back in
+    input order: uploads first, then paths.
+
+    Raises:
+    - 400: If no images are given or more than OCR_BATCH_MAX_FILES
+    - 403: If a path points outside sample_data
+    - 404: If a sample path does not exist
+    """
+    files = files or []
+    file_paths = file_paths or []
+    if not files and not file_paths:
+        raise HTTPException(status_code=400, detail="Provide at least one file or file_path")
+    if len(files) + len(file_paths) > OCR_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {OCR_BATCH_MAX_FILES} images per batch ({len(files) + len(file_paths)} given)"
+        )
+
+    project_root = Path(__file__).parent.parent.parent
+    sample_dir = (project_root / "sample_data").resolve()
+    items = []
+    names = []
+    for upload in files:
+        items.append(await upload.read())  # unnamed, like /run-ocr/ uploads
+        names.append(upload.filename or "")
+    for file_path in file_paths:
+        resolved = (project_root / file_path).resolve()
+        if not resolved.is_relative_to(sample_dir):
+            raise HTTPException(status_code=403, detail=f"Access denied: {file_path}")
+        if not resolved.is_file():
+            raise HTTPException(status_code=404, detail=f"Sample file not found: {file_path}")
+        items.append(str(resolved))
+        names.append(file_path)
+
+    try:
+        provider = get_ocr_provider()
+        results = await asyncio.to_thread(provider.ocr_batch, items)
+    except Exception as e:
+        logger.error(f"Batch OCR failed: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=422, detail=f"Batch OCR failed: {str(e)}")
+
+    logger.info(f"Batch OCR completed for {len(items)} images")
+    return JSONResponse({
+        "count": len(results),
+        "results": [{"source": name, **result} for name, result in zip(names, results)]
+    })
+
+
+def _execute_workflow(wf_def: CompiledWorkflow, input_data: Any, tool_client) -> Dict[str, Any]:
+    """Run a workflow and return the result, tool results and audit trail."""
+    audit_log = _new_audit_log()
+    result = engine.run(
+        wf_def,
+        input_artifact=input_data,
+        tool_client=tool_client,
+        audit_log=audit_log
+    )
+    job_id = result.get("job_id", "job-1")
+    audit_events = [event_record(e) for e in audit_log.get_events(job_id)]
+    return {
+        "result": result,
+        "tool_results": result.get("tool_results", []),
+        "audit_log": audit_events
+    }
+
+
 @app.post("/run-workflow/")
 async def run_workflow(
     workflow: UploadFile = File(..., description="YAML workflow definition file"),
@@ -460,19 +686,7 @@ async def run_workflow(
         workflow_content = await workflow.read()
         if not workflow_content:
             raise ValueError("Workflow file is empty")
-        # Decode bytes to string if needed
-        if isinstance(workflow_content, bytes):
-            workflow_text = workflow_content.decode('utf-8')
-        else:
-            workflow_text = workflow_content
-        logger.debug(f"Workflow content (first 200 chars): {workflow_text[:200]}")
-        wf_def = yaml.safe_load(workflow_text)
-        if not wf_def:
-            raise ValueError("Workflow YAML is empty or parses to None")
-        if not isinstance(wf_def, dict):
-            raise ValueError(f"Workflow must be a YAML object/dict, got {type(wf_def).__name__}")
-        if "nodes" not in wf_def or "edges" not in wf_def:
-            raise ValueError(f"Workflow must contain 'nodes' and 'edges' keys. Found keys: {list(wf_def.keys())}")
+        wf_def = workflow_cache.load_text(workflow_content)
     except Exception as e:
         logger.error(f"Malformed workflow YAML: {str(e)}")
         raise HTTPException(
@@ -498,21 +712,9 @@ async def run_workflow(
     tool_client = tool_registry
 
     try:
-        audit_log = InMemoryAuditLog()
-        result = engine.run(
-            wf_def,
-            input_artifact=input_data,
-            tool_client=tool_client,
-            audit_log=audit_log
-        )
-        job_id = result.get("job_id", "job-1")
-        audit_events = [vars(e) for e in audit_log.get_events(job_id)]
+        response = _execute_workflow(wf_def, input_data, tool_client)
         logger.info(f"Workflow executed successfully with adapter: {adapter}")
-        return JSONResponse({
-            "result": result,
-            "tool_results": result.get("tool_results", []),
-            "audit_log": audit_events
-        })
+        return JSONResponse(response)
     except Exception as e:
         logger.error(f"Workflow execution error: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -521,6 +723,156 @@ async def run_workflow(
         )
 
 
+# ============================================================================
+# Asynchronous Jobs
+# ============================================================================
+
+@app.post("/jobs", status_code=202)
+async def submit_job(request: Dict[str, Any]) -> JSONResponse:
+    """
+    Submit a workflow or agent run for background execution.
+
+    The request returns as soon as the job is queued; poll `GET /jobs/{job_id}`
+    for status and fetch the output from `GET /jobs/{job_id}/result`.
+
+    Example:
+        POST /jobs
+        {"type": "workflow", "workflow": "<YAML text or object>", "input": {...}}
+
+        POST /jobs
+        {"type": "agent", "prompt": "...", "model": "mock-llm"}
+
+    Raises:
+    - 400: If the job type is unknown or the payload is malformed
+    - 429: If the job queue is full
+    """
+    job_type = request.get("type")
+
+    if job_type == "workflow":
+        try:
+            workflow = request.get("workflow")
+            if isinstance(workflow, dict):
+                if "nodes" not in workflow or "edges" not in workflow:
+                    raise ValueError("Workflow must contain 'nodes' and 'edges' keys")
+                wf_def = compile_workflow(workflow)
+            elif workflow:
+                wf_def = workflow_cache.load_text(workflow)
+            else:
+                raise ValueError("workflow is required")
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Malformed workflow YAML: {str(e)}")
+        input_data = request.get("input") or {}
+        func = lambda: _execute_workflow(wf_def, input_data, tool_registry)
+    elif job_type == "agent":
+        prompt = request.get("prompt")
+        if not prompt:
+            raise HTTPException(status_code=400, detail="prompt is required for agent jobs")
+        model = request.get("model", "mock-llm")
+        enable_code_interpreter = bool(request.get("enable_code_interpreter", False))
+        func = lambda: _execute_agent(prompt, model, enable_code_interpreter)
+    else:
+        raise HTTPException(status_code=400, detail=f"Unknown job type: {job_type!r} (expected 'workflow' or 'agent')")
+
+    redaction = tenant_redaction_stage(get_current_tenant_id())
+    if redaction is not None:
+        # Results are redacted on the job worker, before they reach the job store
+        run = func
+        func = lambda: redaction.redact(run())
+
+    try:
+        record = job_queue.submit(job_type, func)
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+
+    return JSONResponse(record.to_dict(), status_code=202)
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str) -> JSONResponse:
+    """Return the status and timestamps of a submitted job."""
+    record = job_store.get(job_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return JSONResponse(record.to_dict())
+
+
+@app.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str) -> JSONResponse:
+    """
+    Return the output of a finished job.
+
+    Responds 202 with the job status while the job is still queued or running,
+    and 422 with the error if it failed.
+    """
+    record = job_store.get(job_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    if record.status == FAILED:
+        raise HTTPException(status_code=422, detail=f"Job {job_id} failed: {record.error}")
+    if record.status != SUCCEEDED:
+        return JSONResponse(record.to_dict(), status_code=202)
+    return JSONResponse(record.result)
+
+
+# ============================================================================
+# Audit Endpoints
+# ============================================================================
+
+AUDIT_PAGE_MAX = 1000
+
+
+@app.get("/audit/events")
+async def list_audit_events(
+    request: Request,
+    job_id: Optional[str] = None,
+    tenant: Optional[str] = None,
+    event_type: Optional[str] = Query(None, alias="type"),
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=AUDIT_PAGE_MAX),
+    cursor: Optional[str] = None,
+    output_format: str = Query("json", alias="format", pattern="^(json|ndjson)$")
+):
+    """
+    Query a tenant's audit events, oldest first.
+
+    Filters: `job_id`, `type` (e.g. STEP_ERRORED) and an ISO-8601
+    `since`/`until` window. JSON responses hold at most `limit` events plus a
+    `next_cursor` to pass back as `cursor` (null on the last page).
+    `format=ndjson` (or `Accept: application/x-ndjson`) instead streams every
+    match from `cursor` on as newline-delimited JSON, read from the store a
+    page at a time, for exports.
+    """
+    tenant_id = tenant or get_current_tenant_id()
+    try:
+        after = int(cursor) if cursor else 0
+        for bound in (since, until):
+            if bound:
+                parse_timestamp(bound)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor or since/until timestamp")
+
+    log = tenant_audit_log(tenant_id)
+    filters = {"job_id": job_id, "event_type": event_type, "since": since, "until": until}
+
+    if output_format == "ndjson" or "application/x-ndjson" in request.headers.get("accept", ""):
+        def export():
+            position = after
+            while position is not None:
+                events, position = log.page(after=position, limit=AUDIT_PAGE_MAX, **filters)
+                if events:
+                    yield "".join(json.dumps(event_record(e), default=str) + "\n" for e in events)
+
+        return StreamingResponse(export(), media_type="application/x-ndjson")
+
+    events, next_cursor = await asyncio.to_thread(log.page, after=after, limit=limit, **filters)
+    return JSONResponse({
+        "tenant": tenant_id,
+        "events": [event_record(e) for e in events],
+        "next_cursor": str(next_cursor) if next_cursor is not None else None
+    })
+
+
 # ============================================================================
 # MCP (Model Context Protocol) Endpoints
 # ============================================================================
@@ -665,6 +1017,92 @@ async def list_mcp_tools() -> JSONResponse:
         )
 
 
+def _build_agent_tools(enable_code_interpreter: bool = False) -> list:
+    """Wrap registry tools in the minimal interface LangGraphAgent expects."""
+    agent_tools = []
+    for name in tool_registry.list_tools():
+        # Skip code interpreter unless explicitly enabled
+        if name == "python_interpreter" and not enable_code_interpreter:
+            continue
+            
+        spec = tool_registry.get_tool(name)
+        if spec:
+            # Create a simple adapter object
+            class ToolAdapter:
+                def __init__(self, s):
+                    self.name = s.name
+                    self.description = s.description
+                    self.spec = s
+                    self.func = lambda **kwargs: s.handler(kwargs)
+                
+                # LangChain expects .run method or __call__
+                def _run(self, *args, **kwargs):
+                    return self.func(**kwargs)
+                    
+            agent_tools.append(ToolAdapter(spec))
+    return agent_tools
+
+
+def _create_agent(model: str, enable_code_interpreter: bool = False):
+    """Build a LangGraphAgent for the requested model with the registry tools."""
+    from agentic_platform.adapters.langgraph_agent import LangGraphAgent
+    from agentic_platform.llm import get_llm_model
+
+    # Get the appropriate LLM based on model parameter
+    try:
+        llm = get_llm_model(model=model)
+    except ValueError:
+        from agentic_platform.llm.mock_llm import MockLLM
+        llm = MockLLM(model=model)
+
+    # Initialize agent with the selected LLM and tools
+    return LangGraphAgent(
+        model=model,
+        llm=llm,
+        tools=_build_agent_tools(enable_code_interpreter),
+        max_iterations=3
+    )
+
+
+def _llm_setup_summary() -> Dict[str, Any]:
+    """Describe the LLM configuration for agent responses."""
+    from agentic_platform.llm import validate_llm_setup
+
+    setup_status = validate_llm_setup()
+    # Convert LLMProvider enum to string for JSON serialization
+    api_keys_status = {k: v for k, v in setup_status["api_keys_configured"].items()}
+    return {
+        "use_mock_llm": setup_status["use_mock_llm"],
+        "api_keys_configured": api_keys_status,
+        "default_model": setup_status["default_model"][1],  # Get model name from tuple
+        "available_models": setup_status["available_models"]
+    }
+
+
+def _execute_agent(prompt: str, model: str, enable_code_interpreter: bool = False) -> Dict[str, Any]:
+    """Run the LangGraph agent on a prompt and return the response payload."""
+    logger.info(f"Agent execution request: model={model}, code_interpreter={enable_code_interpreter}")
+
+    llm_setup = _llm_setup_summary()
+    agent = _create_agent(model, enable_code_interpreter)
+
+    # Execute agent
+    result = agent.execute(prompt)
+    
+    logger.info(f"Agent execution complete: status={result.status}, iterations={result.iterations}")
+    
+    return {
+        "status": result.status,
+        "final_output": result.final_output,
+        "reasoning_steps": result.reasoning_steps,
+        "iterations": result.iterations,
+        "tool_calls": result.tool_calls,
+        "error": result.error,
+        "model_used": model,
+        "llm_setup": llm_setup
+    }
+
+
 @app.post("/agent/execute")
 async def execute_agent(
     prompt: str = Form(...), 
@@ -676,76 +1114,7 @@ async def execute_agent(
     ...
     """
     try:
-        from agentic_platform.adapters.langgraph_agent import LangGraphAgent
-        from agentic_platform.llm import get_llm_model, validate_llm_setup
-        
-        logger.info(f"Agent execution request: model={model}, code_interpreter={enable_code_interpreter}")
-        
-        # ... (LLM setup code) ...
-        # Validate LLM setup
-        setup_status = validate_llm_setup()
-        
-        # Get the appropriate LLM based on model parameter
-        try:
-            llm = get_llm_model(model=model)
-        except ValueError:
-            from agentic_platform.llm.mock_llm import MockLLM
-            llm = MockLLM(model=model)
-        
-        # Prepare tools for the agent
-        agent_tools = []
-        for name in tool_registry.list_tools():
-            # Skip code interpreter unless explicitly enabled
-            if name == "python_interpreter" and not enable_code_interpreter:
-                continue
-                
-            spec = tool_registry.get_tool(name)
-            if spec:
-                # Create a simple adapter object
-                class ToolAdapter:
-                    def __init__(self, s):
-                        self.name = s.name
-                        self.description = s.description
-                        self.spec = s
-                        self.func = lambda **kwargs: s.handler(kwargs)
-                    
-                    # LangChain expects .run method or __call__
-                    def _run(self, *args, **kwargs):
-                        return self.func(**kwargs)
-                        
-                agent_tools.append(ToolAdapter(spec))
-        
-        # Initialize agent with the selected LLM and tools
-        agent = LangGraphAgent(
-            model=model,
-            llm=llm,
-            tools=agent_tools,
-            max_iterations=3
-        )
-        
-        # Execute agent
-        result = agent.execute(prompt)
-        
-        logger.info(f"Agent execution complete: status={result.status}, iterations={result.iterations}")
-        
-        # Convert LLMProvider enum to string for JSON serialization
-        api_keys_status = {k: v for k, v in setup_status["api_keys_configured"].items()}
-        
-        return JSONResponse({
-            "status": result.status,
-            "final_output": result.final_output,
-            "reasoning_steps": result.reasoning_steps,
-            "iterations": result.iterations,
-            "tool_calls": result.tool_calls,
-            "error": result.error,
-            "model_used": model,
-            "llm_setup": {
-                "use_mock_llm": setup_status["use_mock_llm"],
-                "api_keys_configured": api_keys_status,
-                "default_model": setup_status["default_model"][1],  # Get model name from tuple
-                "available_models": setup_status["available_models"]
-            }
-        })
+        return JSONResponse(_execute_agent(prompt, model, enable_code_interpreter))
         
     except Exception as e:
         logger.error(f"Agent execution failed: {str(e)}", exc_info=True)
@@ -755,6 +1124,52 @@ async def execute_agent(
         )
 
 
+@app.post("/agent/execute/stream")
+async def execute_agent_stream(
+    prompt: str = Form(...),
+    model: str = Form("mock-llm"),
+    enable_code_interpreter: bool = Form(False)
+):
+    """
+    Execute LangGraph agent and stream its progress as Server-Sent Events.
+
+    Emits `token`, `reasoning_step`, `persona_handoff` and `tool_call` events
+    while the agent runs, then a final `result` event whose data matches the
+    `/agent/execute` response. Failures are reported as an `error` event.
+    """
+    def sse(event: str, data: Any) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+    def agent_events():
+        try:
+            logger.info(f"Agent stream request: model={model}, code_interpreter={enable_code_interpreter}")
+            llm_setup = _llm_setup_summary()
+            agent = _create_agent(model, enable_code_interpreter)
+            for event in agent.stream(prompt):
+                data = event["data"]
+                if event["event"] == "result":
+                    data = {**data, "model_used": model, "llm_setup": llm_setup}
+                yield sse(event["event"], data)
+        except Exception as e:
+            logger.error(f"Agent stream failed: {str(e)}", exc_info=True)
+            yield sse("error", {"detail": f"Agent execution failed: {str(e)}"})
+
+    async def event_stream():
+        events = agent_events()
+        try:
+            async for chunk in iterate_in_threadpool(events):
+                yield chunk
+        finally:
+            # Runs on client disconnect too: closing the generator cancels the agent run
+            events.close()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.get("/agent/models")
 async def list_agent_models():
     """
@@ -907,8 +1322,6 @@ if ui_dist_path.exists():
         # Fallback
         return {"detail": "Not Found"}
 
-from agentic_platform.tools.google_vision_ocr import GoogleVisionOCR
-
 @app.post("/analyze-quality")
 async def analyze_quality(request: Request):
     """
@@ -939,9 +1352,9 @@ async def analyze_quality(request: Request):
              if not full_path.exists():
                 raise HTTPException(status_code=404, detail=f"Image {image_path} not found")
 
-        # Reuse generic OCR logic
-        ocr = GoogleVisionOCR(credentials_json=os.getenv("GOOGLE_APPLICATION_CREDENTIALS"))
-        result = ocr.ocr_image(str(full_path))
+        # Reuse generic OCR logic (shares the OCR result cache with /run-ocr/ and tools)
+        ocr = get_ocr_provider(credentials_json=os.getenv("GOOGLE_APPLICATION_CREDENTIALS"))
+        result = await ocr.aocr_image(str(full_path))
         
         text = result.get("text", "")
         # Heuristic for "OCR Worthiness"
@@ -968,6 +1381,13 @@ async def analyze_quality(request: Request):
         if result.get("confidence", 0) > 0.8:
             score += 30
             reasoning.append("High confidence detection.")
+
+        stats = result.get("confidence_stats")
+        if stats and stats["low_confidence_count"]:
+            reasoning.append(
+                f"{stats['low_confidence_count']} of {stats['count']} symbols below "
+                f"{stats['low_confidence_threshold']:.0%} confidence."
+            )
             
         # Cap score at 100
         score = min(score, 100)
@@ -980,7 +1400,8 @@ async def analyze_quality(request: Request):
             "details": {
                 "char_count": char_count,
                 "line_count": line_count,
-                "confidence": result.get("confidence", 0)
+                "confidence": result.get("confidence", 0),
+                "confidence_stats": stats,
             },
             "reasoning": reasoning
         }
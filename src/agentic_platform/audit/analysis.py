@@ -0,0 +1,90 @@
+"""
+Latency analysis of a job's audit trail.
+
+Works on the monotonic stamps the workflow engine records: every
+STEP_ENDED / STEP_ERRORED event with start_ns and end_ns is a span. A span
+opened by a STEP_STARTED of the same node and start_ns is a node
+execution; the end node's STEP_ENDED has none (the start node's
+STEP_STARTED opened it) and is the job itself. A failed job has no job
+span; it runs from the start node's STEP_STARTED to its last span. Node
+executions are aggregated per node and chained
+into the critical path: walking back from the span that finished last,
+each step's predecessor is the span that finished most recently before it
+started. Whatever the critical path does not cover is engine overhead
+(routing, condition evaluation, audit emission).
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List
+
+from .audit_log import event_record
+
+SPAN_EVENT_TYPES = ("STEP_ENDED", "STEP_ERRORED")
+
+
+def _spans(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [r for r in records if r.get("event_type") in SPAN_EVENT_TYPES
+            and r.get("start_ns") is not None and r.get("end_ns") is not None]
+
+
+def critical_path(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Chain of spans, in execution order, that determined when the last one finished."""
+    remaining = sorted(spans, key=lambda s: s["end_ns"])
+    if not remaining:
+        return []
+    path = [remaining.pop()]
+    while True:
+        start = path[-1]["start_ns"]
+        i = len(remaining) - 1
+        while i >= 0 and remaining[i]["end_ns"] > start:
+            i -= 1
+        if i < 0:
+            break
+        path.append(remaining[i])
+        remaining = remaining[:i]
+    return path[::-1]
+
+
+def latency_breakdown(events: Iterable[Any]) -> Dict[str, Any]:
+    """
+    Per-node durations and the critical path of one job.
+
+    Accepts AuditEvent objects or their dict records (e.g. from a
+    FileAuditSink). Durations are in nanoseconds.
+    """
+    records = [event if isinstance(event, dict) else event_record(event) for event in events]
+    spans = _spans(records)
+    if not spans:
+        return {"total_ns": 0, "nodes": {}, "critical_path": [], "critical_path_ns": 0, "overhead_ns": 0}
+
+    opened = {(r["node_id"], r["start_ns"]) for r in records
+              if r.get("event_type") == "STEP_STARTED" and r.get("start_ns") is not None}
+    if opened:
+        job_spans = [s for s in spans if (s["node_id"], s["start_ns"]) not in opened]
+        steps = [s for s in spans if (s["node_id"], s["start_ns"]) in opened]
+    else:
+        # Spans only (no STEP_STARTED records): nothing marks the job, all are steps
+        job_spans, steps = [], spans
+    bounds = job_spans or steps
+    job_start = min([s["start_ns"] for s in bounds] + [start for _, start in opened])
+    job_end = max(s["end_ns"] for s in bounds)
+
+    nodes: Dict[str, Dict[str, int]] = defaultdict(lambda: {"count": 0, "errors": 0, "total_ns": 0, "max_ns": 0})
+    for span in steps:
+        duration = span["end_ns"] - span["start_ns"]
+        node = nodes[span["node_id"]]
+        node["count"] += 1
+        node["errors"] += span["event_type"] == "STEP_ERRORED"
+        node["total_ns"] += duration
+        node["max_ns"] = max(node["max_ns"], duration)
+
+    path = critical_path(steps)
+    path_ns = sum(s["end_ns"] - s["start_ns"] for s in path)
+    total = job_end - job_start
+    return {
+        "total_ns": total,
+        "nodes": dict(sorted(nodes.items(), key=lambda item: -item[1]["total_ns"])),
+        "critical_path": [s["node_id"] for s in path],
+        "critical_path_ns": path_ns,
+        "overhead_ns": max(total - path_ns, 0)
+    }
@@ -1,26 +1,278 @@
-from typing import List
-from agentic_platform.core.types import AuditEvent
+"""
+In-memory audit log indexed by job.
+
+Events are appended to a per-job list, so `get_events(job_id)` costs the
+size of that job's trail rather than everything emitted since start-up.
+Retention is bounded: once more than `max_jobs` jobs are held, jobs marked
+completed are evicted first (oldest completion first), then the oldest
+still-running ones. Completed jobs are also dropped after `completed_ttl`
+seconds. Each job keeps its event times sorted, so time-range queries use
+bisection.
+
+Every event also gets a process-wide sequence number; `page()` resumes
+after one, which gives stable cursors for paginating across all jobs.
+Evicted jobs leave tombstones in that global log, compacted once they make
+up half of it.
+
+An optional `sink` (e.g. a FileAuditSink, or another InMemoryAuditLog)
+receives every event as well, for trails that must outlive the process or
+the request. With a `redaction` stage, events are redacted (in per-job
+order, possibly on a worker thread) before they are indexed or forwarded.
+"""
+
+import bisect
+import dataclasses
+import heapq
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from agentic_platform.core.types import AgentOutputEvent, AuditEvent, utc_timestamp
+
+logger = logging.getLogger(__name__)
+
+TimeBound = Union[str, float, datetime, None]
+
+
+def event_record(event) -> Dict[str, Any]:
+    """Plain dict of an audit event, for JSON responses and durable sinks."""
+    if dataclasses.is_dataclass(event):
+        return dataclasses.asdict(event)
+    return dict(vars(event))
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp, accepting a trailing "Z" for UTC.
+
+    datetime.fromisoformat only understands "Z" from Python 3.11 on.
+    Raises ValueError for anything else it cannot parse.
+    """
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def event_time(timestamp) -> float:
+    """Epoch seconds of an ISO-8601 event timestamp (naive times are taken as UTC)."""
+    if isinstance(timestamp, (int, float)):
+        return float(timestamp)
+    if isinstance(timestamp, str):
+        try:
+            timestamp = parse_timestamp(timestamp)
+        except ValueError:
+            return 0.0
+    if isinstance(timestamp, datetime):
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.timestamp()
+    return 0.0
+
+
+class _JobTrail:
+    """Events of one job in emit order, plus their times in sorted order."""
+
+    __slots__ = ("events", "seqs", "times", "order", "completed_at")
 
-class InMemoryAuditLog:
     def __init__(self):
-        self._events: List[AuditEvent] = []
+        self.events: List[AuditEvent] = []
+        self.seqs: List[int] = []
+        self.times: List[float] = []  # sorted
+        self.order: List[int] = []    # times[i] belongs to events[order[i]]
+        self.completed_at: Optional[float] = None
+
+    def append(self, event, seq: int) -> None:
+        t = event_time(getattr(event, "timestamp", None))
+        if not self.times or t >= self.times[-1]:
+            self.times.append(t)
+            self.order.append(len(self.events))
+        else:
+            i = bisect.bisect_right(self.times, t)
+            self.times.insert(i, t)
+            self.order.insert(i, len(self.events))
+        self.events.append(event)
+        self.seqs.append(seq)
+
+    def between(self, since: float, until: float) -> List[tuple]:
+        lo = bisect.bisect_left(self.times, since)
+        hi = bisect.bisect_right(self.times, until)
+        return [(self.times[i], self.order[i], self.events[self.order[i]]) for i in range(lo, hi)]
+
+
+class InMemoryAuditLog:
+    """
+    Audit event store with O(1) per-job lookup and bounded retention.
+
+    Args:
+        max_jobs: Jobs retained at most (None = unbounded)
+        completed_ttl: Seconds a completed job is kept (None = until evicted by max_jobs)
+        sink: Durable store every event is also forwarded to
+        redaction: RedactionStage applied before events are stored
+    """
+
+    def __init__(self, max_jobs: Optional[int] = None, completed_ttl: Optional[float] = None,
+                 sink=None, redaction=None):
+        self.max_jobs = max_jobs
+        self.completed_ttl = completed_ttl
+        self.sink = sink
+        self.redaction = redaction
+        self._jobs: "OrderedDict[str, _JobTrail]" = OrderedDict()       # insertion = job start order
+        self._completed: "OrderedDict[str, float]" = OrderedDict()      # completion order
+        # Global emit order: parallel lists of sequence numbers and (trail, event)
+        self._seq = 0
+        self._log_seqs: List[int] = []
+        self._log: List[tuple] = []
+        self._dead = 0
+        self._lock = threading.Lock()
 
     def emit(self, event: AuditEvent):
-        self._events.append(event)
+        if self.redaction is not None:
+            self.redaction.process(event, self._record, key=event.job_id)
+        else:
+            self._record(event)
+
+    def _record(self, event: AuditEvent) -> None:
+        with self._lock:
+            trail = self._jobs.get(event.job_id)
+            if trail is None:
+                trail = self._jobs[event.job_id] = _JobTrail()
+            self._seq += 1
+            trail.append(event, self._seq)
+            self._log_seqs.append(self._seq)
+            self._log.append((trail, event))
+            self._enforce_retention()
+        if self.sink is not None:
+            self.sink.emit(event)
+
+    def get_events(self, job_id: str, since: TimeBound = None, until: TimeBound = None) -> List[AuditEvent]:
+        """Events of `job_id` in emit order; with `since`/`until`, only those in that time range."""
+        with self._lock:
+            trail = self._jobs.get(job_id)
+            if trail is None:
+                return []
+            if since is None and until is None:
+                return list(trail.events)
+            hits = trail.between(*self._bounds(since, until))
+        return [event for _, _, event in sorted(hits, key=lambda h: h[1])]
 
-    def get_events(self, job_id: str) -> List[AuditEvent]:
-        return [e for e in self._events if e.job_id == job_id]
+    def query(self, since: TimeBound = None, until: TimeBound = None,
+              job_ids: Optional[Iterable[str]] = None) -> List[AuditEvent]:
+        """Events of all (or the given) jobs within [since, until], ordered by timestamp."""
+        lo, hi = self._bounds(since, until)
+        with self._lock:
+            trails = [self._jobs[j] for j in (job_ids if job_ids is not None else self._jobs) if j in self._jobs]
+            runs = [trail.between(lo, hi) for trail in trails
+                    if trail.times and trail.times[0] <= hi and trail.times[-1] >= lo]
+        return [event for _, _, event in heapq.merge(*runs, key=lambda h: h[0])]
+
+    def page(self, after: int = 0, limit: int = 100, job_id: Optional[str] = None,
+             event_type: Optional[str] = None, since: TimeBound = None,
+             until: TimeBound = None) -> Tuple[List[AuditEvent], Optional[int]]:
+        """
+        Up to `limit` matching events emitted after sequence number `after`.
+
+        Returns the events in emit order and the cursor to pass as `after`
+        for the next page, or None once nothing further matches.
+        """
+        lo, hi = self._bounds(since, until)
+        timed = since is not None or until is not None
+        events, last = [], None
+        with self._lock:
+            if job_id is not None:
+                trail = self._jobs.get(job_id)
+                if trail is None:
+                    return [], None
+                start = bisect.bisect_right(trail.seqs, after)
+                candidates = ((trail.seqs[i], trail, trail.events[i]) for i in range(start, len(trail.seqs)))
+            else:
+                start = bisect.bisect_right(self._log_seqs, after)
+                candidates = ((self._log_seqs[i], *self._log[i]) for i in range(start, len(self._log)))
+            for seq, trail, event in candidates:
+                if self._jobs.get(event.job_id) is not trail:
+                    continue  # evicted
+                if event_type is not None and event.event_type != event_type:
+                    continue
+                if timed and not lo <= event_time(event.timestamp) <= hi:
+                    continue
+                if len(events) == limit:
+                    return events, last
+                events.append(event)
+                last = seq
+        return events, None
+
+    def mark_completed(self, job_id: str) -> None:
+        """Flag a job as finished, making it the first candidate for eviction."""
+        if self.redaction is not None:
+            # Queued behind the job's events, which may still be in redaction
+            self.redaction.submit(lambda: self._mark_completed(job_id), key=job_id)
+        else:
+            self._mark_completed(job_id)
+
+    def _mark_completed(self, job_id: str) -> None:
+        with self._lock:
+            trail = self._jobs.get(job_id)
+            if trail is not None and trail.completed_at is None:
+                trail.completed_at = time.monotonic()
+                self._completed[job_id] = trail.completed_at
+                self._enforce_retention()
+        mark = getattr(self.sink, "mark_completed", None)
+        if mark is not None:
+            mark(job_id)
+
+    def job_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._jobs)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(trail.events) for trail in self._jobs.values())
 
     def emit_event_with_artifact(self, agent, artifact_ref):
         # Minimal event with agent and artifact linkage
-        event = type('AuditEventWithArtifact', (object,), {})()
-        event.event_type = "AGENT_OUTPUT"
-        event.job_id = getattr(agent, 'job_id', 'job-1')
-        event.node_id = getattr(agent, 'name', 'unknown')
-        event.timestamp = "2026-01-31T00:00:00Z"
-        event.status = "output"
-        event.artifact_ref = artifact_ref
-        event.agent_name = getattr(agent, 'name', None)
-        event.agent_version = getattr(agent, 'version', None)
-        self._events.append(event)
+        event = AgentOutputEvent(
+            event_type="AGENT_OUTPUT",
+            job_id=getattr(agent, 'job_id', 'job-1'),
+            node_id=getattr(agent, 'name', 'unknown'),
+            timestamp=utc_timestamp(),
+            status="output",
+            artifact_ref=artifact_ref,
+            agent_name=getattr(agent, 'name', None),
+            agent_version=getattr(agent, 'version', None)
+        )
+        self.emit(event)
         return event
+
+    @staticmethod
+    def _bounds(since: TimeBound, until: TimeBound) -> tuple:
+        return (float("-inf") if since is None else event_time(since),
+                float("inf") if until is None else event_time(until))
+
+    def _enforce_retention(self) -> None:
+        if self.completed_ttl is not None:
+            cutoff = time.monotonic() - self.completed_ttl
+            while self._completed and next(iter(self._completed.values())) < cutoff:
+                self._drop(next(iter(self._completed)))
+        if self.max_jobs is None:
+            return
+        while len(self._jobs) > self.max_jobs and self._completed:
+            self._drop(next(iter(self._completed)))
+        while len(self._jobs) > self.max_jobs:
+            job_id = next(iter(self._jobs))
+            logger.warning(f"Audit log full; evicting events of running job {job_id}")
+            self._drop(job_id)
+
+    def _drop(self, job_id: str) -> None:
+        trail = self._jobs.pop(job_id, None)
+        self._completed.pop(job_id, None)
+        if trail is None:
+            return
+        self._dead += len(trail.events)
+        if self._dead * 2 > len(self._log):
+            live = [(seq, entry) for seq, entry in zip(self._log_seqs, self._log)
+                    if self._jobs.get(entry[1].job_id) is entry[0]]
+            self._log_seqs = [seq for seq, _ in live]
+            self._log = [entry for _, entry in live]
+            self._dead = 0
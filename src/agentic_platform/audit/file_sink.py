@@ -0,0 +1,261 @@
+"""
+Durable, append-only audit sink.
+
+Events are written as JSON lines to numbered segment files
+(`audit-000001.jsonl`, ...) by a single background writer thread, so
+`emit()` is just a queue put and never waits on disk. The writer drains
+everything that queued up while the previous write was in progress and
+commits it with one write() and one fsync() (group commit): under load
+batches grow and fsyncs per event fall, and when idle each event is
+synced almost immediately. A segment is closed and a new one started once
+it reaches `segment_bytes`.
+
+Reads memory-map each segment and only see complete lines, so they are
+safe while the writer appends and after a crash mid-write. A torn final
+line (crash or failed write mid-batch) is cut off before the writer
+appends again, so the next event never lands on the same line as it.
+"""
+
+import atexit
+import json
+import logging
+import mmap
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from agentic_platform.core.tenancy import TenantRegistry
+from .audit_log import event_record
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PREFIX = "audit-"
+SEGMENT_SUFFIX = ".jsonl"
+
+_STOP = object()
+
+
+def _complete_length(path: Path, chunk: int = 64 * 1024) -> int:
+    """Length of `path` up to and including its last newline (0 if none)."""
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(0, end - chunk)
+            f.seek(start)
+            pos = f.read(end - start).rfind(b"\n")
+            if pos >= 0:
+                return start + pos + 1
+            end = start
+    return 0
+
+
+class FileAuditSink:
+    """
+    Append-only JSONL audit sink with a batching writer thread.
+
+    Args:
+        directory: Where segment files are written
+        segment_bytes: Size at which a segment is rotated
+        max_batch: Events committed per write/fsync at most
+        fsync: Whether each batch is fsync'ed (disable only for tests/benchmarks)
+    """
+
+    def __init__(self, directory, segment_bytes: int = 64 * 1024 * 1024,
+                 max_batch: int = 4096, fsync: bool = True):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.max_batch = max_batch
+        self.fsync = fsync
+        self.written = 0
+        self.batches = 0
+        self.failed = 0
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._closed = False
+
+        segments = self.segments()
+        self._segment_no = int(segments[-1].name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]) if segments else 1
+        self._file = open(self._segment_path(self._segment_no), "ab")
+        self._size = self._file.tell()
+        complete = _complete_length(self._segment_path(self._segment_no)) if self._size else 0
+        if complete < self._size:
+            logger.warning(f"Discarding {self._size - complete} bytes of a torn audit record "
+                           f"in {self._segment_path(self._segment_no).name}")
+            self._file.truncate(complete)
+            self._size = complete
+
+        self._writer = threading.Thread(target=self._run, name=f"audit-writer-{self.directory.name}", daemon=True)
+        self._writer.start()
+
+    def emit(self, event) -> None:
+        """Queue an event for durable storage; returns immediately."""
+        if self._closed:
+            raise RuntimeError("Audit sink is closed")
+        self._queue.put(event)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every event emitted so far is on disk; False on timeout."""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        """Commit pending events and stop the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._file.close()
+
+    def segments(self) -> List[Path]:
+        return sorted(self.directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"))
+
+    def iter_records(self, job_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield stored events (as dicts) in write order, optionally only those of `job_id`."""
+        # Cheap byte-level pre-filter before parsing; matches the compact encoding used by _encode
+        needle = b'"job_id":' + json.dumps(job_id).encode() if job_id is not None else None
+        for path in self.segments():
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    continue
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    pos = 0
+                    while True:
+                        end = mm.find(b"\n", pos)
+                        if end < 0:
+                            break  # no line, or a torn final write
+                        line = mm[pos:end]
+                        pos = end + 1
+                        if needle is not None and needle not in line:
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            logger.warning(f"Skipping corrupt audit record in {path.name}")
+                            continue
+                        if job_id is None or record.get("job_id") == job_id:
+                            yield record
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / f"{SEGMENT_PREFIX}{number:06d}{SEGMENT_SUFFIX}"
+
+    @staticmethod
+    def _encode(event) -> bytes:
+        return json.dumps(event_record(event), separators=(",", ":"), default=str).encode() + b"\n"
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, waiters = [], []
+            item = self._queue.get()
+            while True:
+                if item is _STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._commit(batch)
+            for waiter in waiters:
+                waiter.set()
+
+    def _commit(self, batch: list) -> None:
+        lines = []
+        for event in batch:
+            try:
+                lines.append(self._encode(event))
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Could not serialize audit event {event!r}: {e}")
+        written = self.written
+        try:
+            # Split the batch at segment boundaries; each part is one write + fsync
+            start, size = 0, self._size
+            for i, line in enumerate(lines):
+                if size and size + len(line) > self.segment_bytes:
+                    self._write(lines[start:i])
+                    self._rotate()
+                    start, size = i, 0
+                size += len(line)
+            self._write(lines[start:])
+            self.batches += 1
+        except OSError as e:
+            lost = len(lines) - (self.written - written)
+            self.failed += lost
+            logger.error(f"Failed to persist {lost} audit events to {self.directory}: {e}")
+
+    def _write(self, lines: List[bytes]) -> None:
+        if not lines:
+            return
+        data = b"".join(lines)
+        try:
+            self._file.write(data)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+        except OSError:
+            self._discard_partial_write()
+            raise
+        self._size += len(data)
+        self.written += len(lines)
+
+    def _discard_partial_write(self) -> None:
+        """Cut the segment back to its last committed size after a failed write."""
+        try:
+            self._file.close()  # may retry the buffered bytes; they are cut off below
+        except OSError:
+            pass
+        try:
+            self._file = open(self._segment_path(self._segment_no), "ab")
+            self._file.truncate(self._size)
+        except OSError as e:
+            logger.error(f"Could not truncate {self._segment_path(self._segment_no).name} "
+                         f"after a failed write: {e}")
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._segment_no += 1
+        self._file = open(self._segment_path(self._segment_no), "ab")
+        self._size = 0
+
+
+_tenant_sinks: Dict[str, FileAuditSink] = {}
+_tenant_sinks_lock = threading.Lock()
+
+
+def tenant_audit_sink(tenant_id: str) -> Optional[FileAuditSink]:
+    """The durable sink of a tenant with `compliance_logging` enabled, else None."""
+    config = TenantRegistry.get_config(tenant_id)
+    if not config.features.get("compliance_logging"):
+        return None
+    with _tenant_sinks_lock:
+        sink = _tenant_sinks.get(config.tenant_id)
+        if sink is None:
+            directory = os.path.join(os.getenv("AUDIT_LOG_DIR", "audit_logs"), config.tenant_id)
+            sink = _tenant_sinks[config.tenant_id] = FileAuditSink(
+                directory,
+                segment_bytes=int(os.getenv("AUDIT_SEGMENT_BYTES", str(64 * 1024 * 1024)))
+            )
+        return sink
+
+
+def close_audit_sinks() -> None:
+    """Commit and close every tenant sink (called at shutdown)."""
+    with _tenant_sinks_lock:
+        sinks = list(_tenant_sinks.values())
+        _tenant_sinks.clear()
+    for sink in sinks:
+        sink.close()
+
+
+atexit.register(close_audit_sinks)
@@ -0,0 +1,140 @@
+"""
+PII redaction stage in front of audit and result stores.
+
+Tenants opt in with `features["pii_redaction"]`:
+
+- "async" (or True): values are queued and redacted by a small worker pool,
+  then handed to their store; the request path only enqueues. Work is
+  sharded by key (the job id), so one job's events keep their order.
+- "sync": redaction runs inline before the value is stored, for tenants
+  that must never have unredacted data sit in a queue.
+
+A value that fails to redact is dropped and logged, never stored as-is.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import zlib
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from agentic_platform.core.tenancy import TenantRegistry
+from agentic_platform.tools.pii_redactor import PiiRedactor
+
+logger = logging.getLogger(__name__)
+
+ASYNC = "async"
+SYNC = "sync"
+
+_STOP = object()
+
+
+class RedactionStage:
+    """
+    Redacts values with a PiiRedactor before delivering them to a store.
+
+    Args:
+        redactor: Redactor to apply (default: PiiRedactor())
+        mode: ASYNC (worker pool) or SYNC (inline)
+        workers: Worker threads in async mode
+    """
+
+    def __init__(self, redactor: Optional[PiiRedactor] = None, mode: str = ASYNC, workers: int = 2):
+        if mode not in (ASYNC, SYNC):
+            raise ValueError(f"Unknown redaction mode: {mode!r} (expected 'async' or 'sync')")
+        self.redactor = redactor or PiiRedactor()
+        self.mode = mode
+        self.failed = 0
+        self._queues: List["queue.SimpleQueue"] = []
+        self._threads: List[threading.Thread] = []
+        if mode == ASYNC:
+            for i in range(max(workers, 1)):
+                q: "queue.SimpleQueue" = queue.SimpleQueue()
+                thread = threading.Thread(target=self._work, args=(q,), name=f"pii-redaction-{i}", daemon=True)
+                thread.start()
+                self._queues.append(q)
+                self._threads.append(thread)
+
+    def redact(self, value: Any) -> Any:
+        """Redact `value` now, in the calling thread."""
+        return self.redactor.redact_value(value)
+
+    def process(self, value: Any, deliver: Callable[[Any], None], key: Hashable = None) -> None:
+        """Redact `value` and pass the result to `deliver`, in order with other work on `key`."""
+        self.submit(lambda: deliver(self.redact(value)), key)
+
+    def submit(self, task: Callable[[], None], key: Hashable = None) -> None:
+        """Run `task` after everything already submitted for `key`."""
+        if self.mode == SYNC or not self._queues:  # closed stages run inline
+            self._run(task)
+        else:
+            self._queues[zlib.crc32(repr(key).encode()) % len(self._queues)].put(task)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything submitted so far has been delivered; False on timeout."""
+        done = []
+        for q in self._queues:
+            event = threading.Event()
+            q.put(event)
+            done.append(event)
+        return all(event.wait(timeout) for event in done)
+
+    def close(self) -> None:
+        """Finish queued work and stop the workers."""
+        for q in self._queues:
+            q.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._queues, self._threads = [], []
+
+    def _work(self, q: "queue.SimpleQueue") -> None:
+        while True:
+            task = q.get()
+            if task is _STOP:
+                return
+            if isinstance(task, threading.Event):
+                task.set()
+            else:
+                self._run(task)
+
+    def _run(self, task: Callable[[], None]) -> None:
+        try:
+            task()
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"PII redaction stage dropped a value: {e}", exc_info=True)
+
+
+_tenant_stages: Dict[str, RedactionStage] = {}
+_tenant_stages_lock = threading.Lock()
+
+
+def tenant_redaction_stage(tenant_id: str) -> Optional[RedactionStage]:
+    """The redaction stage of a tenant with `pii_redaction` enabled, else None."""
+    config = TenantRegistry.get_config(tenant_id)
+    mode = config.features.get("pii_redaction")
+    if not mode:
+        return None
+    mode = ASYNC if mode is True else mode
+    with _tenant_stages_lock:
+        stage = _tenant_stages.get(config.tenant_id)
+        if stage is None:
+            stage = _tenant_stages[config.tenant_id] = RedactionStage(
+                mode=mode,
+                workers=int(os.getenv("PII_REDACTION_WORKERS", "2"))
+            )
+        return stage
+
+
+def close_redaction_stages() -> None:
+    """Drain and stop every tenant stage (before the audit sinks are closed)."""
+    with _tenant_stages_lock:
+        stages = list(_tenant_stages.values())
+        _tenant_stages.clear()
+    for stage in stages:
+        stage.close()
+
+
+atexit.register(close_redaction_stages)
@@ -0,0 +1,38 @@
+"""
+Process-wide, per-tenant audit logs.
+
+Requests of a tenant emit into that tenant's shared InMemoryAuditLog, so
+events stay queryable after the request that produced them returns
+(GET /audit/events). Retention is bounded by AUDIT_MAX_JOBS and
+AUDIT_RETENTION_SECONDS. Compliance tenants' logs also forward to their
+durable FileAuditSink, and tenants with `pii_redaction` get events
+redacted before either stores them.
+"""
+
+import os
+import threading
+from typing import Dict
+
+from agentic_platform.core.tenancy import TenantRegistry
+from .audit_log import InMemoryAuditLog
+from .file_sink import tenant_audit_sink
+# Imported after file_sink so its atexit hook drains redaction before the sinks close
+from .redaction import tenant_redaction_stage
+
+_tenant_logs: Dict[str, InMemoryAuditLog] = {}
+_tenant_logs_lock = threading.Lock()
+
+
+def tenant_audit_log(tenant_id: str) -> InMemoryAuditLog:
+    """The shared audit log of a tenant (unknown tenants resolve to the default one)."""
+    tenant_id = TenantRegistry.get_config(tenant_id).tenant_id
+    with _tenant_logs_lock:
+        log = _tenant_logs.get(tenant_id)
+        if log is None:
+            log = _tenant_logs[tenant_id] = InMemoryAuditLog(
+                max_jobs=int(os.getenv("AUDIT_MAX_JOBS", "10000")),
+                completed_ttl=float(os.getenv("AUDIT_RETENTION_SECONDS", "86400")),
+                sink=tenant_audit_sink(tenant_id),
+                redaction=tenant_redaction_stage(tenant_id)
+            )
+        return log
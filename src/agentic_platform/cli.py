@@ -2,7 +2,7 @@ import argparse
 import json
 import yaml
 from agentic_platform.workflow import engine
-from agentic_platform.audit.audit_log import InMemoryAuditLog
+from agentic_platform.audit.audit_log import InMemoryAuditLog, event_record
 
 from agentic_platform.adapters.mcp_adapter import MCPAdapter
 from agentic_platform.adapters.langgraph_adapter import LangGraphAdapter
@@ -33,7 +33,7 @@ def main():
         print(json.dumps(tr, indent=2))
     print("\nAudit log:")
     for event in audit_log.get_events("job-1"):
-        print(vars(event))
+        print(event_record(event))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,54 @@
+"""
+In-memory blob references for passing binary payloads through workflows.
+
+Workflow inputs are JSON and tool arguments are validated against JSON
+schemas, so binary uploads cannot be passed directly. Instead the API
+registers the bytes here and hands the workflow a `mem://` reference string,
+which tools resolve back to bytes without touching the filesystem.
+"""
+
+import threading
+import uuid
+from typing import Dict, Tuple
+
+MEM_SCHEME = "mem://"
+
+
+class InMemoryBlobStore:
+    """Thread-safe map of `mem://` references to (bytes, filename)."""
+
+    def __init__(self):
+        self._blobs: Dict[str, Tuple[bytes, str]] = {}
+        self._lock = threading.Lock()
+
+    def put(self, data: bytes, filename: str = "") -> str:
+        """Register a blob and return its reference."""
+        ref = f"{MEM_SCHEME}{uuid.uuid4().hex}/{filename}"
+        with self._lock:
+            self._blobs[ref] = (data, filename)
+        return ref
+
+    def get(self, ref: str) -> Tuple[bytes, str]:
+        """Return (bytes, filename) for a reference."""
+        with self._lock:
+            blob = self._blobs.get(ref)
+        if blob is None:
+            raise KeyError(f"Blob {ref} not found")
+        return blob
+
+    def discard(self, ref: str) -> None:
+        """Release a blob; unknown references are ignored."""
+        with self._lock:
+            self._blobs.pop(ref, None)
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+
+def is_blob_ref(value) -> bool:
+    """True if `value` is a `mem://` blob reference."""
+    return isinstance(value, str) and value.startswith(MEM_SCHEME)
+
+
+# Process-wide store shared by the API and tool handlers
+blob_store = InMemoryBlobStore()
@@ -1,6 +1,6 @@
 from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 # Global context variable to hold the current tenant ID
 # This allows us to access the tenant context anywhere in the async call stack
@@ -12,7 +12,7 @@ class TenantConfig:
     tenant_id: str
     name: str
     tier: str  # e.g., 'free', 'pro', 'enterprise'
-    kb_provider: str  # 'mock' or 'enterprise'
+    kb_provider: str  # 'mock', 'enterprise', 'local' (vector), 'bm25' or 'hybrid'
     ocr_provider: str  # 'mock', 'google'
     features: Dict[str, Any]
 
@@ -44,10 +44,23 @@ class TenantRegistry:
             tier="enterprise",
             kb_provider="enterprise",
             ocr_provider="google",
-            features={"max_requests": 10000, "compliance_logging": True}
+            features={
+                "max_requests": 10000,
+                "compliance_logging": True,
+                # Redact PII from audit events and job results before they are stored
+                "pii_redaction": "async",
+                # Never share cached OCR results with other tenants
+                "ocr_cache": "isolated",
+                # Keep more resolution for scanned contracts and forms
+                "ocr_preprocessing": {"max_side": 3072, "jpeg_quality": 90}
+            }
         )
     }
 
+    @classmethod
+    def tenant_ids(cls) -> List[str]:
+        return list(cls._tenants)
+
     @classmethod
     def get_config(cls, tenant_id: str) -> TenantConfig:
         config = cls._tenants.get(tenant_id)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 @dataclass(frozen=True)
@@ -17,10 +18,25 @@ class ToolResult:
     output: Optional[Dict[str, Any]]
     error: Optional[Any]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditEvent:
     event_type: str
     job_id: str
     node_id: str
-    timestamp: str
+    timestamp: str  # wall clock, ISO-8601 UTC
     status: str
+    # time.perf_counter_ns() readings: comparable only within the emitting process,
+    # but immune to clock adjustments, so durations are computed from these
+    start_ns: Optional[int] = None
+    end_ns: Optional[int] = None
+    duration_ns: Optional[int] = None
+
+@dataclass(frozen=True, slots=True)
+class AgentOutputEvent(AuditEvent):
+    artifact_ref: Any = None
+    agent_name: Optional[str] = None
+    agent_version: Optional[str] = None
+
+def utc_timestamp() -> str:
+    """Current wall-clock time as an ISO-8601 UTC string, e.g. 2026-01-31T00:00:00.123456Z."""
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z")
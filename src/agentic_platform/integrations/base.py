@@ -1,5 +1,27 @@
+import asyncio
+import os
+import tempfile
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+
+# A batch OCR item: file path, raw bytes, or (bytes, filename)
+OCRInput = Union[str, bytes, Tuple[bytes, str]]
+
+@dataclass
+class Document:
+    """A document ingested into a knowledge base index."""
+    id: str
+    text: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass
+class SearchHit:
+    """One ranked knowledge base match."""
+    id: str
+    score: float
+    snippet: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 class KnowledgeBaseProvider(ABC):
     """Abstract base class for Knowledge Base providers."""
@@ -9,6 +31,44 @@ class KnowledgeBaseProvider(ABC):
         """Search the knowledge base for the given query."""
         pass
 
+    def search_many(self, queries: Sequence[str], k: Optional[int] = None) -> List[List[SearchHit]]:
+        """
+        Run several queries, returning ranked hits per query in order.
+
+        Providers that can batch or pipeline queries should override this;
+        the default calls search() per query and wraps each answer as a
+        single hit. That hit is not a ranked document: its id names the
+        provider and query (so fusion never merges it with another
+        provider's answer), its score is 0 and metadata["unranked"] is True.
+        """
+        return [
+            [SearchHit(id=f"{type(self).__name__}:{query}", score=0.0, snippet=self.search(query),
+                       metadata={"unranked": True})]
+            for query in queries
+        ]
+
+    async def asearch(self, query: str, k: Optional[int] = None) -> List[SearchHit]:
+        """Async single-query variant of search_many (worker thread by default)."""
+        return (await self.asearch_many([query], k))[0]
+
+    async def asearch_many(self, queries: Sequence[str], k: Optional[int] = None) -> List[List[SearchHit]]:
+        """Async variant of search_many (worker thread by default)."""
+        return await asyncio.to_thread(self.search_many, queries, k)
+
+def read_ocr_input(item: OCRInput) -> Tuple[bytes, str]:
+    """
+    Resolve a batch OCR item to (content, filename).
+
+    Raises:
+        OSError: If a file path cannot be read
+    """
+    if isinstance(item, str):
+        with open(item, "rb") as f:
+            return f.read(), os.path.basename(item)
+    if isinstance(item, bytes):
+        return item, ""
+    return item
+
 class OCRProvider(ABC):
     """Abstract base class for OCR providers."""
     
@@ -16,3 +76,56 @@ class OCRProvider(ABC):
     def ocr_image(self, image_path: str) -> Dict[str, Any]:
         """Perform OCR on the given image path."""
         pass
+
+    def ocr_bytes(self, content: bytes, filename: str = "") -> Dict[str, Any]:
+        """
+        Perform OCR on an in-memory image.
+
+        Providers that can send bytes directly should override this; the
+        default spools to a temporary file and delegates to ocr_image.
+        """
+        suffix = os.path.splitext(filename)[1] or ".jpg"
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+            tmp.write(content)
+        try:
+            return self.ocr_image(tmp.name)
+        finally:
+            os.remove(tmp.name)
+
+    async def aocr_image(self, image_path: str) -> Dict[str, Any]:
+        """
+        Async variant of ocr_image.
+
+        Providers with a native async client should override this (and
+        aocr_bytes); the default runs ocr_image on a worker thread.
+        """
+        return await asyncio.to_thread(self.ocr_image, image_path)
+
+    async def aocr_bytes(self, content: bytes, filename: str = "") -> Dict[str, Any]:
+        """Async variant of ocr_bytes (worker thread by default)."""
+        return await asyncio.to_thread(self.ocr_bytes, content, filename)
+
+    def ocr_batch(self, images: Sequence[OCRInput]) -> List[Dict[str, Any]]:
+        """
+        Perform OCR on many images, returning one result per image in order.
+
+        Providers with a batch API should override this; the default calls
+        ocr_image / ocr_bytes per item.
+        """
+        results = []
+        for item in images:
+            if isinstance(item, str):
+                results.append(self.ocr_image(item))
+            elif isinstance(item, bytes):
+                results.append(self.ocr_bytes(item))
+            else:
+                results.append(self.ocr_bytes(*item))
+        return results
+
+    def cache_options(self) -> Dict[str, Any]:
+        """
+        Settings that change this provider's output for the same image.
+
+        Used to qualify OCR cache keys (see integrations.ocr_cache).
+        """
+        return {}
@@ -1,41 +1,109 @@
+import hashlib
+import json
+import logging
 import os
-from functools import lru_cache
-from .knowledge_base import KnowledgeBaseProvider, MockKnowledgeBase, EnterpriseKnowledgeBase
+from dataclasses import asdict
+from typing import Iterable, Optional
+from .knowledge_base import KnowledgeBaseProvider, MockKnowledgeBase, EnterpriseKnowledgeBase, LocalVectorKnowledgeBase, BM25KnowledgeBase, HybridKnowledgeBase
 from .ocr import OCRProvider, MockOCR, GoogleCloudVisionOCR
-from ..core.tenancy import TenantRegistry, get_current_tenant_id
+from .ocr_cache import CachingOCRProvider, ocr_result_cache
+from .provider_cache import ProviderCache
+from ..core.tenancy import TenantConfig, TenantRegistry, get_current_tenant_id
 from ..core.trace import add_trace_step
 
-@lru_cache()
+logger = logging.getLogger(__name__)
+
+# Providers keyed by (kind, resolved tenant, config version, ...); see provider_cache
+provider_cache = ProviderCache(
+    max_entries=int(os.getenv("PROVIDER_CACHE_SIZE", "64")),
+    idle_timeout=float(os.getenv("PROVIDER_IDLE_TIMEOUT", "1800"))
+)
+
+def tenant_config_version(config: TenantConfig) -> str:
+    """Fingerprint of a tenant's configuration; changes whenever any field does."""
+    payload = json.dumps(asdict(config), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+def kb_index_dir(tenant_id: str, kind: str) -> str:
+    """Directory of a tenant's local knowledge base index ("vector" or "bm25")."""
+    return os.path.join(os.getenv("KB_INDEX_DIR", "kb_index"), tenant_id, kind)
+
 def get_knowledge_base_provider(tenant_id: str = None) -> KnowledgeBaseProvider:
     # If no tenant_id provided explicitly, resolve from context
     if tenant_id is None:
         tenant_id = get_current_tenant_id()
-        
+    # Unknown tenants resolve to the default config and share its provider
     config = TenantRegistry.get_config(tenant_id)
+    key = ("kb", config.tenant_id, tenant_config_version(config))
+    return provider_cache.get(key, lambda: _create_knowledge_base_provider(config))
+
+def _create_knowledge_base_provider(config: TenantConfig) -> KnowledgeBaseProvider:
+    tenant_id = config.tenant_id
     provider_type = config.kb_provider
-    
-    print(f"[Factory] Resolving KB for tenant '{tenant_id}' -> {provider_type}")
+
+    logger.info(f"Creating KB provider for tenant '{tenant_id}' -> {provider_type}")
     add_trace_step("Factory", f"Resolving KB Provider", f"Tenant: {tenant_id}, Type: {provider_type}")
-    
+
     if provider_type == "enterprise":
         # Pass tenant-specific connection details here in a real app
         return EnterpriseKnowledgeBase(connection_string=f"mock://{tenant_id}-vector-db")
+    elif provider_type == "local":
+        # Each tenant gets its own on-disk index
+        return LocalVectorKnowledgeBase(index_dir=kb_index_dir(tenant_id, "vector"))
+    elif provider_type == "bm25":
+        return BM25KnowledgeBase(index_dir=kb_index_dir(tenant_id, "bm25"))
+    elif provider_type == "hybrid":
+        # Keyword and vector search over the same tenant corpus, fused by rank
+        return HybridKnowledgeBase(
+            [BM25KnowledgeBase(index_dir=kb_index_dir(tenant_id, "bm25")),
+             LocalVectorKnowledgeBase(index_dir=kb_index_dir(tenant_id, "vector"))],
+            cache_ttl=float(os.getenv("KB_QUERY_CACHE_TTL", "300"))
+        )
     else:
         return MockKnowledgeBase()
 
-@lru_cache()
 def get_ocr_provider(tenant_id: str = None, credentials_json: str = None) -> OCRProvider:
+    # Resolve the tenant and its credential set *before* the cache lookup, so
+    # providers are never shared across tenants through a None key
     if tenant_id is None:
         tenant_id = get_current_tenant_id()
-
     config = TenantRegistry.get_config(tenant_id)
+    if credentials_json:
+        # Per-call credentials (e.g. uploaded to /run-ocr/ as a fresh temp file
+        # each request) bypass the shared cache: they would take a slot per
+        # request and push out other tenants' warm providers. Building one is
+        # cheap, since the Vision client itself comes from the client pool.
+        return _create_ocr_provider(config, credentials_json)
+    credentials_json = config.features.get("ocr_credentials")
+    key = ("ocr", config.tenant_id, tenant_config_version(config), credentials_json or None)
+    return provider_cache.get(key, lambda: _create_ocr_provider(config, credentials_json or None))
+
+def _create_ocr_provider(config: TenantConfig, credentials_json: Optional[str]) -> OCRProvider:
+    tenant_id = config.tenant_id
     provider_type = config.ocr_provider
 
-    print(f"[Factory] Resolving OCR for tenant '{tenant_id}' -> {provider_type}")
+    logger.info(f"Creating OCR provider for tenant '{tenant_id}' -> {provider_type}")
     add_trace_step("Factory", f"Resolving OCR Provider", f"Tenant: {tenant_id}, Type: {provider_type}")
-    
+
     if provider_type == "mock":
-        return MockOCR()
+        return MockOCR(latency=float(os.getenv("MOCK_OCR_LATENCY", "0")))
     else:
-        # Enterprise usage
-        return GoogleCloudVisionOCR(credentials_json)
+        # Enterprise usage; the Vision client itself comes from the shared pool
+        provider = GoogleCloudVisionOCR(credentials_json)
+        # Repeat images are served from the content-hash cache instead of the API
+        if ocr_result_cache is not None:
+            provider = CachingOCRProvider(provider, ocr_result_cache)
+        return provider
+
+def warm_up_providers(tenant_ids: Optional[Iterable[str]] = None) -> None:
+    """Build the providers of the given tenants (default: all registered) ahead of traffic."""
+    for tenant_id in tenant_ids if tenant_ids is not None else TenantRegistry.tenant_ids():
+        try:
+            get_knowledge_base_provider(tenant_id)
+            get_ocr_provider(tenant_id)
+        except Exception as e:
+            logger.warning(f"Provider warm-up failed for tenant '{tenant_id}': {e}")
+
+# Kept for callers that reset the provider cache (e.g. verification scripts)
+get_knowledge_base_provider.cache_clear = provider_cache.clear
+get_ocr_provider.cache_clear = provider_cache.clear
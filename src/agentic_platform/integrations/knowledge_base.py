@@ -1,50 +1,425 @@
+import asyncio
+import logging
+import queue
+import re
+import threading
 import time
-from typing import Dict, Any
-from .base import KnowledgeBaseProvider
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
+from .base import Document, KnowledgeBaseProvider, SearchHit
+from ..core.tenancy import get_current_tenant_id
+from .lexical_index import BM25Index, tokenize
+from .vector_index import DocumentVectorStore, HashingEmbedder
+
+logger = logging.getLogger(__name__)
+
+SNIPPET_CHARS = 200
+
+
+def format_hits(query: str, hits: Sequence[SearchHit]) -> str:
+    """Render hits as the text returned by search()."""
+    if not hits:
+        return f"No documents found for '{query}'."
+    lines = [f"Top Matches for '{query}':", ""]
+    for rank, hit in enumerate(hits, 1):
+        lines.append(f"{rank}. [{hit.id}] {hit.metadata.get('title', hit.id)} (Score: {hit.score:.2f})")
+        lines.append(f"   > {hit.snippet}")
+    return "\n".join(lines)
+
+# Simulated corpus of MockKnowledgeBase: topic keyword -> (id, title, snippet), best match first
+_MOCK_ARTICLES = {
+    "neural network": [
+        ("ML-101", "Neural Networks 101", "Neural networks are computing systems inspired by biological brains..."),
+        ("ML-102", "Deep Learning Basics", "Deep learning stacks many layers of neurons to learn representations..."),
+        ("ML-103", "Backpropagation Explained", "Backpropagation computes gradients layer by layer..."),
+    ],
+    "transformer": [
+        ("NLP-201", "Attention Is All You Need", "Transformers use self-attention to process sequential data in parallel..."),
+        ("NLP-202", "BERT Architecture", "BERT pre-trains a bidirectional transformer encoder..."),
+        ("NLP-203", "GPT Models", "GPT models are decoder-only transformers trained to predict the next token..."),
+    ],
+    "langgraph": [
+        ("DOCS-LANGGRAPH", "LangGraph Documentation",
+         "LangGraph is a library for building stateful, multi-agent applications with LLMs..."),
+    ],
+}
 
 class MockKnowledgeBase(KnowledgeBaseProvider):
     """
     In-memory simulated knowledge base for development and testing.
     Fast, deterministic, and requires no external dependencies.
     """
+    def search_many(self, queries: Sequence[str], k: Optional[int] = None) -> List[List[SearchHit]]:
+        results = [self._hits(query) for query in queries]
+        return [hits[:k] for hits in results] if k else results
+
     def search(self, query: str) -> str:
-        query = query.lower()
-        if "neural network" in query:
-            return "Found 5 articles: 'Neural Networks 101', 'Deep Learning Basics', 'Backpropagation Explained'. Summary: Neural networks are computing systems inspired by biological brains..."
-        elif "transformer" in query:
-            return "Found 3 articles: 'Attention Is All You Need', 'BERT Architecture', 'GPT Models'. Summary: Transformers use self-attention to process sequential data in parallel..."
-        elif "langgraph" in query:
-            return "Found documentation: LangGraph is a library for building stateful, multi-agent applications with LLMs..."
-        else:
-            return f"Found 2 general articles about '{query}'. They discuss basic concepts and history."
+        hits = self._hits(query)
+        titles = ", ".join(f"'{hit.metadata['title']}'" for hit in hits)
+        noun = "article" if len(hits) == 1 else "articles"
+        return f"Found {len(hits)} {noun}: {titles}. Summary: {hits[0].snippet}"
+
+    def _hits(self, query: str) -> List[SearchHit]:
+        lowered = query.lower()
+        articles = next((a for topic, a in _MOCK_ARTICLES.items() if topic in lowered), None)
+        if articles is None:
+            key = normalize_query(query)
+            articles = [
+                (f"GEN-{key}-1", f"Introduction to {query}", f"Basic concepts of '{query}'..."),
+                (f"GEN-{key}-2", f"History of {query}", f"How '{query}' developed over time..."),
+            ]
+        return [SearchHit(doc_id, round(0.9 - 0.1 * rank, 2), snippet, {"title": title})
+                for rank, (doc_id, title, snippet) in enumerate(articles)]
+
+class _EnterpriseConnection:
+    """A simulated connection to the enterprise vector store."""
+    def __init__(self, connection_string: str, latency: float):
+        self.connection_string = connection_string
+        self.latency = latency
+        self.round_trips = 0
+        self._lock = threading.Lock()
+
+    def query(self, queries: Sequence[str]) -> List[List[SearchHit]]:
+        """One round trip carrying every query (requests are pipelined)."""
+        time.sleep(self.latency)
+        self._count_round_trip()
+        return [_enterprise_hits(q) for q in queries]
+
+    async def aquery(self, queries: Sequence[str]) -> List[List[SearchHit]]:
+        await asyncio.sleep(self.latency)
+        self._count_round_trip()
+        return [_enterprise_hits(q) for q in queries]
+
+    def _count_round_trip(self) -> None:
+        with self._lock:
+            self.round_trips += 1
+
+def _enterprise_hits(query: str) -> List[SearchHit]:
+    return [
+        SearchHit("DOC-8821", 0.92, f"...regarding '{query}', the system employs a distributed consistency model...",
+                  {"title": "Internal Architecture Guide v2.pdf"}),
+        SearchHit("WIKI-192", 0.88, f"...best practices for implementing '{query}' in our stack include using the shared library...",
+                  {"title": "Engineering Onboarding"}),
+        SearchHit("JIRA-4420", 0.75, f"...legacy support for '{query}' will be removed in Q4...",
+                  {"title": "Deprecation Notice"}),
+    ]
 
 class EnterpriseKnowledgeBase(KnowledgeBaseProvider):
     """
     Simulated Enterprise Vector Store integration.
     Mimics the behavior of a production-grade system (e.g., Pinecone, Weaviate, Elasticsearch)
     including connection latency, structured metadata, and access control checks.
+
+    Connections come from a fixed-size pool; search_many() sends all of its
+    queries over one connection in a single round trip.
     """
-    def __init__(self, connection_string: str = "mock://enterprise-vector-db"):
+    def __init__(self, connection_string: str = "mock://enterprise-vector-db", pool_size: int = 4,
+                 latency: float = 0.2):
         self.connection_string = connection_string
         # Simulate connection pool initialization
-        print(f"[EnterpriseKB] Initializing connection pool to {connection_string}...")
-        
+        logger.info(f"[EnterpriseKB] Initializing connection pool to {connection_string}...")
+        self._pool: "queue.Queue[_EnterpriseConnection]" = queue.Queue()
+        for _ in range(pool_size):
+            self._pool.put(_EnterpriseConnection(connection_string, latency))
+
+    @contextmanager
+    def _connection(self):
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def search_many(self, queries: Sequence[str], k: Optional[int] = None) -> List[List[SearchHit]]:
+        with self._connection() as conn:
+            results = conn.query(queries)
+        return [hits[:k] for hits in results] if k else results
+
+    async def asearch_many(self, queries: Sequence[str], k: Optional[int] = None) -> List[List[SearchHit]]:
+        # Waiting for a free connection must not block the event loop
+        conn = await asyncio.to_thread(self._pool.get)
+        try:
+            results = await conn.aquery(queries)
+        finally:
+            self._pool.put(conn)
+        return [hits[:k] for hits in results] if k else results
+
     def search(self, query: str) -> str:
-        # Simulate network latency (e.g., 200ms)
-        time.sleep(0.2)
-        
+        hits = self.search_many([query])[0]
+
         # Simulate a structured enterprise response
-        return (
-            f"--- ENTERPRISE SEARCH RESULT ---\n"
-            f"Source: Corporate Knowledge Vector Store (Shard US-East-1)\n"
-            f"Query Latency: 215ms\n"
-            f"Access Control: Verified (User: agent-service-account)\n"
-            f"--------------------------------\n"
-            f"Top Matches for '{query}':\n\n"
-            f"1. [DOC-8821] Internal Architecture Guide v2.pdf (Score: 0.92)\n"
-            f"   > ...regarding '{query}', the system employs a distributed consistency model...\n\n"
-            f"2. [WIKI-192] Engineering Onboarding (Score: 0.88)\n"
-            f"   > ...best practices for implementing '{query}' in our stack include using the shared library...\n\n"
-            f"3. [JIRA-4420] Deprecation Notice (Score: 0.75)\n"
-            f"   > ...legacy support for '{query}' will be removed in Q4..."
-        )
+        lines = [
+            "--- ENTERPRISE SEARCH RESULT ---",
+            "Source: Corporate Knowledge Vector Store (Shard US-East-1)",
+            "Query Latency: 215ms",
+            "Access Control: Verified (User: agent-service-account)",
+            "--------------------------------",
+            f"Top Matches for '{query}':",
+        ]
+        for rank, hit in enumerate(hits, 1):
+            lines.append("")
+            lines.append(f"{rank}. [{hit.id}] {hit.metadata['title']} (Score: {hit.score:.2f})")
+            lines.append(f"   > {hit.snippet}")
+        return "\n".join(lines)
+
+class LocalVectorKnowledgeBase(KnowledgeBaseProvider):
+    """
+    In-process vector search over documents ingested for one tenant.
+
+    Retrieval is a NumPy matrix product over hashed embeddings (see
+    vector_index), so it runs offline with no external service. Once the
+    corpus reaches `ivf_threshold` documents an IVF partition is built and
+    queries only scan the nearest lists.
+
+    Args:
+        index_dir: Directory the index persists to (None for memory only)
+        embedder: Text embedder (defaults to HashingEmbedder())
+        top_k: Matches returned by search()
+        ivf_threshold: Corpus size at which IVF partitioning kicks in
+        nprobe: IVF lists scanned per query
+    """
+    def __init__(
+        self,
+        index_dir: Optional[Path] = None,
+        embedder: Optional[HashingEmbedder] = None,
+        top_k: int = 3,
+        ivf_threshold: int = 50_000,
+        nprobe: int = 8,
+    ):
+        self.store = DocumentVectorStore(index_dir, embedder, nprobe=nprobe)
+        self.top_k = top_k
+        self.ivf_threshold = ivf_threshold
+        self._lock = threading.Lock()
+
+    def ingest(self, documents: Iterable[Document], batch_size: int = 1024) -> int:
+        """Embed and index documents (replacing any with the same id), then persist."""
+        count = 0
+        batch: List[Document] = []
+        with self._lock:
+            for doc in documents:
+                batch.append(doc)
+                if len(batch) >= batch_size:
+                    self.store.add(batch)
+                    count += len(batch)
+                    batch = []
+            self.store.add(batch)
+            count += len(batch)
+
+            index = self.store.index
+            # Repartition once a tenth of the rows are outside the partition
+            if len(self.store) >= self.ivf_threshold and index.unpartitioned > index.size // 10:
+                index.build_ivf()
+            self.store.save()
+        logger.info(f"Ingested {count} documents ({len(self.store)} indexed)")
+        return count
+
+    def search_many(self, queries: Sequence[str], k: Optional[int] = None) -> List[List[SearchHit]]:
+        """Top-k hits for each query, scored in one batch."""
+        with self._lock:
+            matches = self.store.query(queries, k or self.top_k)
+        return [
+            [SearchHit(doc.id, score, doc.text[:SNIPPET_CHARS], doc.metadata) for doc, score in hits]
+            for hits in matches
+        ]
+
+    def search(self, query: str) -> str:
+        return format_hits(query, self.search_many([query])[0])
+
+class BM25KnowledgeBase(KnowledgeBaseProvider):
+    """
+    Keyword search over an inverted index with BM25 ranking.
+
+    Suited to exact-term lookups (ticket IDs, error codes, product names)
+    that embeddings blur. Documents can be added, replaced and removed
+    incrementally; see lexical_index for the segment layout.
+
+    Args:
+        index_dir: Directory the segments persist to (None for memory only)
+        top_k: Matches returned by search()
+    """
+    def __init__(self, index_dir: Optional[Path] = None, top_k: int = 3, **index_options: Any):
+        self.index = BM25Index(index_dir, **index_options)
+        self.top_k = top_k
+        self._lock = threading.Lock()
+
+    def ingest(self, documents: Iterable[Document]) -> int:
+        """Index documents (replacing any with the same id), then persist."""
+        with self._lock:
+            count = self.index.add(documents)
+            self.index.save()
+        logger.info(f"Ingested {count} documents ({len(self.index)} indexed)")
+        return count
+
+    def remove(self, ids: Iterable[str]) -> int:
+        with self._lock:
+            removed = self.index.remove(ids)
+            self.index.save()
+        return removed
+
+    def search_many(self, queries: Sequence[str], k: Optional[int] = None) -> List[List[SearchHit]]:
+        with self._lock:
+            matches = [self.index.search(query, k or self.top_k) for query in queries]
+        return [
+            [SearchHit(doc.id, score, _keyword_snippet(doc.text, query), doc.metadata) for doc, score in hits]
+            for query, hits in zip(queries, matches)
+        ]
+
+    def search(self, query: str) -> str:
+        return format_hits(query, self.search_many([query])[0])
+
+def _keyword_snippet(text: str, query: str) -> str:
+    """A window of `text` around the first query term it contains."""
+    lowered = text.lower()
+    positions = [p for p in (lowered.find(term) for term in tokenize(query)) if p >= 0]
+    start = max(0, min(positions) - SNIPPET_CHARS // 4) if positions else 0
+    snippet = text[start:start + SNIPPET_CHARS]
+    return f"...{snippet}" if start else snippet
+
+
+# Shared by every HybridKnowledgeBase, so evicting a provider never strands a query
+_fanout_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="kb-fanout")
+
+_QUERY_TOKEN_RE = re.compile(r"\w+")
+
+def normalize_query(query: str) -> str:
+    """Case, punctuation and spacing variants of a query map to one cache key."""
+    return " ".join(_QUERY_TOKEN_RE.findall(query.lower()))
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[SearchHit]], k: int, rrf_k: int = 60) -> List[SearchHit]:
+    """
+    Fuse ranked lists: each document scores sum(1 / (rrf_k + rank)).
+
+    Only ranks are used, so backends with incomparable score scales (BM25
+    vs cosine) combine cleanly. The first backend's hit supplies the snippet.
+    """
+    scores: Dict[str, float] = {}
+    best: Dict[str, SearchHit] = {}
+    for hits in rankings:
+        for rank, hit in enumerate(hits, 1):
+            scores[hit.id] = scores.get(hit.id, 0.0) + 1.0 / (rrf_k + rank)
+            best.setdefault(hit.id, hit)
+    ranked = sorted(scores, key=scores.get, reverse=True)[:k]
+    return [SearchHit(doc_id, scores[doc_id], best[doc_id].snippet, best[doc_id].metadata) for doc_id in ranked]
+
+class HybridKnowledgeBase(KnowledgeBaseProvider):
+    """
+    Queries several backends concurrently and fuses their rankings with
+    reciprocal-rank fusion.
+
+    Fused results are cached per (tenant, normalized query, k) for
+    `cache_ttl` seconds, since agents repeat near-identical searches across
+    iterations. A failing backend is logged and left out of the fusion.
+
+    Args:
+        backends: Providers to query (e.g. BM25 and vector)
+        top_k: Matches returned by search()
+        fetch_k: Candidates requested from each backend before fusion
+        rrf_k: RRF damping constant
+        cache_ttl: Seconds a fused result stays cached (0 disables)
+        cache_size: Fused results kept at most
+    """
+    def __init__(self, backends: Sequence[KnowledgeBaseProvider], top_k: int = 3, fetch_k: int = 10,
+                 rrf_k: int = 60, cache_ttl: float = 300.0, cache_size: int = 1024):
+        self.backends = list(backends)
+        self.top_k = top_k
+        self.fetch_k = fetch_k
+        self.rrf_k = rrf_k
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str, int], Tuple[float, List[SearchHit]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def ingest(self, documents: Iterable[Document]) -> int:
+        """Ingest into every backend that supports it and drop cached results."""
+        documents = list(documents)
+        for backend in self.backends:
+            if hasattr(backend, "ingest"):
+                backend.ingest(documents)
+        self.clear_cache()
+        return len(documents)
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def search(self, query: str) -> str:
+        return format_hits(query, self.search_many([query])[0])
+
+    def search_many(self, queries: Sequence[str], k: Optional[int] = None) -> List[List[SearchHit]]:
+        k = k or self.top_k
+        results, misses = self._cached(queries, k)
+        if misses:
+            futures = [_fanout_executor.submit(b.search_many, misses, max(k, self.fetch_k)) for b in self.backends]
+            rankings = []
+            for backend, future in zip(self.backends, futures):
+                try:
+                    rankings.append(future.result())
+                except Exception as e:
+                    logger.warning(f"Hybrid KB backend {type(backend).__name__} failed: {e}")
+            self._fuse(queries, misses, rankings, k, results)
+        return results
+
+    async def asearch_many(self, queries: Sequence[str], k: Optional[int] = None) -> List[List[SearchHit]]:
+        k = k or self.top_k
+        results, misses = self._cached(queries, k)
+        if misses:
+            outcomes = await asyncio.gather(
+                *(b.asearch_many(misses, max(k, self.fetch_k)) for b in self.backends), return_exceptions=True
+            )
+            rankings = []
+            for backend, outcome in zip(self.backends, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.warning(f"Hybrid KB backend {type(backend).__name__} failed: {outcome}")
+                else:
+                    rankings.append(outcome)
+            self._fuse(queries, misses, rankings, k, results)
+        return results
+
+    def _cached(self, queries: Sequence[str], k: int) -> Tuple[List[Optional[List[SearchHit]]], List[str]]:
+        """Cached results per query (None on a miss) and the distinct queries to run."""
+        tenant_id = get_current_tenant_id()
+        now = time.monotonic()
+        results: List[Optional[List[SearchHit]]] = []
+        misses: List[str] = []
+        seen = set()
+        with self._lock:
+            for query in queries:
+                key = (tenant_id, normalize_query(query), k)
+                entry = self._cache.get(key)
+                if entry is not None and entry[0] > now:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    results.append(list(entry[1]))
+                    continue
+                self.misses += 1
+                results.append(None)
+                if key[1] not in seen:
+                    seen.add(key[1])
+                    misses.append(query)
+        return results, misses
+
+    def _fuse(self, queries: Sequence[str], misses: List[str], rankings: List[List[List[SearchHit]]],
+              k: int, results: List[Optional[List[SearchHit]]]) -> None:
+        tenant_id = get_current_tenant_id()
+        fused = {
+            normalize_query(query): reciprocal_rank_fusion([r[i] for r in rankings], k, self.rrf_k)
+            for i, query in enumerate(misses)
+        }
+        # Don't cache a partial answer from a degraded fan-out
+        cacheable = self.cache_ttl > 0 and len(rankings) == len(self.backends)
+        expires = time.monotonic() + self.cache_ttl
+        with self._lock:
+            for i, query in enumerate(queries):
+                if results[i] is None:
+                    results[i] = list(fused[normalize_query(query)])
+            if cacheable:
+                for normalized, hits in fused.items():
+                    self._cache[(tenant_id, normalized, k)] = (expires, hits)
+                    self._cache.move_to_end((tenant_id, normalized, k))
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
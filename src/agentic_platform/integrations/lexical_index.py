@@ -0,0 +1,320 @@
+"""
+BM25 inverted index for exact-term knowledge base search.
+
+Layout follows the usual segment design:
+
+- New documents go into an in-memory write buffer (term -> growable
+  arrays of doc numbers and term frequencies).
+- When the buffer holds `segment_size` documents it is frozen into an
+  immutable segment: a term dictionary plus two flat NumPy arrays (doc
+  numbers and term frequencies) with per-term offsets, i.e. CSR postings.
+- Removing or replacing a document only clears its bit in a live mask;
+  dead postings are dropped when segments are merged.
+
+Scoring is Okapi BM25. For a query, the postings of each term are gathered
+from every segment, scored with array arithmetic and summed per document
+with bincount, so cost scales with the postings touched, not the corpus.
+
+Tokens keep internal '-', '.', '/', ':' and '_' (so "ERR-4420" and
+"v2.1.0" are single terms) and also index their alphanumeric parts.
+
+Segments persist as .npy files under the index directory (memory-mapped
+on load); only segments created since the last save are written.
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import Document
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"\w+(?:[-./:]\w+)*")
+PART_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased terms; compound terms (IDs, codes) also yield their parts."""
+    tokens = []
+    for token in TOKEN_RE.findall(text.lower()):
+        tokens.append(token)
+        parts = PART_RE.findall(token)
+        if len(parts) > 1:
+            tokens.extend(parts)
+    return tokens
+
+
+class Segment:
+    """Immutable CSR postings for a range of documents."""
+
+    def __init__(self, terms: Dict[str, int], offsets: np.ndarray, docs: np.ndarray, tfs: np.ndarray,
+                 name: Optional[str] = None):
+        self.terms = terms  # term -> position in offsets
+        self.offsets = offsets
+        self.docs = docs
+        self.tfs = tfs
+        self.name = name  # set once written to disk
+
+    @classmethod
+    def from_postings(cls, postings: Dict[str, Tuple[Sequence[int], Sequence[int]]]) -> "Segment":
+        terms = sorted(postings)
+        lengths = np.fromiter((len(postings[t][0]) for t in terms), dtype=np.int64, count=len(terms))
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        docs = np.empty(offsets[-1], dtype=np.uint32)
+        tfs = np.empty(offsets[-1], dtype=np.uint16)
+        for i, term in enumerate(terms):
+            term_docs, term_tfs = postings[term]
+            docs[offsets[i]:offsets[i + 1]] = np.asarray(term_docs)
+            tfs[offsets[i]:offsets[i + 1]] = np.minimum(np.asarray(term_tfs), np.iinfo(np.uint16).max)
+        return cls({t: i for i, t in enumerate(terms)}, offsets, docs, tfs)
+
+    def postings(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        i = self.terms.get(term)
+        if i is None:
+            return None
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.docs[start:end], self.tfs[start:end]
+
+    def save(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        terms = sorted(self.terms, key=self.terms.get)
+        (directory / "terms.txt").write_text("\n".join(terms), encoding="utf-8")
+        np.save(directory / "offsets.npy", self.offsets)
+        np.save(directory / "docs.npy", self.docs)
+        np.save(directory / "tfs.npy", self.tfs)
+
+    @classmethod
+    def load(cls, directory: Path) -> "Segment":
+        text = (directory / "terms.txt").read_text(encoding="utf-8")
+        terms = {t: i for i, t in enumerate(text.split("\n"))} if text else {}
+        return cls(
+            terms,
+            np.load(directory / "offsets.npy"),
+            np.load(directory / "docs.npy", mmap_mode="r"),
+            np.load(directory / "tfs.npy", mmap_mode="r"),
+            name=directory.name,
+        )
+
+
+class BM25Index:
+    """
+    Incremental BM25 index over documents.
+
+    Args:
+        directory: Where segments persist (None for memory only)
+        k1, b: BM25 parameters
+        segment_size: Documents buffered before a segment is frozen
+        max_segments: Segment count that triggers a full merge
+    """
+
+    def __init__(self, directory: Optional[Path] = None, k1: float = 1.2, b: float = 0.75,
+                 segment_size: int = 10_000, max_segments: int = 8):
+        self.directory = Path(directory) if directory else None
+        self.k1 = k1
+        self.b = b
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self.documents: List[Optional[Document]] = []  # by doc number; None once removed
+        self.segments: List[Segment] = []
+        self._ids: Dict[str, int] = {}
+        self._doc_len = array("I")
+        self._live = bytearray()
+        self._live_total_len = 0
+        self._buffer: Dict[str, Tuple[array, array]] = {}
+        self._buffered = 0
+        self._saved_docs = 0
+        self._saved_bytes = 0  # size of docs.jsonl as of the last manifest
+        if self.directory is not None and (self.directory / "manifest.json").exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, documents: Iterable[Document]) -> int:
+        """Index documents, replacing any with the same id."""
+        count = 0
+        for doc in documents:
+            if doc.id in self._ids:
+                self.remove([doc.id])
+            docno = len(self.documents)
+            terms = Counter(tokenize(doc.text))
+            for term, tf in terms.items():
+                postings = self._buffer.get(term)
+                if postings is None:
+                    postings = self._buffer[term] = (array("I"), array("I"))
+                postings[0].append(docno)
+                postings[1].append(tf)
+            length = sum(terms.values())
+            self.documents.append(doc)
+            self._ids[doc.id] = docno
+            self._doc_len.append(length)
+            self._live.append(1)
+            self._live_total_len += length
+            self._buffered += 1
+            count += 1
+            if self._buffered >= self.segment_size:
+                self._flush()
+        return count
+
+    def remove(self, ids: Iterable[str]) -> int:
+        removed = 0
+        for doc_id in ids:
+            docno = self._ids.pop(doc_id, None)
+            if docno is None:
+                continue
+            self._live[docno] = 0
+            self._live_total_len -= self._doc_len[docno]
+            self.documents[docno] = None
+            removed += 1
+        return removed
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[Document, float]]:
+        """Top-k (document, BM25 score) pairs for a query."""
+        n_docs = len(self._ids)
+        if n_docs == 0:
+            return []
+        live = np.frombuffer(self._live, dtype=bool)
+        doc_len = np.frombuffer(self._doc_len, dtype=np.uint32)
+        avgdl = self._live_total_len / n_docs
+
+        all_docs, all_scores = [], []
+        for term, qtf in Counter(tokenize(query)).items():
+            docs, tfs = self._postings(term)
+            if docs is None:
+                continue
+            keep = live[docs]
+            docs, tfs = docs[keep], tfs[keep].astype(np.float32)
+            df = len(docs)
+            if df == 0:
+                continue
+            idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * doc_len[docs] / avgdl)
+            all_docs.append(docs)
+            all_scores.append(qtf * idf * tfs * (self.k1 + 1) / (tfs + norm))
+        if not all_docs:
+            return []
+
+        unique, inverse = np.unique(np.concatenate(all_docs), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(all_scores))
+        k = min(k, len(unique))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.documents[unique[i]], float(scores[i])) for i in top]
+
+    def _postings(self, term: str) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        docs, tfs = [], []
+        for segment in self.segments:
+            postings = segment.postings(term)
+            if postings is not None:
+                docs.append(postings[0])
+                tfs.append(postings[1])
+        buffered = self._buffer.get(term)
+        if buffered is not None:
+            docs.append(np.frombuffer(buffered[0], dtype=np.uint32))
+            tfs.append(np.frombuffer(buffered[1], dtype=np.uint32))
+        if not docs:
+            return None, None
+        if len(docs) == 1:
+            return docs[0], tfs[0]
+        return np.concatenate(docs), np.concatenate(tfs)
+
+    def _flush(self) -> None:
+        """Freeze the write buffer into a segment, merging if there are too many."""
+        if not self._buffered:
+            return
+        self.segments.append(Segment.from_postings(self._buffer))
+        self._buffer = {}
+        self._buffered = 0
+        if len(self.segments) > self.max_segments:
+            self.merge()
+
+    def merge(self) -> None:
+        """Merge all segments into one, dropping postings of removed documents."""
+        live = np.frombuffer(self._live, dtype=bool)
+        merged: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for term in set().union(*(s.terms for s in self.segments)):
+            docs, tfs = [], []
+            for segment in self.segments:
+                postings = segment.postings(term)
+                if postings is not None:
+                    keep = live[postings[0]]
+                    docs.append(postings[0][keep])
+                    tfs.append(postings[1][keep])
+            docs, tfs = np.concatenate(docs), np.concatenate(tfs)
+            if len(docs):
+                merged[term] = (docs, tfs)
+        self.segments = [Segment.from_postings(merged)]
+        logger.info(f"Merged BM25 segments: {len(merged)} terms")
+
+    def save(self) -> None:
+        """Flush the buffer and persist new segments, document lengths and the live mask."""
+        if self.directory is None:
+            return
+        self._flush()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for segment in self.segments:
+            if segment.name is None:
+                segment.name = f"seg_{os.urandom(6).hex()}"
+                segment.save(self.directory / segment.name)
+        self._replace_array("doc_len.npy", np.frombuffer(self._doc_len, dtype=np.uint32))
+        self._replace_array("live.npy", np.frombuffer(self._live, dtype=np.uint8))
+
+        # Documents are append-only on disk; removals are carried by the live mask.
+        # Lines past the last manifest come from a save that never committed
+        # (crash before the manifest was replaced) and are cut off first, so
+        # line numbers keep matching doc numbers.
+        with open(self.directory / "docs.jsonl", "ab") as f:
+            f.truncate(self._saved_bytes)
+            for doc in self.documents[self._saved_docs:]:
+                record = None if doc is None else {"id": doc.id, "text": doc.text, "metadata": doc.metadata}
+                f.write(json.dumps(record).encode("utf-8") + b"\n")
+            docs_bytes = f.tell()
+
+        manifest = {"segments": [s.name for s in self.segments], "docs": len(self.documents),
+                    "k1": self.k1, "b": self.b}
+        tmp_path = self.directory / ".manifest.json.tmp"
+        tmp_path.write_text(json.dumps(manifest))
+        os.replace(tmp_path, self.directory / "manifest.json")
+        self._saved_docs, self._saved_bytes = manifest["docs"], docs_bytes
+        # Segments replaced by a merge are no longer referenced
+        for path in self.directory.glob("seg_*"):
+            if path.name not in manifest["segments"]:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _replace_array(self, name: str, values: np.ndarray) -> None:
+        tmp_path = self.directory / f".{name}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, values)
+        os.replace(tmp_path, self.directory / name)
+
+    def _load(self) -> None:
+        manifest = json.loads((self.directory / "manifest.json").read_text())
+        n_docs = manifest["docs"]
+        self.segments = [Segment.load(self.directory / name) for name in manifest["segments"]]
+        # Arrays may run ahead of the manifest if a save was interrupted
+        self._doc_len = array("I", np.load(self.directory / "doc_len.npy")[:n_docs].tobytes())
+        self._live = bytearray(np.load(self.directory / "live.npy")[:n_docs].tobytes())
+        with open(self.directory / "docs.jsonl", "rb") as f:
+            for docno, line in zip(range(n_docs), f):
+                record = json.loads(line)
+                if record is None or not self._live[docno]:
+                    self.documents.append(None)
+                    continue
+                doc = Document(record["id"], record["text"], record.get("metadata") or {})
+                self.documents.append(doc)
+                self._ids[doc.id] = docno
+                self._live_total_len += self._doc_len[docno]
+            self._saved_bytes = f.tell()
+        self._saved_docs = n_docs
+        logger.info(f"Loaded BM25 index from {self.directory}: {len(self._ids)} documents, "
+                    f"{len(self.segments)} segments")
@@ -0,0 +1,246 @@
+"""
+OCR result cache keyed by image content.
+
+Results are stored under the SHA-256 of the image bytes plus the provider
+and the options that affect its output (e.g. preprocessing), so repeat OCR
+of the same image is a local lookup instead of an API round trip.
+
+Tiers:
+- In-memory LRU (always)
+- SQLite (optional, OCR_CACHE=sqlite): survives restarts, shared by the
+  workers on one host
+
+Tenant isolation follows the "ocr_cache" feature in the TenantConfig:
+"shared" (default) lets tenants reuse each other's results for identical
+images, "isolated" keeps a tenant's entries in its own namespace, and False
+disables caching for that tenant.
+
+Entries are private deep copies and lookups return deep copies, so callers
+may modify a result (e.g. its blocks) without touching later cache hits.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .base import OCRInput, OCRProvider, read_ocr_input
+from ..core.tenancy import TenantRegistry, get_current_tenant_id
+
+logger = logging.getLogger(__name__)
+
+SHARED_SCOPE = "*"
+
+
+class OCRResultCache:
+    """
+    Two-tier cache of OCR results.
+
+    Args:
+        max_entries: Size of the in-memory LRU tier
+        path: SQLite database for the persistent tier (None for memory only)
+    """
+
+    def __init__(self, max_entries: int = 1024, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.path = path
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        if path:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_results ("
+                "scope TEXT, key TEXT, result TEXT, created_at REAL, PRIMARY KEY (scope, key))"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(content: bytes, provider: str, options: Dict[str, Any]) -> str:
+        """SHA-256 of the image bytes, qualified by provider and options."""
+        digest = hashlib.sha256(content).hexdigest()
+        qualifier = json.dumps([provider, options], sort_keys=True, default=str)
+        return f"{digest}:{hashlib.sha256(qualifier.encode()).hexdigest()[:16]}"
+
+    def get(self, scope: str, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            result = self._entries.get((scope, key))
+            if result is not None:
+                self._entries.move_to_end((scope, key))
+                self.hits += 1
+                return copy.deepcopy(result)
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT result FROM ocr_results WHERE scope = ? AND key = ?", (scope, key)
+                ).fetchone()
+                if row is not None:
+                    result = json.loads(row[0])
+                    self._remember((scope, key), result)
+                    self.hits += 1
+                    return copy.deepcopy(result)
+            self.misses += 1
+            return None
+
+    def put(self, scope: str, key: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._remember((scope, key), copy.deepcopy(result))
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO ocr_results (scope, key, result, created_at) VALUES (?, ?, ?, ?)",
+                    (scope, key, json.dumps(result, default=str), time.time()),
+                )
+                self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM ocr_results")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _remember(self, entry_key: Tuple[str, str], result: Dict[str, Any]) -> None:
+        self._entries[entry_key] = result
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def cache_scope(tenant_id: str) -> Optional[str]:
+    """The cache namespace for a tenant, or None if it must not be cached."""
+    mode = TenantRegistry.get_config(tenant_id).features.get("ocr_cache", "shared")
+    if mode is False:
+        return None
+    if mode == "isolated":
+        return f"tenant:{tenant_id}"
+    return SHARED_SCOPE
+
+
+class CachingOCRProvider(OCRProvider):
+    """
+    Wraps an OCRProvider and serves repeat images from an OCRResultCache.
+
+    Error results and demo fallbacks ("mock") are never cached.
+    """
+
+    def __init__(self, provider: OCRProvider, cache: OCRResultCache):
+        self.provider = provider
+        self.cache = cache
+
+    def ocr_image(self, image_path: str) -> Dict[str, Any]:
+        try:
+            with open(image_path, "rb") as image_file:
+                content = image_file.read()
+        except OSError:
+            return self.provider.ocr_image(image_path)
+        return self.ocr_bytes(content, os.path.basename(image_path))
+
+    def ocr_bytes(self, content: bytes, filename: str = "") -> Dict[str, Any]:
+        scope = cache_scope(get_current_tenant_id())
+        if scope is None:
+            return self.provider.ocr_bytes(content, filename)
+
+        key = self.cache.make_key(content, type(self.provider).__name__, self.provider.cache_options())
+        cached = self.cache.get(scope, key)
+        if cached is not None:
+            logger.debug(f"OCR cache hit for {filename or key[:12]}")
+            return cached
+
+        result = self.provider.ocr_bytes(content, filename)
+        if not result.get("error") and not result.get("mock"):
+            self.cache.put(scope, key, result)
+        return result
+
+    async def aocr_image(self, image_path: str) -> Dict[str, Any]:
+        try:
+            content = await asyncio.to_thread(_read_file, image_path)
+        except OSError:
+            return await self.provider.aocr_image(image_path)
+        return await self.aocr_bytes(content, os.path.basename(image_path))
+
+    async def aocr_bytes(self, content: bytes, filename: str = "") -> Dict[str, Any]:
+        scope = cache_scope(get_current_tenant_id())
+        if scope is None:
+            return await self.provider.aocr_bytes(content, filename)
+
+        key = self.cache.make_key(content, type(self.provider).__name__, self.provider.cache_options())
+        cached = self.cache.get(scope, key)
+        if cached is not None:
+            logger.debug(f"OCR cache hit for {filename or key[:12]}")
+            return cached
+
+        result = await self.provider.aocr_bytes(content, filename)
+        if not result.get("error") and not result.get("mock"):
+            self.cache.put(scope, key, result)
+        return result
+
+    def ocr_batch(self, images: Sequence[OCRInput]) -> List[Dict[str, Any]]:
+        """Serve cached images locally and send only the misses as one batch."""
+        scope = cache_scope(get_current_tenant_id())
+        if scope is None:
+            return self.provider.ocr_batch(images)
+
+        provider_name = type(self.provider).__name__
+        options = self.provider.cache_options()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(images)
+        misses = []  # (index, key, item)
+        for index, item in enumerate(images):
+            try:
+                content, filename = read_ocr_input(item)
+            except OSError:
+                misses.append((index, None, item))
+                continue
+            key = self.cache.make_key(content, provider_name, options)
+            results[index] = self.cache.get(scope, key)
+            if results[index] is None:
+                misses.append((index, key, (content, filename)))
+
+        if misses:
+            fresh = self.provider.ocr_batch([item for _, _, item in misses])
+            for (index, key, _), result in zip(misses, fresh):
+                results[index] = result
+                if key is not None and not result.get("error") and not result.get("mock"):
+                    self.cache.put(scope, key, result)
+        logger.debug(f"OCR batch: {len(images) - len(misses)} cached, {len(misses)} sent")
+        return results
+
+    def cache_options(self) -> Dict[str, Any]:
+        return self.provider.cache_options()
+
+
+def create_ocr_cache() -> Optional[OCRResultCache]:
+    """
+    Build the OCR cache selected by the environment.
+
+    OCR_CACHE=memory (default), sqlite (with OCR_CACHE_PATH) or off.
+    """
+    backend = os.getenv("OCR_CACHE", "memory").lower()
+    if backend == "off":
+        return None
+    max_entries = int(os.getenv("OCR_CACHE_SIZE", "1024"))
+    if backend == "sqlite":
+        return OCRResultCache(max_entries, path=os.getenv("OCR_CACHE_PATH", "ocr_cache.db"))
+    return OCRResultCache(max_entries)
+
+
+# Process-wide cache shared by every OCR entry point
+ocr_result_cache = create_ocr_cache()
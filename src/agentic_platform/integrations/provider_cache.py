@@ -0,0 +1,151 @@
+"""
+Bounded, thread-safe cache of provider instances.
+
+The factory keys providers on the resolved tenant and a fingerprint of its
+TenantConfig, so a config change yields a fresh provider and tenants never
+share one by accident. Providers often own connection pools, so:
+
+- each key is built at most once, even under concurrent first requests
+  (construction happens under a per-key lock, not the cache lock);
+- entries unused for `idle_timeout` seconds, or beyond `max_entries`
+  (least recently used first), are dropped and closed if they have close().
+  A caller that fetched the provider earlier may still be using it, so a
+  provider's close() must let in-flight calls finish (or fail cleanly),
+  e.g. by only refusing new work and letting its pools drain;
+- warm-up hooks run on every newly built provider (e.g. to open
+  connections or load an index) before it is handed out.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List
+
+logger = logging.getLogger(__name__)
+
+WarmupHook = Callable[[Hashable, Any], None]
+
+
+@dataclass
+class _CacheEntry:
+    provider: Any
+    last_used: float
+
+
+class _Build:
+    """Per-key build lock, shared by every caller waiting on that key."""
+    __slots__ = ("lock", "waiters")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.waiters = 0
+
+
+class ProviderCache:
+    """
+    LRU + idle-timeout cache of providers.
+
+    Args:
+        max_entries: Providers kept at most
+        idle_timeout: Seconds after which an unused provider is evicted
+    """
+
+    def __init__(self, max_entries: int = 64, idle_timeout: float = 1800.0):
+        self.max_entries = max_entries
+        self.idle_timeout = idle_timeout
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._building: Dict[Hashable, _Build] = {}
+        self._hooks: List[WarmupHook] = []
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Return the provider for `key`, building it with `build()` on a miss."""
+        evicted = []
+        try:
+            with self._lock:
+                evicted = self._evict_idle(time.monotonic())
+                provider = self._lookup(key)
+                if provider is not None:
+                    return provider
+                building = self._building.get(key)
+                if building is None:
+                    building = self._building[key] = _Build()
+                building.waiters += 1
+
+            try:
+                with building.lock:
+                    with self._lock:
+                        provider = self._lookup(key)
+                        if provider is not None:
+                            return provider
+                        self.misses += 1
+                    # A failing build leaves the lock registered for the
+                    # callers still waiting, so their retries stay serialized
+                    provider = build()
+                    for hook in list(self._hooks):
+                        try:
+                            hook(key, provider)
+                        except Exception as e:
+                            logger.warning(f"Provider warm-up hook failed for {key}: {e}")
+                    with self._lock:
+                        self._entries[key] = _CacheEntry(provider, time.monotonic())
+                        while len(self._entries) > self.max_entries:
+                            evicted.append(self._entries.popitem(last=False)[1].provider)
+                    return provider
+            finally:
+                with self._lock:
+                    building.waiters -= 1
+                    if building.waiters == 0:
+                        del self._building[key]
+        finally:
+            for old in evicted:
+                self._close(old)
+
+    def add_warmup_hook(self, hook: WarmupHook) -> None:
+        """Run `hook(key, provider)` on every provider built from now on."""
+        with self._lock:
+            self._hooks.append(hook)
+
+    def clear(self) -> None:
+        """Drop (and close) every cached provider."""
+        with self._lock:
+            entries, self._entries = list(self._entries.values()), OrderedDict()
+            self.hits = 0
+            self.misses = 0
+        for entry in entries:
+            self._close(entry.provider)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        entry.last_used = time.monotonic()
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.provider
+
+    def _evict_idle(self, now: float) -> list:
+        evicted = []
+        for key, entry in list(self._entries.items()):
+            if now - entry.last_used > self.idle_timeout:
+                del self._entries[key]
+                evicted.append(entry.provider)
+        return evicted
+
+    @staticmethod
+    def _close(provider: Any) -> None:
+        close = getattr(provider, "close", None)
+        if close is None:
+            return
+        try:
+            close()
+        except Exception as e:
+            logger.debug(f"Error closing provider {type(provider).__name__}: {e}")
@@ -0,0 +1,343 @@
+"""
+In-process vector index for the local knowledge base.
+
+Documents are embedded with a hashing embedder (signed feature hashing of
+word unigrams and bigrams, sublinear TF, L2-normalized), so there is no
+vocabulary to fit and documents can be added at any time. Vectors live in a
+float32 NumPy matrix and queries are scored in one matrix product with
+top-k selection by argpartition.
+
+For large corpora an IVF (inverted file) partition can be built: vectors are
+clustered by spherical k-means and a query only scores the `nprobe` lists
+whose centroids are closest. Rows added after the partition was built are
+scanned exhaustively until it is rebuilt.
+
+The index persists to a directory of .npy files (plus docs.jsonl and
+meta.json) and is reopened memory-mapped, so a large index loads instantly
+and pages in on demand.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import Document
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+class HashingEmbedder:
+    """
+    Stateless text embedder based on signed feature hashing.
+
+    Args:
+        dim: Embedding dimension
+        bigrams: Also hash adjacent word pairs (helps short phrase queries)
+    """
+
+    def __init__(self, dim: int = 1024, bigrams: bool = True, max_cached_tokens: int = 1 << 18):
+        self.dim = dim
+        self.bigrams = bigrams
+        self.max_cached_tokens = max_cached_tokens
+        self._slots: Dict[str, Tuple[int, float]] = {}
+
+    def config(self) -> Dict[str, Any]:
+        return {"type": "hashing", "dim": self.dim, "bigrams": self.bigrams}
+
+    def tokens(self, text: str) -> List[str]:
+        words = TOKEN_RE.findall(text.lower())
+        if self.bigrams:
+            words.extend(f"{a} {b}" for a, b in zip(words, words[1:]))
+        return words
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts into an (n, dim) float32 matrix of unit rows."""
+        rows: List[int] = []
+        cols: List[int] = []
+        signs: List[float] = []
+        for row, text in enumerate(texts):
+            for token in self.tokens(text):
+                col, sign = self._slot(token)
+                rows.append(row)
+                cols.append(col)
+                signs.append(sign)
+
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        np.add.at(matrix, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)),
+                  np.asarray(signs, dtype=np.float32))
+        # Sublinear term frequency keeps repeated words from dominating
+        matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    def _slot(self, token: str) -> Tuple[int, float]:
+        slot = self._slots.get(token)
+        if slot is None:
+            h = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+            slot = (h % self.dim, 1.0 if h >> 63 else -1.0)
+            if len(self._slots) >= self.max_cached_tokens:
+                self._slots.clear()
+            self._slots[token] = slot
+        return slot
+
+
+class VectorIndex:
+    """
+    Cosine-similarity index over unit vectors, with an optional IVF partition.
+
+    Row ids are positions in the matrix; replacing a document tombstones its
+    old row and appends a new one.
+
+    Args:
+        dim: Vector dimension
+        nprobe: IVF lists scanned per query once a partition is built
+    """
+
+    def __init__(self, dim: int, nprobe: int = 8):
+        self.dim = dim
+        self.nprobe = nprobe
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._live = np.zeros(0, dtype=bool)
+        self._size = 0
+        # IVF partition: rows grouped by list (CSR layout) over the first _ivf_size rows
+        self._centroids: Optional[np.ndarray] = None
+        self._ivf_order: Optional[np.ndarray] = None
+        self._ivf_offsets: Optional[np.ndarray] = None
+        self._ivf_size = 0
+
+    @property
+    def size(self) -> int:
+        """Number of rows, including tombstoned ones."""
+        return self._size
+
+    @property
+    def live_count(self) -> int:
+        return int(self._live[:self._size].sum())
+
+    @property
+    def unpartitioned(self) -> int:
+        """Rows added since the IVF partition was (last) built."""
+        return self._size - self._ivf_size if self._centroids is not None else self._size
+
+    def add(self, vectors: np.ndarray) -> np.ndarray:
+        """Append unit vectors and return their row ids."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        needed = self._size + len(vectors)
+        if needed > len(self._vectors) or not self._vectors.flags.writeable:
+            # Grow geometrically; also copies a memory-mapped matrix into RAM
+            capacity = max(needed, 2 * len(self._vectors), 64)
+            grown = np.zeros((capacity, self.dim), dtype=np.float32)
+            grown[:self._size] = self._vectors[:self._size]
+            live = np.zeros(capacity, dtype=bool)
+            live[:self._size] = self._live[:self._size]
+            self._vectors, self._live = grown, live
+        ids = np.arange(self._size, needed)
+        self._vectors[ids] = vectors
+        self._live[ids] = True
+        self._size = needed
+        return ids
+
+    def remove(self, row_ids: Sequence[int]) -> None:
+        if not self._live.flags.writeable:
+            self._live = self._live.copy()
+        self._live[np.asarray(row_ids, dtype=np.intp)] = False
+
+    def search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top-k rows for each query.
+
+        Returns (scores, row_ids), both (n_queries, k'), best first, where
+        k' <= k. Missing slots (fewer than k live candidates) have row id -1.
+        """
+        queries = np.asarray(queries, dtype=np.float32).reshape(-1, self.dim)
+        k = min(k, self._size)
+        if k == 0:
+            return np.zeros((len(queries), 0), np.float32), np.zeros((len(queries), 0), np.intp)
+        if self._centroids is None:
+            return self._top_k(queries @ self._vectors[:self._size].T, np.arange(self._size), k)
+
+        scores = np.empty((len(queries), k), dtype=np.float32)
+        rows = np.empty((len(queries), k), dtype=np.intp)
+        probe = min(self.nprobe, len(self._centroids))
+        nearest = np.argpartition(-(queries @ self._centroids.T), probe - 1, axis=1)[:, :probe]
+        tail = np.arange(self._ivf_size, self._size)
+        for i, lists in enumerate(nearest):
+            candidates = np.concatenate(
+                [self._ivf_order[self._ivf_offsets[l]:self._ivf_offsets[l + 1]] for l in lists] + [tail]
+            )
+            s, r = self._top_k(queries[i:i + 1] @ self._vectors[candidates].T, candidates, k)
+            scores[i], rows[i] = s[0], r[0]
+        return scores, rows
+
+    def _top_k(self, scores: np.ndarray, candidates: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        scores = np.where(self._live[candidates], scores, -np.inf)
+        if scores.shape[1] < k:
+            pad = k - scores.shape[1]
+            scores = np.pad(scores, ((0, 0), (0, pad)), constant_values=-np.inf)
+            candidates = np.pad(candidates, (0, pad), constant_values=-1)
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        rows = np.where(np.isfinite(top_scores), candidates[top], -1)
+        return top_scores, rows
+
+    def build_ivf(self, nlist: Optional[int] = None, iterations: int = 10, sample_size: int = 100_000,
+                  seed: int = 0) -> None:
+        """
+        Partition the current rows into `nlist` lists (default sqrt(n)).
+
+        Centroids are trained by spherical k-means on a sample of the rows,
+        then every row is assigned to its nearest centroid.
+        """
+        n = self._size
+        nlist = min(nlist or max(1, int(np.sqrt(n))), n)
+        if nlist == 0:
+            return
+        rng = np.random.default_rng(seed)
+        sample = self._vectors[rng.choice(n, size=min(n, sample_size), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assign = self._assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Empty lists keep their previous centroid
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+
+        assign = self._assign(self._vectors[:n], centroids)
+        self._centroids = centroids.astype(np.float32)
+        self._ivf_order = np.argsort(assign, kind="stable")
+        self._ivf_offsets = np.searchsorted(assign[self._ivf_order], np.arange(nlist + 1))
+        self._ivf_size = n
+        logger.info(f"Built IVF partition: {n} vectors in {nlist} lists")
+
+    @staticmethod
+    def _assign(vectors: np.ndarray, centroids: np.ndarray, chunk: int = 65536) -> np.ndarray:
+        return np.concatenate([
+            np.argmax(vectors[start:start + chunk] @ centroids.T, axis=1)
+            for start in range(0, len(vectors), chunk)
+        ]) if len(vectors) else np.zeros(0, dtype=np.intp)
+
+    def save(self, directory: Path) -> None:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        arrays = {"vectors": self._vectors[:self._size], "live": self._live[:self._size]}
+        if self._centroids is not None:
+            arrays.update(ivf_centroids=self._centroids, ivf_order=self._ivf_order, ivf_offsets=self._ivf_offsets)
+        for name, array in arrays.items():
+            _save_array(directory / f"{name}.npy", array)
+        for name in ("ivf_centroids", "ivf_order", "ivf_offsets"):
+            if name not in arrays and (directory / f"{name}.npy").exists():
+                (directory / f"{name}.npy").unlink()
+
+    @classmethod
+    def load(cls, directory: Path, dim: int, ivf_size: int = 0, nprobe: int = 8) -> "VectorIndex":
+        """Open a saved index; the vector matrix is memory-mapped read-only."""
+        directory = Path(directory)
+        index = cls(dim, nprobe=nprobe)
+        index._vectors = np.load(directory / "vectors.npy", mmap_mode="r")
+        index._live = np.load(directory / "live.npy")
+        index._size = len(index._vectors)
+        if (directory / "ivf_centroids.npy").exists():
+            index._centroids = np.load(directory / "ivf_centroids.npy")
+            index._ivf_order = np.load(directory / "ivf_order.npy")
+            index._ivf_offsets = np.load(directory / "ivf_offsets.npy")
+            index._ivf_size = ivf_size
+        return index
+
+
+def _save_array(path: Path, array: np.ndarray) -> None:
+    # Write then rename, so a reader never maps a half-written file
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, np.ascontiguousarray(array))
+    os.replace(tmp_path, path)
+
+
+class DocumentVectorStore:
+    """
+    Documents plus their vectors: the storage behind LocalVectorKnowledgeBase.
+
+    Args:
+        directory: Where the index persists (None for memory only)
+        embedder: Text embedder (defaults to HashingEmbedder())
+        nprobe: IVF lists scanned per query
+    """
+
+    def __init__(self, directory: Optional[Path] = None, embedder: Optional[HashingEmbedder] = None,
+                 nprobe: int = 8):
+        self.directory = Path(directory) if directory else None
+        self.embedder = embedder or HashingEmbedder()
+        self.documents: List[Optional[Document]] = []  # by row id; None once replaced
+        self._rows: Dict[str, int] = {}  # document id -> live row
+        if self.directory is not None and (self.directory / "meta.json").exists():
+            self._load(nprobe)
+        else:
+            self.index = VectorIndex(self.embedder.dim, nprobe=nprobe)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, documents: Sequence[Document]) -> None:
+        """Embed and add documents, replacing any with the same id."""
+        if not documents:
+            return
+        replaced = [self._rows[d.id] for d in documents if d.id in self._rows]
+        if replaced:
+            self.index.remove(replaced)
+            for row in replaced:
+                self.documents[row] = None
+        rows = self.index.add(self.embedder.embed([d.text for d in documents]))
+        for row, doc in zip(rows, documents):
+            self.documents.append(doc)
+            self._rows[doc.id] = int(row)
+
+    def query(self, texts: Sequence[str], k: int) -> List[List[Tuple[Document, float]]]:
+        """Top-k (document, cosine score) pairs for each query text."""
+        scores, rows = self.index.search(self.embedder.embed(texts), k)
+        return [
+            [(self.documents[row], float(score)) for score, row in zip(score_row, id_row) if row >= 0]
+            for score_row, id_row in zip(scores, rows)
+        ]
+
+    def save(self) -> None:
+        if self.directory is None:
+            return
+        self.index.save(self.directory)
+        tmp_path = self.directory / ".docs.jsonl.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for doc in self.documents:
+                record = None if doc is None else {"id": doc.id, "text": doc.text, "metadata": doc.metadata}
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp_path, self.directory / "docs.jsonl")
+        meta = {"embedder": self.embedder.config(), "size": self.index.size, "ivf_size": self.index._ivf_size}
+        (self.directory / "meta.json").write_text(json.dumps(meta))
+
+    def _load(self, nprobe: int) -> None:
+        meta = json.loads((self.directory / "meta.json").read_text())
+        embedder_config = dict(meta["embedder"])
+        embedder_config.pop("type", None)
+        if self.embedder.config() != meta["embedder"]:
+            logger.warning(f"Embedder config differs from the saved index; using {meta['embedder']}")
+            self.embedder = HashingEmbedder(**embedder_config)
+        self.index = VectorIndex.load(self.directory, self.embedder.dim, meta.get("ivf_size", 0), nprobe)
+        with open(self.directory / "docs.jsonl", encoding="utf-8") as f:
+            for row, line in enumerate(f):
+                record = json.loads(line)
+                if record is None:
+                    self.documents.append(None)
+                    continue
+                self.documents.append(Document(record["id"], record["text"], record.get("metadata") or {}))
+                self._rows[record["id"]] = row
+        logger.info(f"Loaded vector index from {self.directory}: {len(self._rows)} documents")
@@ -0,0 +1,3 @@
+# __init__.py for agentic_platform.jobs
+from .store import JobRecord, JobStore, InMemoryJobStore, SQLiteJobStore, create_job_store
+from .queue import JobQueue, QueueFullError, report_progress
@@ -0,0 +1,135 @@
+"""
+In-process job queue with a fixed worker pool.
+
+Submissions are accepted immediately and executed by background worker
+threads; callers poll the JobStore for status and results. The queue is
+bounded so overload surfaces as QueueFullError instead of unbounded latency.
+"""
+
+import contextvars
+import logging
+import queue
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from agentic_platform.core.errors import PlatformError
+from agentic_platform.core.ids import generate_job_id
+from agentic_platform.core.tenancy import get_current_tenant_id
+from .store import JobRecord, JobStore, RUNNING, SUCCEEDED, FAILED
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(PlatformError):
+    """Raised when a job is submitted while the queue is at capacity."""
+    pass
+
+
+# (store, job_id) of the job running in the current context, if any
+_current_job: ContextVar[Optional[Tuple[JobStore, str]]] = ContextVar("current_job", default=None)
+
+
+def report_progress(progress: Dict[str, Any]) -> None:
+    """
+    Record progress for the job running in the current context.
+
+    Visible through GET /jobs/{job_id} while the job runs. Outside a job
+    this is a no-op, so job functions can also be called directly.
+    """
+    current = _current_job.get()
+    if current is not None:
+        store, job_id = current
+        store.update(job_id, progress=progress)
+
+
+class JobQueue:
+    """
+    Bounded FIFO queue drained by `workers` daemon threads.
+
+    Each job runs inside a copy of the submitter's context, so the tenant
+    and trace context variables resolve the same way they would have in
+    the request that submitted it.
+    """
+
+    def __init__(self, store: JobStore, workers: int = 4, max_queue_size: int = 100):
+        self.store = store
+        self.workers = workers
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the worker threads (idempotent)."""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f"job-worker-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            logger.info(f"Started {self.workers} job workers")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers after the jobs already queued have run."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def submit(self, job_type: str, func: Callable[[], Any]) -> JobRecord:
+        """
+        Queue `func` for execution and return its JobRecord.
+
+        Raises:
+            QueueFullError: If the queue is at capacity
+        """
+        self.start()
+        record = JobRecord(
+            job_id=generate_job_id(),
+            job_type=job_type,
+            tenant_id=get_current_tenant_id(),
+        )
+        # Created before enqueueing so a worker never sees an unknown job; a
+        # rejected job is removed again since the caller never gets its id
+        self.store.create(record)
+        try:
+            self._queue.put_nowait((record.job_id, func, contextvars.copy_context()))
+        except queue.Full:
+            self.store.delete(record.job_id)
+            raise QueueFullError(f"Job queue is full ({self._queue.maxsize} jobs pending)")
+        logger.info(f"Queued {job_type} job {record.job_id}")
+        return record
+
+    def pending(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize()
+
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._run(*item)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job_id: str, func: Callable[[], Any], ctx: contextvars.Context) -> None:
+        self.store.update(job_id, status=RUNNING, started_at=time.time())
+        try:
+            result = ctx.run(self._call, job_id, func)
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}", exc_info=True)
+            self.store.update(job_id, status=FAILED, finished_at=time.time(), error=str(e))
+            return
+        self.store.update(job_id, status=SUCCEEDED, finished_at=time.time(), result=result)
+        logger.info(f"Job {job_id} succeeded")
+
+    def _call(self, job_id: str, func: Callable[[], Any]) -> Any:
+        _current_job.set((self.store, job_id))
+        return func()
@@ -0,0 +1,208 @@
+"""
+Result stores for asynchronous jobs.
+
+Jobs submitted through the API are tracked as JobRecords. The store keeps
+their status, timestamps and final result so clients can poll for them.
+
+Backends:
+- InMemoryJobStore: process-local, bounded (default)
+- SQLiteJobStore: survives restarts, shareable between workers on one host
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict, replace
+from typing import Any, Dict, Optional
+
+# Job statuses
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+FINISHED_STATUSES = (SUCCEEDED, FAILED)
+
+
+@dataclass
+class JobRecord:
+    """Status and result of a single asynchronous job."""
+    job_id: str
+    job_type: str  # "workflow" or "agent"
+    tenant_id: str = "default"
+    status: str = QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    progress: Optional[Dict[str, Any]] = None
+    result: Any = None
+
+    def to_dict(self, include_result: bool = False) -> Dict[str, Any]:
+        data = asdict(self)
+        if not include_result:
+            data.pop("result")
+        return data
+
+
+class JobStore(ABC):
+    """Abstract base class for job result stores."""
+
+    @abstractmethod
+    def create(self, record: JobRecord) -> None:
+        """Persist a newly submitted job."""
+        pass
+
+    @abstractmethod
+    def update(self, job_id: str, **fields: Any) -> None:
+        """Update fields of an existing job."""
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        """Return the job record, or None if unknown."""
+        pass
+
+    @abstractmethod
+    def delete(self, job_id: str) -> None:
+        """Forget a job (no-op if unknown)."""
+        pass
+
+
+class InMemoryJobStore(JobStore):
+    """
+    Process-local job store.
+
+    Keeps at most `max_jobs` records; when full, the oldest finished jobs are
+    evicted first so results of in-flight jobs are never lost.
+    """
+
+    def __init__(self, max_jobs: int = 1000):
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, JobRecord]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, record: JobRecord) -> None:
+        with self._lock:
+            self._jobs[record.job_id] = record
+            self._evict()
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        with self._lock:
+            record = self._jobs.get(job_id)
+            if record is None:
+                raise KeyError(f"Job {job_id} not found")
+            for key, value in fields.items():
+                setattr(record, key, value)
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        # A snapshot: the live record keeps changing while a worker runs the job
+        with self._lock:
+            record = self._jobs.get(job_id)
+            return replace(record) if record is not None else None
+
+    def delete(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def _evict(self):
+        if len(self._jobs) <= self.max_jobs:
+            return
+        for job_id in [j for j, r in self._jobs.items() if r.status in FINISHED_STATUSES]:
+            del self._jobs[job_id]
+            if len(self._jobs) <= self.max_jobs:
+                return
+
+
+class SQLiteJobStore(JobStore):
+    """
+    SQLite-backed job store.
+
+    Results are stored as JSON, so they must be JSON-serializable (anything
+    that is not falls back to its string representation).
+    """
+
+    _COLUMNS = ("job_id", "job_type", "tenant_id", "status", "submitted_at",
+                "started_at", "finished_at", "error", "progress", "result")
+    _JSON_COLUMNS = ("progress", "result")
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "job_id TEXT PRIMARY KEY, job_type TEXT, tenant_id TEXT, status TEXT, "
+            "submitted_at REAL, started_at REAL, finished_at REAL, error TEXT, progress TEXT, result TEXT)"
+        )
+        self._conn.commit()
+
+    def create(self, record: JobRecord) -> None:
+        values = [
+            self._dump(getattr(record, c)) if c in self._JSON_COLUMNS else getattr(record, c)
+            for c in self._COLUMNS
+        ]
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO jobs ({', '.join(self._COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in self._COLUMNS)})",
+                values,
+            )
+            self._conn.commit()
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        unknown = set(fields) - set(self._COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown job fields: {sorted(unknown)}")
+        for column in self._JSON_COLUMNS:
+            if column in fields:
+                fields[column] = self._dump(fields[column])
+        assignments = ", ".join(f"{k} = ?" for k in fields)
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE job_id = ?",
+                [*fields.values(), job_id],
+            )
+            self._conn.commit()
+        if cursor.rowcount == 0:
+            raise KeyError(f"Job {job_id} not found")
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(self._COLUMNS)} FROM jobs WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        data = dict(zip(self._COLUMNS, row))
+        for column in self._JSON_COLUMNS:
+            data[column] = json.loads(data[column]) if data[column] is not None else None
+        return JobRecord(**data)
+
+    def delete(self, job_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+            self._conn.commit()
+
+    @staticmethod
+    def _dump(value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        return json.dumps(value, default=str)
+
+
+def create_job_store() -> JobStore:
+    """
+    Build the job store selected by the environment.
+
+    JOB_STORE=memory (default) or JOB_STORE=sqlite with JOB_STORE_PATH.
+    """
+    backend = os.getenv("JOB_STORE", "memory").lower()
+    if backend == "sqlite":
+        return SQLiteJobStore(os.getenv("JOB_STORE_PATH", "jobs.db"))
+    return InMemoryJobStore(max_jobs=int(os.getenv("JOB_STORE_MAX_JOBS", "1000")))
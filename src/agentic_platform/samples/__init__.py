@@ -0,0 +1,4 @@
+# __init__.py for agentic_platform.samples
+from .downloader import SampleDownloader, HostRateLimiter
+from .catalog import SampleCatalog, CatalogSnapshot
+from .thumbnails import ThumbnailCache, Rendition
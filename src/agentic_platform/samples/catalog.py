@@ -0,0 +1,220 @@
+"""
+Indexed catalog of sample images for /list-samples/.
+
+The catalog keeps a precomputed, sorted listing of the curated samples and
+everything under sample_data/downloaded, with per-file metadata (size,
+dimensions, SHA-256, thumbnail URL). It is refreshed incrementally by mtime
+polling: the sample directories are stat'ed at most once per
+`poll_interval`, and only files whose (mtime, size) changed are re-hashed
+and re-opened. Listing an unchanged catalog is a dictionary lookup plus a
+slice, however many images have accumulated.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Curated samples, listed first for consistency
+CURATED_SAMPLES = [
+    {"name": "Letter (handwritten)", "path": "sample_data/letter.jpg"},
+    {"name": "Handwriting Sample", "path": "sample_data/handwriting.jpg"},
+    {"name": "Numbers Document", "path": "sample_data/numbers_gs150.jpg"},
+    {"name": "Stock Image", "path": "sample_data/stock_gs200.jpg"},
+    {"name": "Plaid Pattern", "path": "sample_data/ocr_sample_plaid.jpg"},
+    # Copies for padding if downloads don't exist
+    {"name": "Sample Image PNG", "path": "sample_data/ocr_sample_image.png"},
+]
+
+THUMBNAIL_WIDTH = 256
+
+
+@dataclass(frozen=True)
+class FileMeta:
+    """Metadata computed once per (mtime, size) of a sample file."""
+    mtime_ns: int
+    size: int
+    sha256: str
+    width: Optional[int]
+    height: Optional[int]
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """An immutable listing of the catalog at one point in time."""
+    samples: Tuple[Dict[str, Any], ...]
+    etag: str
+    last_modified: float
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def describe_file(path: Path, stat: os.stat_result) -> FileMeta:
+    """Hash a sample file and read its dimensions from the image header."""
+    sha256 = file_sha256(path)
+    width = height = None
+    if Image is not None:
+        try:
+            with Image.open(path) as img:
+                width, height = img.size
+        except Exception as e:
+            logger.warning(f"Could not read image size of {path}: {e}")
+    return FileMeta(stat.st_mtime_ns, stat.st_size, sha256, width, height)
+
+
+def _sample_num(name: str) -> int:
+    # Extract N from sample_N.jpg
+    try:
+        return int(Path(name).stem.split("_")[-1])
+    except ValueError:
+        return 0
+
+
+class SampleCatalog:
+    """
+    Incrementally maintained index of sample images.
+
+    Args:
+        base_dir: The sample_data directory
+        poll_interval: Minimum seconds between directory checks
+        thumbnail_width: Width requested by the precomputed thumbnail URLs
+    """
+
+    def __init__(self, base_dir: Path, poll_interval: float = 2.0, thumbnail_width: int = THUMBNAIL_WIDTH):
+        self.base_dir = Path(base_dir).resolve()
+        self.download_dir = self.base_dir / "downloaded"
+        self.poll_interval = poll_interval
+        self.thumbnail_width = thumbnail_width
+        self._files: Dict[str, FileMeta] = {}  # path relative to base_dir -> metadata
+        self._dir_mtimes: Optional[Tuple[int, int]] = None
+        self._checked_at = 0.0
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> CatalogSnapshot:
+        """Return the current listing, rescanning only if the directories changed."""
+        with self._lock:
+            now = time.monotonic()
+            if self._snapshot is not None and now - self._checked_at < self.poll_interval:
+                return self._snapshot
+            self._checked_at = now
+            dir_mtimes = (self._dir_mtime(self.base_dir), self._dir_mtime(self.download_dir))
+            if self._snapshot is None or dir_mtimes != self._dir_mtimes:
+                self._dir_mtimes = dir_mtimes
+                self._snapshot = self._rebuild()
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Force a directory check on the next snapshot() (e.g. after a download)."""
+        with self._lock:
+            self._checked_at = 0.0
+            self._dir_mtimes = None
+
+    def content_hash(self, path: Path) -> str:
+        """SHA-256 of a file under base_dir, from the index when it is current."""
+        path = Path(path)
+        stat = path.stat()
+        try:
+            rel = path.relative_to(self.base_dir).as_posix()
+        except ValueError:
+            rel = None
+        meta = self._files.get(rel) if rel else None
+        if meta is not None and meta.mtime_ns == stat.st_mtime_ns and meta.size == stat.st_size:
+            return meta.sha256
+        return file_sha256(path)
+
+    @staticmethod
+    def _dir_mtime(path: Path) -> int:
+        try:
+            return path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def _rebuild(self) -> CatalogSnapshot:
+        current: Dict[str, FileMeta] = {}
+
+        for sample in CURATED_SAMPLES:
+            rel = sample["path"].split("/", 1)[1]
+            self._index(rel, current)
+
+        downloaded: List[str] = []
+        if self.download_dir.exists():
+            with os.scandir(self.download_dir) as it:
+                for entry in it:
+                    if entry.name.startswith(".") or not entry.name.endswith(".jpg") or not entry.is_file():
+                        continue
+                    rel = f"downloaded/{entry.name}"
+                    if self._index(rel, current, entry.stat()):
+                        downloaded.append(entry.name)
+        # Sort by integer number in filename (sample_N.jpg)
+        downloaded.sort(key=_sample_num)
+
+        rehashed = sum(1 for rel, meta in current.items() if self._files.get(rel) is not meta)
+        self._files = current
+
+        samples = [self._entry(s["name"], s["path"], None) for s in CURATED_SAMPLES]
+        samples.extend(
+            self._entry(f"Internet Sample {i+1}", f"sample_data/downloaded/{name}", "downloaded")
+            for i, name in enumerate(downloaded)
+        )
+
+        etag_source = hashlib.sha256()
+        for sample in samples:
+            etag_source.update(f"{sample['path']}:{sample.get('sha256')}\n".encode())
+        last_modified = max((m.mtime_ns for m in current.values()), default=0) / 1e9
+
+        logger.info(f"Sample catalog rebuilt: {len(samples)} samples, {rehashed} files (re)indexed")
+        return CatalogSnapshot(
+            samples=tuple(samples),
+            etag=f'"{etag_source.hexdigest()[:32]}"',
+            last_modified=last_modified or time.time(),
+        )
+
+    def _index(self, rel: str, current: Dict[str, FileMeta], stat: Optional[os.stat_result] = None) -> bool:
+        """Add `rel` to `current`, reusing cached metadata if the file is unchanged."""
+        path = self.base_dir / rel
+        try:
+            stat = stat or path.stat()
+        except FileNotFoundError:
+            return False
+        meta = self._files.get(rel)
+        if meta is None or meta.mtime_ns != stat.st_mtime_ns or meta.size != stat.st_size:
+            try:
+                meta = describe_file(path, stat)
+            except OSError as e:
+                logger.warning(f"Skipping unreadable sample {path}: {e}")
+                return False
+        current[rel] = meta
+        return True
+
+    def _entry(self, name: str, path: str, sample_type: Optional[str]) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"name": name, "path": path}
+        if sample_type:
+            entry["type"] = sample_type
+        meta = self._files.get(path.split("/", 1)[1])
+        if meta is not None:
+            entry.update(
+                size=meta.size,
+                width=meta.width,
+                height=meta.height,
+                sha256=meta.sha256,
+                thumbnail=f"{path}?w={self.thumbnail_width}",
+            )
+        return entry
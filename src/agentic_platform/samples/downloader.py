@@ -0,0 +1,199 @@
+"""
+Concurrent downloader for internet sample images.
+
+Images are fetched with a shared httpx.AsyncClient: at most `concurrency`
+downloads are in flight, requests to the same host are spaced at least
+`per_host_interval` seconds apart, and bodies are streamed to disk. Each
+item falls back to Picsum on its own if LoremFlickr fails, so one slow or
+broken image never holds up the rest of the batch.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36"
+)
+
+# Called with (completed, total, succeeded, failed) after every item
+ProgressCallback = Callable[[int, int, int, int], None]
+
+
+@dataclass
+class DownloadedSample:
+    """A sample image written to the download directory."""
+    name: str
+    path: str
+    type: str = "downloaded"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class HostRateLimiter:
+    """
+    Spaces request starts to the same host at least `min_interval` apart.
+
+    Slots are reserved under a lock and then awaited outside it, so waiting
+    for one host never delays requests to another.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._next_slot: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, host: str) -> None:
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class SampleDownloader:
+    """
+    Downloads `count` sample images into `download_dir` as sample_N.jpg.
+
+    Args:
+        download_dir: Directory the images are written to
+        concurrency: Maximum number of downloads in flight
+        per_host_interval: Minimum seconds between requests to one host
+        timeout: Per-request timeout in seconds
+        transport: Optional httpx transport (used by tests)
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        download_dir: Path,
+        concurrency: int = 8,
+        per_host_interval: float = 0.2,
+        timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.download_dir = Path(download_dir)
+        self.concurrency = max(1, concurrency)
+        self.per_host_interval = per_host_interval
+        self.timeout = timeout
+        self.transport = transport
+
+    async def download(
+        self,
+        count: int,
+        keywords: str,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Download the batch and return the samples that succeeded, in order.
+
+        Items that fail on both sources are logged and left out.
+        """
+        self.download_dir.mkdir(parents=True, exist_ok=True)
+        keyword_list = [k.strip() for k in keywords.split(",") if k.strip()] or ["document"]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limiter = HostRateLimiter(self.per_host_interval)
+        completed = succeeded = failed = 0
+
+        logger.info(
+            f"Starting download of {count} samples with keywords: {keywords} "
+            f"(concurrency={self.concurrency})"
+        )
+
+        # verify=False matches the previous urllib behaviour (self-signed dev proxies)
+        async with httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            timeout=self.timeout,
+            follow_redirects=True,
+            verify=False,
+            transport=self.transport,
+            limits=httpx.Limits(max_connections=self.concurrency),
+        ) as client:
+
+            async def run_item(i: int) -> Optional[DownloadedSample]:
+                nonlocal completed, succeeded, failed
+                async with semaphore:
+                    sample = await self._download_item(client, limiter, i, keyword_list[i % len(keyword_list)])
+                completed += 1
+                if sample is None:
+                    failed += 1
+                else:
+                    succeeded += 1
+                if on_progress is not None:
+                    on_progress(completed, count, succeeded, failed)
+                return sample
+
+            results = await asyncio.gather(*(run_item(i) for i in range(count)))
+
+        logger.info(f"Downloaded {succeeded}/{count} samples ({failed} failed)")
+        return [sample.to_dict() for sample in results if sample is not None]
+
+    async def _download_item(
+        self,
+        client: httpx.AsyncClient,
+        limiter: HostRateLimiter,
+        i: int,
+        keyword: str,
+    ) -> Optional[DownloadedSample]:
+        filename = f"sample_{i+1}.jpg"
+        file_path = self.download_dir / filename
+
+        # Use random lock + timestamp to defeat aggressive caching
+        lock_id = random.randint(1, 100000)
+        timestamp = int(time.time() * 1000)
+        url = f"https://loremflickr.com/600/800/{keyword}?lock={lock_id}&v={timestamp}"
+        try:
+            await self._fetch(client, limiter, url, file_path)
+            return DownloadedSample(
+                name=f"Internet Sample {i+1} ({keyword})",
+                path=f"sample_data/downloaded/{filename}",
+            )
+        except Exception as e:
+            logger.error(f"LoremFlickr failed for {i}: {e}. Trying fallback.")
+
+        fallback_url = f"https://picsum.photos/600/800?random={i}"
+        try:
+            await self._fetch(client, limiter, fallback_url, file_path)
+            return DownloadedSample(
+                name=f"Random Sample {i+1}",
+                path=f"sample_data/downloaded/{filename}",
+            )
+        except Exception as e:
+            logger.error(f"Fallback failed too for {i}: {e}")
+            return None
+
+    async def _fetch(
+        self,
+        client: httpx.AsyncClient,
+        limiter: HostRateLimiter,
+        url: str,
+        file_path: Path,
+    ) -> None:
+        """Stream `url` into `file_path` via a temp file, so readers never see partial images."""
+        await limiter.wait(urlsplit(url).netloc)
+        tmp_path = file_path.with_name(f".{file_path.name}.part")
+        try:
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                with open(tmp_path, "wb") as out_file:
+                    async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
+                        out_file.write(chunk)
+            os.replace(tmp_path, file_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
@@ -0,0 +1,120 @@
+"""
+Content-addressed cache of downscaled sample images.
+
+Resized images are stored as <cache_dir>/<sha[:2]>/<sha>_<w>x<h>.jpg, where
+sha is the SHA-256 of the original, so identical originals share their
+renditions and a replaced original can never serve a stale one. An
+in-memory index maps (path, mtime, size, w, h) to the cached file, so a
+repeated request only stats the original and never reads it.
+"""
+
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Hashable, Optional
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from .catalog import file_sha256
+
+logger = logging.getLogger(__name__)
+
+MAX_DIMENSION = 2048
+
+
+@dataclass(frozen=True)
+class Rendition:
+    """A cached resized image and the content hash it was derived from."""
+    path: Path
+    sha256: str
+    width: int
+    height: int
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.sha256[:32]}-{self.width}x{self.height}"'
+
+
+class ThumbnailCache:
+    """
+    Generates and caches resized JPEG renditions of images on disk.
+
+    Args:
+        cache_dir: Directory for the content-addressed renditions
+        content_hash: Returns the SHA-256 of an original (defaults to hashing
+            the file; the API passes the sample catalog's precomputed hashes)
+        quality: JPEG quality of the renditions
+        max_index_entries: Size of the in-memory (path, mtime, size) index
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        content_hash: Optional[Callable[[Path], str]] = None,
+        quality: int = 80,
+        max_index_entries: int = 4096,
+    ):
+        if Image is None:
+            raise ImportError("Pillow is required for thumbnails. Install with: pip install Pillow")
+        self.cache_dir = Path(cache_dir)
+        self.content_hash = content_hash or file_sha256
+        self.quality = quality
+        self.max_index_entries = max_index_entries
+        self._index: "OrderedDict[Hashable, Rendition]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, source: Path, width: Optional[int] = None, height: Optional[int] = None) -> Rendition:
+        """
+        Return a rendition of `source` that fits in width x height.
+
+        Either bound may be omitted; the aspect ratio is always preserved and
+        images are never upscaled.
+        """
+        width = min(width or 0, MAX_DIMENSION)
+        height = min(height or 0, MAX_DIMENSION)
+        stat = source.stat()
+        key = (str(source), stat.st_mtime_ns, stat.st_size, width, height)
+
+        with self._lock:
+            rendition = self._index.get(key)
+            if rendition is not None:
+                self._index.move_to_end(key)
+        if rendition is not None and rendition.path.exists():
+            return rendition
+
+        sha = self.content_hash(source)
+        target = self.cache_dir / sha[:2] / f"{sha}_{width}x{height}.jpg"
+        if not target.exists():
+            self._render(source, target, width, height)
+        rendition = Rendition(target, sha, width, height)
+
+        with self._lock:
+            self._index[key] = rendition
+            while len(self._index) > self.max_index_entries:
+                self._index.popitem(last=False)
+        return rendition
+
+    def _render(self, source: Path, target: Path, width: int, height: int) -> None:
+        bound = (width or MAX_DIMENSION, height or MAX_DIMENSION)
+        with Image.open(source) as img:
+            # Let the JPEG decoder downscale while decoding instead of after
+            img.draft("RGB", bound)
+            img = img.convert("RGB")
+            img.thumbnail(bound)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Concurrent renders of the same key each write their own temp file
+            tmp_path = target.with_name(f".{target.name}.{uuid.uuid4().hex}")
+            try:
+                img.save(tmp_path, "JPEG", quality=self.quality, optimize=True)
+                os.replace(tmp_path, target)
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+        logger.info(f"Rendered {target.name} from {source}")
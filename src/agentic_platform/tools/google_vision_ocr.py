@@ -1,108 +1,218 @@
+import asyncio
 import os
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
 from google.cloud import vision
-from google.oauth2 import service_account
+
+from .ocr_confidence import confidence_stats, positive_confidences
+from .vision_client_pool import VisionClientPool, vision_client_pool
 
 logger = logging.getLogger(__name__)
 
+# Demo fallback text for the bundled sample images
+SAMPLE_MOCKS = {
+    "letter.jpg": "Dear John,\n\nI hope this letter finds you well. I wanted to follow up on our last conversation regarding the agentic platform. It seems everything is coming together nicely.\n\nBest,\nManish",
+    "handwriting.jpg": "Hello World!\nThis is a handwriting sample.\nOCR should be able to read this.",
+    "numbers_gs150.jpg": "Invoice #12345\nDate: 2026-02-03\nTotal: $1,250.00\nTax: $100.00\nGrand Total: $1,350.00",
+    "ocr_sample_text.png": "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG.\n1234567890\n!@#$%^&*()",
+    "sample_image.png": "This is a basic sample image with some text on it.",
+    "ocr_sample_image.png": "Generic Sample Text from PNG file.\nLine 2 of the sample.",
+    "stock_gs200.jpg": "Stock Performance Report\nQ1 2026\nRevenue Up: 15%\nEBITDA: +20%",
+    "ocr_sample_plaid.jpg": "Plaid Pattern Analysis:\nHorizontal Frequency: 1.2\nVertical Frequency: 1.1\nColor Palette: #4A90E2, #50E3C2"
+}
+
+# Images per batch_annotate_images request (Vision API limit)
+MAX_BATCH_SIZE = 16
+
+
+def _symbols(response) -> Iterable[Tuple[str, Optional[float]]]:
+    """(text, confidence) of every symbol in the full text annotation."""
+    return (
+        (symbol.text, symbol.confidence)
+        for page in response.full_text_annotation.pages
+        for block in page.blocks
+        for paragraph in block.paragraphs
+        for word in paragraph.words
+        for symbol in word.symbols
+    )
+
+
 class GoogleVisionOCR:
-    def __init__(self, credentials_json: str = None):
-        try:
-            if credentials_json:
-                credentials = service_account.Credentials.from_service_account_file(credentials_json)
-                self.client = vision.ImageAnnotatorClient(credentials=credentials)
-            else:
-                self.client = vision.ImageAnnotatorClient()
-        except Exception as e:
-            logger.warning(f"Failed to initialize Google Vision client: {e}")
-            self.client = None
+    """
+    Google Cloud Vision text detection.
 
-    def ocr_image(self, image_path: str) -> Dict[str, Any]:
-        # Demo Mock Fallback: if actual OCR fails or client is missing, provide sample data
-        sample_mocks = {
-            "letter.jpg": "Dear John,\n\nI hope this letter finds you well. I wanted to follow up on our last conversation regarding the agentic platform. It seems everything is coming together nicely.\n\nBest,\nManish",
-            "handwriting.jpg": "Hello World!\nThis is a handwriting sample.\nOCR should be able to read this.",
-            "numbers_gs150.jpg": "Invoice #12345\nDate: 2026-02-03\nTotal: $1,250.00\nTax: $100.00\nGrand Total: $1,350.00",
-            "ocr_sample_text.png": "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG.\n1234567890\n!@#$%^&*()",
-            "sample_image.png": "This is a basic sample image with some text on it.",
-            "ocr_sample_image.png": "Generic Sample Text from PNG file.\nLine 2 of the sample.",
-            "stock_gs200.jpg": "Stock Performance Report\nQ1 2026\nRevenue Up: 15%\nEBITDA: +20%",
-            "ocr_sample_plaid.jpg": "Plaid Pattern Analysis:\nHorizontal Frequency: 1.2\nVertical Frequency: 1.1\nColor Palette: #4A90E2, #50E3C2"
-        }
+    Clients come from a VisionClientPool, so instances are cheap to create
+    and share one warm gRPC channel per credential set.
+    """
+
+    def __init__(self, credentials_json: str = None, pool: VisionClientPool = None):
+        self.credentials_json = credentials_json
+        self.pool = pool or vision_client_pool
+        # Warm the channel now rather than on the first OCR call
+        self.client
+
+    @property
+    def client(self):
+        """The pooled ImageAnnotatorClient, or None if it could not be created."""
+        return self.pool.get(vision.ImageAnnotatorClient, self.credentials_json)
 
+    def ocr_image(self, image_path: str) -> Dict[str, Any]:
+        """OCR an image file on disk."""
+        filename = os.path.basename(image_path)
+        client = self.client
+        if client is None:
+            return self._client_missing_result(filename)
         try:
-            filename = os.path.basename(image_path)
-            
-            # If client is missing, try mock first
-            if self.client is None:
-                if filename in sample_mocks:
-                    logger.info(f"Using mock OCR result for sample: {filename}")
-                    return {"text": sample_mocks[filename], "confidence": 0.98, "mock": True}
-                return {"text": "", "confidence": 0.0, "error": "Google Vision client not initialized - check credentials"}
             with open(image_path, "rb") as image_file:
                 content = image_file.read()
+        except Exception as e:
+            return self._error_result(filename, e)
+        return self.ocr_bytes(content, filename)
+
+    def ocr_bytes(self, content: bytes, filename: str = "") -> Dict[str, Any]:
+        """
+        OCR an image held in memory.
+
+        `filename` is only used to pick a demo fallback for the bundled samples.
+        """
+        client = self.client
+        if client is None:
+            return self._client_missing_result(filename)
+        try:
             image = vision.Image(content=content)
-            response = self.client.text_detection(image=image)
-            texts = response.text_annotations
-            if not texts:
-                if filename in sample_mocks:
-                    logger.info(f"Actual OCR returned no text for {filename}. Using mock fallback.")
-                    return {"text": sample_mocks[filename], "confidence": 0.98, "mock": True}
-                return {"text": "", "confidence": 0.0}
-            # The first annotation is the full text
-            full_text = texts[0].description
-            
-            # Google Vision text_detection API does not reliably provide confidence
-            # The confidence field on annotations may be 0 or missing
-            # Since Google Vision is highly accurate for text detection, we default to 1.0
-            # unless we can extract a meaningful confidence value
-            
-            confidence = 1.0  # Default for text_detection
-            confidence_source = "default"
-            
-            # Try to get confidence from full annotation (usually 0 or missing for text_detection)
-            full_conf = getattr(texts[0], 'confidence', None)
-            if full_conf is not None and full_conf > 0:
-                confidence = float(full_conf)
-                confidence_source = "full_text_annotation"
-                logger.info(f"Using full text annotation confidence: {confidence}")
-            
-            # Try to get confidence from individual symbols
-            if confidence == 1.0 and len(texts) > 1:
-                symbol_confidences = []
-                for i, text in enumerate(texts[1:], 1):
-                    conf = getattr(text, 'confidence', None)
-                    if conf is not None and conf > 0:
-                        symbol_confidences.append(float(conf))
-                        logger.debug(f"Symbol {i}: confidence={conf}")
-                
-                if symbol_confidences:
-                    confidence = sum(symbol_confidences) / len(symbol_confidences)
-                    confidence_source = f"avg_of_{len(symbol_confidences)}_symbols"
-                    logger.info(f"Calculated confidence from {len(symbol_confidences)} symbols: {confidence:.4f}")
+            response = client.text_detection(image=image)
+            return self._parse_response(response, filename)
+        except Exception as e:
+            return self._error_result(filename, e)
+
+    async def aocr_bytes(self, content: bytes, filename: str = "") -> Dict[str, Any]:
+        """
+        OCR an in-memory image without blocking the event loop.
+
+        Uses the pooled ImageAnnotatorAsyncClient for the running loop, so
+        concurrent calls multiplex over one gRPC channel.
+        """
+        client = self.pool.get(
+            vision.ImageAnnotatorAsyncClient, self.credentials_json, loop=asyncio.get_running_loop()
+        )
+        if client is None:
+            return self._client_missing_result(filename)
+        try:
+            request = vision.AnnotateImageRequest(
+                image=vision.Image(content=content),
+                features=[vision.Feature(type_=vision.Feature.Type.TEXT_DETECTION)],
+            )
+            batch = await client.batch_annotate_images(requests=[request])
+            response = batch.responses[0]
+            if response.error.message:
+                raise RuntimeError(response.error.message)
+            return self._parse_response(response, filename)
+        except Exception as e:
+            return self._error_result(filename, e)
+
+    def ocr_batch_bytes(self, items: Sequence[Tuple[bytes, str]]) -> List[Dict[str, Any]]:
+        """
+        OCR many in-memory images with batch_annotate_images.
+
+        Sends up to MAX_BATCH_SIZE images per request. Returns one result per
+        (content, filename) item, in order. A failed request or image only
+        produces error results for the images it covers.
+        """
+        client = self.client
+        if client is None:
+            return [self._client_missing_result(filename) for _, filename in items]
+        feature = vision.Feature(type_=vision.Feature.Type.TEXT_DETECTION)
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(items), MAX_BATCH_SIZE):
+            chunk = items[start:start + MAX_BATCH_SIZE]
+            requests = [
+                vision.AnnotateImageRequest(image=vision.Image(content=content), features=[feature])
+                for content, _ in chunk
+            ]
+            try:
+                batch = client.batch_annotate_images(requests=requests)
+            except Exception as e:
+                results.extend(self._error_result(filename, e) for _, filename in chunk)
+                continue
+            for (_, filename), response in zip(chunk, batch.responses):
+                if response.error.message:
+                    results.append(self._error_result(filename, RuntimeError(response.error.message)))
+                    continue
+                try:
+                    results.append(self._parse_response(response, filename))
+                except Exception as e:
+                    results.append(self._error_result(filename, e))
+        return results
+
+    def _parse_response(self, response, filename: str) -> Dict[str, Any]:
+        """Extract text and confidence from an AnnotateImageResponse."""
+        texts = response.text_annotations
+        if not texts:
+            if filename in SAMPLE_MOCKS:
+                logger.info(f"Actual OCR returned no text for {filename}. Using mock fallback.")
+                return {"text": SAMPLE_MOCKS[filename], "confidence": 0.98, "mock": True}
+            return {"text": "", "confidence": 0.0}
+        # The first annotation is the full text
+        full_text = texts[0].description
+
+        # Google Vision text_detection API does not reliably provide confidence
+        # The confidence field on annotations may be 0 or missing
+        # Since Google Vision is highly accurate for text detection, we default to 1.0
+        # unless we can extract a meaningful confidence value
+        confidence = 1.0  # Default for text_detection
+        confidence_source = "default"
+        stats = None
+
+        # Try to get confidence from full annotation (usually 0 or missing for text_detection)
+        full_conf = getattr(texts[0], 'confidence', None)
+        if full_conf is not None and full_conf > 0:
+            confidence = float(full_conf)
+            confidence_source = "full_text_annotation"
+        elif len(texts) > 1:
+            # Word annotations first, then the symbols of the full text annotation
+            labels, values = positive_confidences(
+                (t.description, getattr(t, 'confidence', None)) for t in texts[1:]
+            )
+            if not values.size:
+                labels, values = positive_confidences(_symbols(response))
+            if values.size:
+                stats = confidence_stats(labels, values)
+                confidence = stats["mean"]
+                confidence_source = f"avg_of_{values.size}_symbols"
+            else:
+                # For complex layouts with many symbols but no confidence data,
+                # use text extraction completeness as fallback metric
+                total_symbols = len(texts) - 1
+                if total_symbols > 150:
+                    # Complex document (table, form, etc.) - more difficult for OCR
+                    # But if text extracted, Google Vision succeeded, so higher confidence
+                    confidence = 0.95  # Slightly reduced from 1.0 for complex layouts
+                    confidence_source = f"complex_layout_{total_symbols}_symbols"
                 else:
-                    # For complex layouts with many symbols but no confidence data,
-                    # use text extraction completeness as fallback metric
-                    total_symbols = len(texts) - 1
-                    if total_symbols > 150:
-                        # Complex document (table, form, etc.) - more difficult for OCR
-                        # But if text extracted, Google Vision succeeded, so higher confidence
-                        confidence = 0.95  # Slightly reduced from 1.0 for complex layouts
-                        confidence_source = f"complex_layout_{total_symbols}_symbols"
-                        logger.info(f"Complex layout detected ({total_symbols} symbols, 0 confidence scores). Using {confidence} for difficulty factor.")
-                    else:
-                        confidence_source = f"default_simple_layout"
-                        logger.debug(f"No positive confidence values from {total_symbols} symbols, using default")
-            
-            # Ensure confidence is a float and within valid range [0.0, 1.0]
-            confidence = float(max(0.0, min(1.0, confidence)))
+                    confidence_source = "default_simple_layout"
+
+        # Ensure confidence is a float and within valid range [0.0, 1.0]
+        confidence = float(max(0.0, min(1.0, confidence)))
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Final confidence: {confidence:.4f} (source: {confidence_source})")
-            
-            return {"text": full_text, "confidence": confidence}
-        except Exception as e:
-            if filename in sample_mocks:
-                logger.info(f"OCR API call failed for {filename} ({e}). Using mock fallback.")
-                return {"text": sample_mocks[filename], "confidence": 0.98, "mock": True}
-            logger.error(f"Google Vision OCR failed: {str(e)}", exc_info=True)
-            return {"text": "", "confidence": 0.0, "error": str(e)}
+
+        result = {"text": full_text, "confidence": confidence}
+        if stats is not None:
+            result["confidence_stats"] = stats
+        return result
+
+    def _client_missing_result(self, filename: str) -> Dict[str, Any]:
+        # Demo Mock Fallback: if the client is missing, provide sample data
+        if filename in SAMPLE_MOCKS:
+            logger.info(f"Using mock OCR result for sample: {filename}")
+            return {"text": SAMPLE_MOCKS[filename], "confidence": 0.98, "mock": True}
+        return {"text": "", "confidence": 0.0, "error": "Google Vision client not initialized - check credentials"}
+
+    def _error_result(self, filename: str, e: Exception) -> Dict[str, Any]:
+        # Demo Mock Fallback: if actual OCR fails, provide sample data
+        if filename in SAMPLE_MOCKS:
+            logger.info(f"OCR API call failed for {filename} ({e}). Using mock fallback.")
+            return {"text": SAMPLE_MOCKS[filename], "confidence": 0.98, "mock": True}
+        logger.error(f"Google Vision OCR failed: {str(e)}", exc_info=True)
+        return {"text": "", "confidence": 0.0, "error": str(e)}
@@ -0,0 +1,61 @@
+"""
+Summary statistics over per-symbol OCR confidences.
+
+Shared by the OCR providers so every one reports `confidence_stats` in the
+same shape.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Symbols below this confidence are reported as low-confidence spans
+LOW_CONFIDENCE_THRESHOLD = 0.6
+MAX_LOW_CONFIDENCE_SPANS = 20
+
+
+def positive_confidences(items: Iterable[Tuple[str, Optional[float]]]) -> Tuple[List[str], np.ndarray]:
+    """Keep the items that carry a confidence; 0 means the API gave none."""
+    labels, values = [], []
+    for label, conf in items:
+        if conf:
+            labels.append(label)
+            values.append(conf)
+    return labels, np.asarray(values, dtype=np.float64)
+
+
+def confidence_stats(
+    labels: Sequence[str],
+    values: np.ndarray,
+    low_threshold: float = LOW_CONFIDENCE_THRESHOLD,
+) -> Dict[str, Any]:
+    """
+    Summarize per-symbol confidences.
+
+    Returns count, min, mean and the 10th/50th/90th percentiles, plus the
+    runs of consecutive symbols below `low_threshold` (by index into
+    `labels`) so callers can point at the unreliable parts of the text.
+    """
+    p10, p50, p90 = np.percentile(values, [10, 50, 90])
+    low = values < low_threshold
+    # Run boundaries are where the padded mask flips
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], low, [False])).astype(np.int8)))
+    spans = [
+        {
+            "start": int(start),
+            "end": int(end),
+            "text": " ".join(str(label) for label in labels[start:end]),
+            "confidence": round(float(values[start:end].mean()), 4),
+        }
+        for start, end in zip(edges[::2][:MAX_LOW_CONFIDENCE_SPANS], edges[1::2])
+    ]
+    return {
+        "count": int(values.size),
+        "min": float(values.min()),
+        "mean": float(values.mean()),
+        "p10": float(p10),
+        "p50": float(p50),
+        "p90": float(p90),
+        "low_confidence_threshold": low_threshold,
+        "low_confidence_count": int(low.sum()),
+        "low_confidence_spans": spans,
+    }
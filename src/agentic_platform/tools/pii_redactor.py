@@ -1,24 +1,139 @@
 """
 PII Redaction utility for audit logs and workflow artifacts.
+
+All patterns are compiled into one alternation of named groups, so text is
+scanned once whatever the number of PII kinds; the group that matched names
+the replacement. Two things keep that scan cheap with Python's regex
+engine, which tries every branch at every position:
+
+- a shared leading assertion (`prefix`) rejects positions where no pattern
+  can start (inside a word, for the defaults) with a single check;
+- a pattern may name a literal every match contains (`"@"` for emails).
+  Literals are looked for with a plain substring search first, and
+  patterns whose literal is absent are left out of the scan (the Aho-Corasick
+  half of a literal + regex hybrid, with one literal per pattern).
+
+Structured values (dicts, lists, tuples, audit event dataclasses) are
+walked recursively and copied only along paths where something was
+redacted: a clean event comes back as the very same object.
+
+Streams are redacted chunk by chunk. Patterns never match whitespace, so
+text up to the last whitespace of the buffer can be redacted and emitted
+without splitting a match; only the trailing partial token is held back.
 """
+import dataclasses
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+# Kind -> regex, or (regex, literal every match contains). Patterns must not
+# contain capturing groups (use (?:...)) and must not match whitespace (see
+# redact_stream). Order sets priority when two could match at one position.
+DEFAULT_PATTERNS: Dict[str, Union[str, Tuple[str, str]]] = {
+    "EMAIL": (r"(?<![.+-])[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", "@"),
+    "PHONE": r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b",
+}
+# Neither default can start right after an ASCII word character
+DEFAULT_PREFIX = r"(?<![a-zA-Z0-9_])"
+
+_WHITESPACE = " \n\t\r\f\v"
+
 
 class PiiRedactor:
     EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
     PHONE_PATTERN = re.compile(r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b")
 
+    def __init__(self, patterns: Optional[Dict[str, Union[str, Tuple[str, str]]]] = None,
+                 prefix: Optional[str] = None, max_token: int = 4096):
+        """
+        Args:
+            patterns: Kind -> regex or (regex, required literal); default DEFAULT_PATTERNS
+            prefix: Assertion every match must satisfy at its start (default: DEFAULT_PREFIX
+                for the default patterns, none for custom ones)
+            max_token: Longest run without whitespace redact_stream holds back before emitting
+        """
+        if patterns is None:
+            patterns = DEFAULT_PATTERNS
+            prefix = DEFAULT_PREFIX if prefix is None else prefix
+        self._patterns = [(kind, *(spec if isinstance(spec, tuple) else (spec, None)))
+                          for kind, spec in patterns.items()]
+        self._prefix = prefix or ""
+        self._triggers = [literal for _, _, literal in self._patterns if literal]
+        self._compiled: Dict[Tuple[str, ...], Optional["re.Pattern"]] = {}
+        self._replacements = {kind: f"<REDACTED:{kind}>" for kind in patterns}
+        self.pattern = self._scanner(tuple(self._triggers))
+        self.max_token = max_token
+
+    def _scanner(self, present: Tuple[str, ...]) -> Optional["re.Pattern"]:
+        """The combined regex of the patterns applicable when only `present` literals occur."""
+        scanner = self._compiled.get(present, False)
+        if scanner is False:
+            branches = [f"(?P<{kind}>{regex})" for kind, regex, literal in self._patterns
+                        if literal is None or literal in present]
+            scanner = re.compile(f"{self._prefix}(?:{'|'.join(branches)})") if branches else None
+            self._compiled[present] = scanner
+        return scanner
+
+    def _replace(self, match: "re.Match") -> str:
+        return self._replacements[match.lastgroup]
+
     def redact(self, text: str) -> str:
-        text = self.EMAIL_PATTERN.sub("<REDACTED:EMAIL>", text)
-        text = self.PHONE_PATTERN.sub("<REDACTED:PHONE>", text)
-        return text
-
-    def redact_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
-        # Redact all string values in the event dict
-        redacted = {}
-        for k, v in event.items():
-            if isinstance(v, str):
-                redacted[k] = self.redact(v)
-            else:
-                redacted[k] = v
-        return redacted
+        if not text:
+            return text
+        scanner = self._scanner(tuple(t for t in self._triggers if t in text))
+        # re.sub hands back the input object itself when nothing matched
+        return scanner.sub(self._replace, text) if scanner is not None else text
+
+    def redact_value(self, value: Any) -> Any:
+        """Redact every string inside `value`; untouched subtrees are returned as-is."""
+        if isinstance(value, str):
+            return self.redact(value)
+        if isinstance(value, dict):
+            changed = None
+            for k, v in value.items():
+                r = self.redact_value(v)
+                if r is not v:
+                    if changed is None:
+                        changed = dict(value)
+                    changed[k] = r
+            return value if changed is None else changed
+        if isinstance(value, (list, tuple)):
+            changed = None
+            for i, v in enumerate(value):
+                r = self.redact_value(v)
+                if r is not v:
+                    if changed is None:
+                        changed = list(value)
+                    changed[i] = r
+            if changed is None:
+                return value
+            return changed if isinstance(value, list) else type(value)(changed)
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            updates = {}
+            for field in dataclasses.fields(value):
+                v = getattr(value, field.name)
+                r = self.redact_value(v)
+                if r is not v:
+                    updates[field.name] = r
+            return dataclasses.replace(value, **updates) if updates else value
+        return value
+
+    def redact_event(self, event: Any) -> Any:
+        # Redact all string values in the event (dict or event dataclass), at any depth
+        return self.redact_value(event)
+
+    def redact_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Redact text arriving in chunks; matches spanning chunk boundaries are still caught."""
+        pending = ""
+        for chunk in chunks:
+            if not chunk:
+                continue
+            pending += chunk
+            cut = max(pending.rfind(c) for c in _WHITESPACE) + 1
+            if cut == 0 and len(pending) > self.max_token:
+                # No whitespace for too long: emit anyway rather than buffer without bound
+                cut = len(pending) - self.max_token
+            if cut:
+                yield self.redact(pending[:cut])
+                pending = pending[cut:]
+        if pending:
+            yield self.redact(pending)
@@ -1,6 +1,7 @@
 from typing import Callable, Dict, Any, List, Optional
 import jsonschema
 from ..core.trace import add_trace_step
+from ..core.blobs import blob_store, is_blob_ref
 
 class ToolSpec:
     """Specification for a callable tool with schema validation."""
@@ -36,7 +37,7 @@ class ToolRegistry:
         ocr_schema = {
             "type": "object",
             "properties": {
-                "image_path": {"type": "string", "description": "Path to the image file to OCR."},
+                "image_path": {"type": "string", "description": "Path to the image file to OCR, or a mem:// reference to an in-memory upload."},
                 "credentials_json": {"type": "string", "description": "Path to Google credentials JSON file.", "default": None}
             },
             "required": ["image_path"]
@@ -47,7 +48,12 @@ class ToolRegistry:
         
         def google_vision_ocr_handler(args):
             provider = get_ocr_provider(credentials_json=args.get("credentials_json"))
-            return provider.ocr_image(args["image_path"])
+            image_path = args["image_path"]
+            # In-memory uploads arrive as mem:// references (see core.blobs)
+            if is_blob_ref(image_path):
+                content, filename = blob_store.get(image_path)
+                return provider.ocr_bytes(content, filename)
+            return provider.ocr_image(image_path)
             
         self.register_tool(
             "google_vision_ocr",
@@ -203,19 +209,29 @@ class ToolRegistry:
         search_schema = {
             "type": "object",
             "properties": {
-                "query": {"type": "string", "description": "The search query."}
+                "query": {"type": "string", "description": "The search query."},
+                "queries": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Several search queries, answered together in one request."
+                }
             },
-            "required": ["query"]
+            "anyOf": [{"required": ["query"]}, {"required": ["queries"]}]
         }
         
         # Use Factory to get the configured provider (dynamically resolves tenant)
         from ..integrations.factory import get_knowledge_base_provider
+        from ..integrations.knowledge_base import format_hits
         
         def search_handler(args):
-            query = args.get("query", "")
             # Factory handles context resolution automatically now
             provider = get_knowledge_base_provider() 
-            return provider.search(query)
+            queries = args.get("queries")
+            if not queries:
+                return provider.search(args.get("query", ""))
+            # Multi-query plans cost one provider round trip instead of one per query
+            results = provider.search_many(queries)
+            return "\n\n".join(format_hits(q, hits) for q, hits in zip(queries, results))
                 
         self.register_tool(
             "search_knowledge_base",
@@ -0,0 +1,199 @@
+"""
+Shared pool of Google Vision clients.
+
+Creating an ImageAnnotatorClient opens a gRPC channel (and, without explicit
+credentials, runs Application Default Credentials discovery), which costs
+far more than OCR of a small image. The pool keeps one warm client per
+(client class, credential set) and closes clients that have been idle for
+`idle_timeout` seconds, or beyond `max_entries` (least recently used
+first). Credential files are keyed by the SHA-256 of their contents, so a
+rotated key gets a fresh channel while per-request copies of one key (e.g.
+/run-ocr/ uploads written to temp files) share a client. Clients are built
+outside the pool lock, under a per-key lock, so slow credential discovery
+for one set does not block the others.
+
+Async clients (ImageAnnotatorAsyncClient) are bound to the event loop that
+created their channel, so they are additionally keyed by loop.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from google.oauth2 import service_account
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PoolEntry:
+    client: Any
+    created_at: float
+    last_used: float
+    loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+class _Build:
+    """Per-key build lock, shared by every caller waiting on that key."""
+    __slots__ = ("lock", "waiters")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.waiters = 0
+
+
+class VisionClientPool:
+    """
+    Thread-safe pool of Vision clients keyed by credential set.
+
+    Args:
+        idle_timeout: Seconds after which an unused client is closed
+        failure_ttl: Seconds a failed client construction is remembered, so
+            missing credentials are not rediscovered on every request
+        max_entries: Clients (open channels) kept at most
+    """
+
+    def __init__(self, idle_timeout: float = 300.0, failure_ttl: float = 60.0, max_entries: int = 32):
+        self.idle_timeout = idle_timeout
+        self.failure_ttl = failure_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, _PoolEntry]" = OrderedDict()
+        self._building: Dict[Hashable, _Build] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def get(
+        self,
+        client_cls: Callable[..., Any],
+        credentials_json: Optional[str] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> Optional[Any]:
+        """
+        Return a warm client, creating it on first use.
+
+        Pass the running `loop` for async clients. Returns None if the client
+        cannot be constructed (e.g. no credentials).
+        """
+        key = (*self._key(client_cls, credentials_json), id(loop) if loop is not None else None)
+        evicted: List[_PoolEntry] = []
+        try:
+            with self._lock:
+                evicted = self._evict_idle(time.monotonic())
+                found, client = self._lookup(key)
+                if found:
+                    return client
+                building = self._building.get(key)
+                if building is None:
+                    building = self._building[key] = _Build()
+                building.waiters += 1
+
+            try:
+                # Concurrent first requests for one key share one channel
+                with building.lock:
+                    with self._lock:
+                        found, client = self._lookup(key)
+                        if found:
+                            return client
+                    client = self._create(client_cls, credentials_json)
+                    now = time.monotonic()
+                    with self._lock:
+                        if client is not None:
+                            self.created += 1
+                        self._entries[key] = _PoolEntry(client, now, now, loop)
+                        self._entries.move_to_end(key)
+                        while len(self._entries) > self.max_entries:
+                            evicted.append(self._entries.popitem(last=False)[1])
+                    return client
+            finally:
+                with self._lock:
+                    building.waiters -= 1
+                    if building.waiters == 0:
+                        del self._building[key]
+        finally:
+            for entry in evicted:
+                self._close(entry)
+
+    def close(self) -> None:
+        """Close every pooled client."""
+        with self._lock:
+            entries, self._entries = list(self._entries.values()), OrderedDict()
+        for entry in entries:
+            self._close(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"clients": sum(1 for e in self._entries.values() if e.client is not None), "created": self.created}
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Optional[Any]]:
+        """(found, client); failed constructions count as found for `failure_ttl`."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is None or (entry.client is None and now - entry.created_at >= self.failure_ttl):
+            return False, None
+        entry.last_used = now
+        self._entries.move_to_end(key)
+        return True, entry.client
+
+    @staticmethod
+    def _key(client_cls: Callable[..., Any], credentials_json: Optional[str]) -> Hashable:
+        if not credentials_json:
+            return (client_cls, None)
+        try:
+            with open(credentials_json, "rb") as f:
+                return (client_cls, hashlib.sha256(f.read()).hexdigest())
+        except OSError:
+            # Construction will fail too; remembered per path for failure_ttl
+            return (client_cls, os.path.abspath(credentials_json))
+
+    def _create(self, client_cls: Callable[..., Any], credentials_json: Optional[str]) -> Optional[Any]:
+        try:
+            if credentials_json:
+                credentials = service_account.Credentials.from_service_account_file(credentials_json)
+                client = client_cls(credentials=credentials)
+            else:
+                client = client_cls()
+        except Exception as e:
+            logger.warning(f"Failed to initialize Google Vision client: {e}")
+            return None
+        logger.info(f"Created {getattr(client_cls, '__name__', 'Vision client')} "
+                    f"({'service account' if credentials_json else 'default credentials'})")
+        return client
+
+    def _evict_idle(self, now: float) -> List[_PoolEntry]:
+        evicted = []
+        for key, entry in list(self._entries.items()):
+            stale_loop = entry.loop is not None and entry.loop.is_closed()
+            if stale_loop or now - entry.last_used > self.idle_timeout:
+                del self._entries[key]
+                evicted.append(entry)
+        return evicted
+
+    @staticmethod
+    def _close(entry: _PoolEntry) -> None:
+        transport = getattr(entry.client, "transport", None)
+        close = getattr(transport, "close", None)
+        if close is None:
+            return
+        try:
+            result = close()
+            if asyncio.iscoroutine(result):
+                # Async transports close on their own loop
+                if entry.loop is not None and not entry.loop.is_closed():
+                    asyncio.run_coroutine_threadsafe(result, entry.loop)
+                else:
+                    result.close()
+        except Exception as e:
+            logger.debug(f"Error closing Vision client: {e}")
+
+
+# Process-wide pool used by every OCR entry point
+vision_client_pool = VisionClientPool(
+    idle_timeout=float(os.getenv("VISION_CLIENT_IDLE_TIMEOUT", "300")),
+    max_entries=int(os.getenv("VISION_CLIENT_POOL_SIZE", "32"))
+)
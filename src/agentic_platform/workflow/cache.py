@@ -0,0 +1,75 @@
+"""
+LRU cache of compiled workflow definitions.
+
+Workflow files are keyed by path, mtime and size so edits on disk are picked
+up on the next load; uploaded documents are keyed by the SHA-256 of their
+content. A hit skips YAML parsing, validation and compilation entirely.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Union
+
+from .definition import CompiledWorkflow, compile_workflow, parse_workflow_text
+
+
+class WorkflowCache:
+    """Thread-safe, size-bounded LRU of CompiledWorkflow plans."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CompiledWorkflow]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load_file(self, path: str) -> CompiledWorkflow:
+        """Load a workflow file, reparsing only if it changed on disk."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = ("file", path, stat.st_mtime_ns, stat.st_size)
+        plan = self._get(key)
+        if plan is None:
+            with open(path, "rb") as f:
+                plan = compile_workflow(parse_workflow_text(f.read()))
+            self._put(key, plan)
+        return plan
+
+    def load_text(self, content: Union[str, bytes]) -> CompiledWorkflow:
+        """Load an uploaded workflow document, keyed by content hash."""
+        raw = content.encode("utf-8") if isinstance(content, str) else content
+        key = ("sha256", hashlib.sha256(raw).hexdigest())
+        plan = self._get(key)
+        if plan is None:
+            plan = compile_workflow(parse_workflow_text(raw))
+            self._put(key, plan)
+        return plan
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _get(self, key: Hashable):
+        with self._lock:
+            plan = self._entries.get(key)
+            if plan is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return plan
+
+    def _put(self, key: Hashable, plan: CompiledWorkflow) -> None:
+        with self._lock:
+            self._entries[key] = plan
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -1,5 +1,6 @@
 import yaml
-from typing import Any, Dict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
 
 def parse_workflow_yaml(path: str) -> Dict[str, Any]:
     with open(path, "r") as f:
@@ -8,3 +9,49 @@ def parse_workflow_yaml(path: str) -> Dict[str, Any]:
     if "nodes" not in data or "edges" not in data:
         raise ValueError("Invalid workflow YAML: missing nodes or edges")
     return data
+
+def parse_workflow_text(content: Union[str, bytes]) -> Dict[str, Any]:
+    """
+    Parse and validate a workflow YAML document.
+
+    Raises:
+        ValueError: If the document is empty or not a nodes/edges mapping
+    """
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+    data = yaml.safe_load(content)
+    if not data:
+        raise ValueError("Workflow YAML is empty or parses to None")
+    if not isinstance(data, dict):
+        raise ValueError(f"Workflow must be a YAML object/dict, got {type(data).__name__}")
+    if "nodes" not in data or "edges" not in data:
+        raise ValueError(f"Workflow must contain 'nodes' and 'edges' keys. Found keys: {list(data.keys())}")
+    return data
+
+@dataclass(frozen=True)
+class CompiledWorkflow:
+    """
+    Execution plan for a workflow definition.
+
+    Indexes nodes by id and edges by source node so the engine does not
+    rescan the definition on every step. Instances are shared between
+    runs (see WorkflowCache) and must not be mutated.
+    """
+    definition: Dict[str, Any]
+    node_map: Dict[str, Dict[str, Any]]
+    outgoing: Dict[str, List[Dict[str, Any]]]
+    start_node: Optional[Dict[str, Any]]
+
+def compile_workflow(wf_def: Dict[str, Any]) -> CompiledWorkflow:
+    node_map = {n["id"]: n for n in wf_def["nodes"]}
+    outgoing: Dict[str, List[Dict[str, Any]]] = {}
+    for edge in wf_def["edges"]:
+        # Preserve definition order: the first matching unconditional edge wins
+        outgoing.setdefault(edge["from"], []).append(edge)
+    start_node = next((n for n in wf_def["nodes"] if n["type"] == "start"), None)
+    return CompiledWorkflow(
+        definition=wf_def,
+        node_map=node_map,
+        outgoing=outgoing,
+        start_node=start_node,
+    )
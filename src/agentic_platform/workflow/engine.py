@@ -1,5 +1,8 @@
-from agentic_platform.core.types import AuditEvent
+import time
+
+from agentic_platform.core.types import AuditEvent, utc_timestamp
 from agentic_platform.core.ids import generate_job_id
+from agentic_platform.workflow.definition import CompiledWorkflow, compile_workflow
 
 def resolve_args(args, input_artifact):
     """Resolve template strings in args using input_artifact."""
@@ -25,10 +28,26 @@ def resolve_args(args, input_artifact):
             resolved[key] = value
     return resolved
 
+def _mark_completed(audit_log, job_id):
+    # Lets indexed audit logs evict finished jobs first; plain sinks may not support it
+    mark = getattr(audit_log, "mark_completed", None)
+    if mark is not None:
+        mark(job_id)
+
 def run(wf_def, input_artifact, tool_client, audit_log, stop_at_node=None, return_state=False, resume_state=None):
+    """
+    Run a workflow given as a definition dict or a precompiled CompiledWorkflow.
+
+    Every audit event carries the wall-clock time plus perf_counter_ns()
+    readings: tool steps record start_ns on STEP_STARTED and start_ns, end_ns
+    and duration_ns on STEP_ENDED/STEP_ERRORED. The start node's STEP_STARTED
+    and the end node's STEP_ENDED bracket the whole run, so the latter's
+    duration_ns is the job's total (see audit.analysis).
+    """
     job_id = generate_job_id()
-    node_map = {n["id"]: n for n in wf_def["nodes"]}
-    edges = wf_def["edges"]
+    job_start_ns = time.perf_counter_ns()
+    plan = wf_def if isinstance(wf_def, CompiledWorkflow) else compile_workflow(wf_def)
+    node_map = plan.node_map
     if resume_state is not None:
         current = node_map[resume_state["current_node_id"]]
         visited = set(resume_state.get("visited", []))
@@ -37,14 +56,17 @@ def run(wf_def, input_artifact, tool_client, audit_log, stop_at_node=None, retur
         if node_key in visited:
             visited.remove(node_key)
     else:
-        current = next(n for n in wf_def["nodes"] if n["type"] == "start")
+        current = plan.start_node
+        if current is None:
+            raise ValueError("Workflow has no start node")
         visited = set()
         audit_log.emit(AuditEvent(
             event_type="STEP_STARTED",
             job_id=job_id,
             node_id=current["id"],
-            timestamp="2026-01-31T00:00:00Z",
-            status="started"
+            timestamp=utc_timestamp(),
+            status="started",
+            start_ns=job_start_ns
         ))
     status = "running"
     used_persistence = return_state or resume_state is not None
@@ -62,7 +84,7 @@ def run(wf_def, input_artifact, tool_client, audit_log, stop_at_node=None, retur
             else:
                 return {"job_id": job_id, "status": "paused", "tool_results": tool_results}
         # Find all outgoing edges
-        outgoing = [e for e in edges if e["from"] == current["id"]]
+        outgoing = plan.outgoing.get(current["id"], [])
         # Select edge: if any edge has a 'condition', evaluate it
         next_edge = None
         for e in outgoing:
@@ -82,42 +104,58 @@ def run(wf_def, input_artifact, tool_client, audit_log, stop_at_node=None, retur
             raise RuntimeError(f"No valid outgoing edge from node {current['id']} for input {input_artifact}")
         next_node = node_map[next_edge["to"]]
         if next_node["type"] == "tool":
+            step_start_ns = time.perf_counter_ns()
             audit_log.emit(AuditEvent(
                 event_type="STEP_STARTED",
                 job_id=job_id,
                 node_id=next_node["id"],
-                timestamp="2026-01-31T00:00:01Z",
-                status="started"
+                timestamp=utc_timestamp(),
+                status="started",
+                start_ns=step_start_ns
             ))
             try:
                 tool_args = resolve_args(next_node.get("args"), input_artifact)
                 tool_result = tool_client.call(next_node["tool"], tool_args)
                 tool_results.append({"node_id": next_node["id"], "result": tool_result})
+                step_end_ns = time.perf_counter_ns()
                 audit_log.emit(AuditEvent(
                     event_type="STEP_ENDED",
                     job_id=job_id,
                     node_id=next_node["id"],
-                    timestamp="2026-01-31T00:00:02Z",
-                    status="ended"
+                    timestamp=utc_timestamp(),
+                    status="ended",
+                    start_ns=step_start_ns,
+                    end_ns=step_end_ns,
+                    duration_ns=step_end_ns - step_start_ns
                 ))
             except Exception as e:
+                step_end_ns = time.perf_counter_ns()
                 audit_log.emit(AuditEvent(
                     event_type="STEP_ERRORED",
                     job_id=job_id,
                     node_id=next_node["id"],
-                    timestamp="2026-01-31T00:00:02Z",
-                    status="errored"
+                    timestamp=utc_timestamp(),
+                    status="errored",
+                    start_ns=step_start_ns,
+                    end_ns=step_end_ns,
+                    duration_ns=step_end_ns - step_start_ns
                 ))
+                _mark_completed(audit_log, job_id)
                 raise
         current = next_node
     status = "completed"
+    job_end_ns = time.perf_counter_ns()
     audit_log.emit(AuditEvent(
         event_type="STEP_ENDED",
         job_id=job_id,
         node_id=current["id"],
-        timestamp="2026-01-31T00:00:03Z",
-        status="ended"
+        timestamp=utc_timestamp(),
+        status="ended",
+        start_ns=job_start_ns,
+        end_ns=job_end_ns,
+        duration_ns=job_end_ns - job_start_ns
     ))
+    _mark_completed(audit_log, job_id)
     if used_persistence:
         return {"job_id": job_id, "status": status, "tool_results": tool_results}, None
     return {"job_id": job_id, "status": status, "tool_results": tool_results}
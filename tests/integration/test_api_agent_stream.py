@@ -0,0 +1,40 @@
+"""
+Integration tests for the streaming agent endpoint (/agent/execute/stream).
+"""
+
+import json
+import pytest
+from fastapi.testclient import TestClient
+
+from agentic_platform.api import app
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_agent_stream_returns_sse_events(client):
+    response = client.post("/agent/execute/stream", data={"prompt": "What is LangGraph?", "model": "mock-llm"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = parse_sse(response.text)
+    names = [name for name, _ in events]
+    assert "token" in names
+    assert "reasoning_step" in names
+    assert names[-1] == "result"
+
+    result = events[-1][1]
+    assert result["model_used"] == "mock-llm"
+    assert "llm_setup" in result
+    assert result["status"] in ["success", "incomplete"]
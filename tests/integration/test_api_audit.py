@@ -0,0 +1,75 @@
+"""
+Integration tests for the audit query endpoint (GET /audit/events).
+"""
+
+import json
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agentic_platform.api import app
+from agentic_platform.audit.registry import tenant_audit_log
+from agentic_platform.core.types import AuditEvent
+
+TENANT = "startup_inc"
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def job_id():
+    job_id = f"audit-test-{uuid.uuid4()}"
+    log = tenant_audit_log(TENANT)
+    for i in range(5):
+        log.emit(AuditEvent(event_type="STEP_ERRORED" if i == 3 else "STEP_ENDED", job_id=job_id,
+                            node_id=f"node-{i}", timestamp=f"2026-01-31T00:00:0{i}Z", status="ended"))
+    return job_id
+
+
+def test_pages_through_a_job_with_cursors(client, job_id):
+    seen, cursor = [], None
+    while True:
+        params = {"tenant": TENANT, "job_id": job_id, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/audit/events", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        seen += [e["node_id"] for e in data["events"]]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [f"node-{i}" for i in range(5)]
+
+
+def test_filters_by_type_and_time(client, job_id):
+    errored = client.get("/audit/events", params={"tenant": TENANT, "job_id": job_id, "type": "STEP_ERRORED"}).json()
+    assert [e["node_id"] for e in errored["events"]] == ["node-3"]
+
+    window = client.get("/audit/events", params={
+        "tenant": TENANT, "job_id": job_id, "since": "2026-01-31T00:00:02Z", "until": "2026-01-31T00:00:03Z"
+    }).json()
+    assert [e["node_id"] for e in window["events"]] == ["node-2", "node-3"]
+
+
+def test_ndjson_export_streams_every_match(client, job_id):
+    response = client.get("/audit/events", params={"tenant": TENANT, "job_id": job_id, "limit": 1},
+                          headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["node_id"] for r in records] == [f"node-{i}" for i in range(5)]
+
+
+def test_rejects_bad_cursor(client):
+    assert client.get("/audit/events", params={"cursor": "abc"}).status_code == 400
+
+
+def test_rejects_bad_timestamp(client):
+    assert client.get("/audit/events", params={"since": "yesterday"}).status_code == 400
@@ -0,0 +1,122 @@
+"""
+Integration tests for the asynchronous job endpoints (/jobs).
+"""
+
+import time
+import pytest
+from fastapi.testclient import TestClient
+
+from agentic_platform.api import app
+from agentic_platform.jobs.store import SUCCEEDED
+
+WORKFLOW_YAML = """
+nodes:
+  - id: start
+    type: start
+  - id: process
+    type: tool
+    tool: process_data
+    args:
+      data: "${inputs.data}"
+  - id: end
+    type: end
+edges:
+  - from: start
+    to: process
+  - from: process
+    to: end
+"""
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def poll_result(client, job_id, timeout=10.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        response = client.get(f"/jobs/{job_id}/result")
+        if response.status_code != 202:
+            return response
+        time.sleep(0.05)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def test_submit_workflow_job_and_fetch_result(client):
+    response = client.post("/jobs", json={
+        "type": "workflow",
+        "workflow": WORKFLOW_YAML,
+        "input": {"inputs": {"data": "hello"}}
+    })
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+    assert job["job_type"] == "workflow"
+
+    result = poll_result(client, job["job_id"])
+    assert result.status_code == 200
+    data = result.json()
+    assert data["result"]["status"] == "completed"
+    assert data["tool_results"][0]["result"] == "Processed: hello"
+    assert data["audit_log"]
+
+    status = client.get(f"/jobs/{job['job_id']}").json()
+    assert status["status"] == "succeeded"
+    assert "result" not in status
+
+
+def test_submit_agent_job(client):
+    response = client.post("/jobs", json={"type": "agent", "prompt": "Hello there", "model": "mock-llm"})
+    assert response.status_code == 202
+    result = poll_result(client, response.json()["job_id"])
+    assert result.status_code == 200
+    assert result.json()["model_used"] == "mock-llm"
+
+
+def test_failed_job_reports_error(client):
+    bad_workflow = WORKFLOW_YAML.replace("process_data", "no_such_tool")
+    response = client.post("/jobs", json={"type": "workflow", "workflow": bad_workflow})
+    result = poll_result(client, response.json()["job_id"])
+    assert result.status_code == 422
+    assert client.get(f"/jobs/{response.json()['job_id']}").json()["status"] == "failed"
+
+
+def test_submit_rejects_bad_payloads(client):
+    assert client.post("/jobs", json={"type": "nope"}).status_code == 400
+    assert client.post("/jobs", json={"type": "agent"}).status_code == 400
+    assert client.post("/jobs", json={"type": "workflow", "workflow": "just: text"}).status_code == 400
+
+
+def test_unknown_job_returns_404(client):
+    assert client.get("/jobs/does-not-exist").status_code == 404
+    assert client.get("/jobs/does-not-exist/result").status_code == 404
+
+
+def test_download_samples_background_reports_progress(client, monkeypatch):
+    async def fake_download(self, count, keywords, on_progress=None):
+        for i in range(count):
+            on_progress(i + 1, count, i + 1, 0)
+        return [{"name": f"Internet Sample {i+1}", "path": f"sample_data/downloaded/sample_{i+1}.jpg", "type": "downloaded"}
+                for i in range(count)]
+
+    monkeypatch.setattr("agentic_platform.api.SampleDownloader.download", fake_download)
+    response = client.post("/download-samples/", json={"count": 2, "keywords": "letter", "background": True})
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    result = poll_result(client, job_id)
+    assert result.status_code == 200
+    assert result.json()["message"] == "Downloaded 2 images"
+    assert client.get(f"/jobs/{job_id}").json()["progress"] == {"completed": 2, "total": 2, "succeeded": 2, "failed": 0}
+
+
+def test_shutdown_finishes_queued_jobs_before_closing_audit_sinks(monkeypatch):
+    import agentic_platform.api as api
+
+    seen = []
+    monkeypatch.setattr(api, "close_redaction_stages",
+                        lambda: seen.append(api.job_store.get(record.job_id).status))
+    with TestClient(app):
+        record = api.job_queue.submit("workflow", lambda: time.sleep(0.2) or {"status": "completed"})
+    assert seen == [SUCCEEDED]
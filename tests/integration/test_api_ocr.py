@@ -118,5 +118,91 @@ class TestOCREndpoint:
         # (This is a basic check; actual validation depends on image content)
 
 
+class TestInMemoryOCRUpload:
+    """Uploads are OCR'd from memory instead of temp files."""
+
+    def test_upload_does_not_touch_temp_files(self, client, monkeypatch):
+        import agentic_platform.api as api_module
+        from agentic_platform.core.blobs import blob_store
+
+        def no_temp_files(*args, **kwargs):
+            raise AssertionError("upload should not be written to a temp file")
+
+        monkeypatch.setattr(api_module.tempfile, "NamedTemporaryFile", no_temp_files)
+
+        response = client.post(
+            "/run-ocr/",
+            files={"image": ("letter.jpg", b"not really a jpeg", "image/jpeg")}
+        )
+
+        assert response.status_code == 200
+        # An upload named like a bundled sample does not get the sample's demo text
+        assert "Dear John" not in response.json()["tool_results"][0]["result"]["text"]
+        # The in-memory upload is released once the request finishes
+        assert len(blob_store) == 0
+
+    def test_large_upload_is_spooled_to_disk(self, client, monkeypatch):
+        import agentic_platform.api as api_module
+        from agentic_platform.core.blobs import blob_store
+
+        monkeypatch.setattr(api_module, "OCR_INLINE_MAX_BYTES", 4)
+        response = client.post(
+            "/run-ocr/",
+            files={"image": ("letter.jpg", b"larger than four bytes", "image/jpeg")}
+        )
+
+        assert response.status_code == 200
+        assert len(blob_store) == 0
+
+
+
+class TestRemoteOCRImage:
+    """Remote file_path URLs are downloaded with a size limit and a timeout."""
+
+    def _fake_urlopen(self, body, calls):
+        class FakeResponse:
+            def __init__(self):
+                self._body = body
+
+            def read(self, size=-1):
+                calls.append(size)
+                return self._body if size < 0 else self._body[:size]
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        def urlopen(request, timeout=None):
+            calls.append(timeout)
+            return FakeResponse()
+        return urlopen
+
+    def test_oversized_remote_image_is_rejected(self, client, monkeypatch):
+        import urllib.request
+        import agentic_platform.api as api_module
+
+        calls = []
+        monkeypatch.setattr(urllib.request, "urlopen", self._fake_urlopen(b"x" * 100, calls))
+        monkeypatch.setattr(api_module, "OCR_REMOTE_MAX_BYTES", 10)
+
+        response = client.post("/run-ocr/", data={"file_path": "https://example.com/huge.jpg"})
+
+        assert response.status_code == 413
+        # Timeout passed, and no more than limit + 1 bytes read
+        assert calls == [api_module.OCR_REMOTE_TIMEOUT, 11]
+
+    def test_remote_image_within_limit_is_processed(self, client, monkeypatch):
+        import urllib.request
+
+        monkeypatch.setattr(urllib.request, "urlopen", self._fake_urlopen(b"small image", []))
+
+        response = client.post("/run-ocr/", data={"file_path": "https://example.com/letter.jpg"})
+
+        assert response.status_code == 200
+        assert "Dear John" not in response.json()["tool_results"][0]["result"]["text"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,69 @@
+"""
+Integration tests for the batch OCR endpoint (/run-ocr/batch).
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import agentic_platform.api as api
+from agentic_platform.integrations.ocr import MockOCR
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(api, "get_ocr_provider", lambda **kwargs: MockOCR())
+    return TestClient(api.app)
+
+
+def test_batch_ocr_uploads_and_samples_in_order(client):
+    response = client.post(
+        "/run-ocr/batch",
+        files=[("files", ("a.jpg", b"one", "image/jpeg")), ("files", ("b.jpg", b"two", "image/jpeg"))],
+        data={"file_paths": ["sample_data/downloaded/sample_1.jpg"]},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 3
+    assert [r["source"] for r in data["results"]] == ["a.jpg", "b.jpg", "sample_data/downloaded/sample_1.jpg"]
+    assert "<3 bytes>" in data["results"][0]["text"]
+    assert "sample_1.jpg" in data["results"][2]["text"]
+
+
+def test_batch_uploads_named_like_samples_get_no_demo_text(monkeypatch):
+    from agentic_platform.integrations.ocr import GoogleCloudVisionOCR
+    from agentic_platform.tools.google_vision_ocr import GoogleVisionOCR
+
+    monkeypatch.setattr(GoogleVisionOCR, "client", None)
+    provider = GoogleCloudVisionOCR()
+    monkeypatch.setattr(api, "get_ocr_provider", lambda **kwargs: provider)
+    response = TestClient(api.app).post(
+        "/run-ocr/batch",
+        files=[("files", ("letter.jpg", b"not a letter", "image/jpeg"))],
+    )
+    assert response.status_code == 200
+    [upload] = response.json()["results"]
+    assert upload["source"] == "letter.jpg"
+    assert "mock" not in upload and upload["text"] == ""
+
+
+def test_batch_ocr_requires_images(client):
+    assert client.post("/run-ocr/batch").status_code == 400
+
+
+def test_batch_ocr_limits_batch_size(client, monkeypatch):
+    monkeypatch.setattr(api, "OCR_BATCH_MAX_FILES", 1)
+    response = client.post(
+        "/run-ocr/batch",
+        files=[("files", ("a.jpg", b"one", "image/jpeg")), ("files", ("b.jpg", b"two", "image/jpeg"))],
+    )
+    assert response.status_code == 400
+
+
+def test_batch_ocr_rejects_paths_outside_sample_data(client):
+    response = client.post("/run-ocr/batch", data={"file_paths": ["pyproject.toml"]})
+    assert response.status_code == 403
+
+
+def test_batch_ocr_rejects_sibling_directories_sharing_the_prefix(client):
+    response = client.post("/run-ocr/batch", data={"file_paths": ["sample_data/../sample_data_evil/x.png"]})
+    assert response.status_code == 403
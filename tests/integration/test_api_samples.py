@@ -0,0 +1,94 @@
+"""
+Integration tests for the sample image endpoints.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+
+import agentic_platform.api as api
+from agentic_platform.samples import SampleCatalog, ThumbnailCache
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    download_dir = tmp_path / "downloaded"
+    download_dir.mkdir()
+    for n in range(1, 6):
+        Image.new("RGB", (30, 40), "white").save(download_dir / f"sample_{n}.jpg", "JPEG")
+    monkeypatch.setattr(api, "sample_catalog", SampleCatalog(tmp_path, poll_interval=0))
+    return TestClient(api.app)
+
+
+def test_list_samples_paginates(client):
+    response = client.get("/list-samples/", params={"offset": 6, "limit": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 11
+    assert [s["name"] for s in data["samples"]] == ["Internet Sample 1", "Internet Sample 2"]
+
+
+def test_list_samples_without_limit_returns_everything(client):
+    data = client.get("/list-samples/").json()
+    assert len(data["samples"]) == data["total"] == 11
+
+
+def test_list_samples_revalidates_with_etag(client):
+    first = client.get("/list-samples/")
+    etag = first.headers["etag"]
+    assert first.headers["last-modified"]
+
+    cached = client.get("/list-samples/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    since = client.get("/list-samples/", headers={"If-Modified-Since": first.headers["last-modified"]})
+    assert since.status_code == 304
+
+
+def test_list_samples_rejects_negative_offset(client):
+    assert client.get("/list-samples/", params={"offset": -1}).status_code == 422
+
+
+@pytest.fixture
+def sample_client(tmp_path, monkeypatch):
+    monkeypatch.setattr(api, "thumbnail_cache", ThumbnailCache(tmp_path / "thumbs"))
+    return TestClient(api.app)
+
+
+SAMPLE = "/sample_data/downloaded/sample_1.jpg"
+
+
+def test_sample_data_serves_original_with_validators(sample_client):
+    response = sample_client.get(SAMPLE)
+    assert response.status_code == 200
+    assert "max-age" in response.headers["cache-control"]
+
+    cached = sample_client.get(SAMPLE, headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+
+
+def test_sample_data_serves_thumbnail(sample_client):
+    original = sample_client.get(SAMPLE)
+    response = sample_client.get(SAMPLE, params={"w": 64})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/jpeg"
+    assert len(response.content) < len(original.content)
+    assert response.headers["etag"] != original.headers["etag"]
+
+
+def test_sample_data_range_request(sample_client):
+    full = sample_client.get(SAMPLE).content
+    response = sample_client.get(SAMPLE, headers={"Range": "bytes=10-19"})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 10-19/{len(full)}"
+    assert response.content == full[10:20]
+
+    suffix = sample_client.get(SAMPLE, headers={"Range": "bytes=-5"})
+    assert suffix.content == full[-5:]
+
+    unsatisfiable = sample_client.get(SAMPLE, headers={"Range": f"bytes={len(full)}-"})
+    assert unsatisfiable.status_code == 416
+
+
+def test_sample_data_blocks_traversal(sample_client):
+    assert sample_client.get("/sample_data/..%2F..%2Fpyproject.toml").status_code in (403, 404)
@@ -8,6 +8,7 @@ Test coverage:
 - Multi-step reasoning
 """
 
+import time
 import pytest
 from unittest.mock import Mock, patch
 from langchain_core.tools import StructuredTool
@@ -322,6 +323,90 @@ class TestAgentIntegration:
         assert result2.status in ["success", "incomplete"]
 
 
+# ============================================================================
+# Streaming Tests
+# ============================================================================
+
+class TestAgentStreaming:
+    """Test event streaming from agent execution."""
+    
+    def _kb_tool(self):
+        tool = Mock()
+        tool.name = "search_knowledge_base"
+        tool.func = Mock(return_value="LangGraph builds stateful agents.")
+        return tool
+    
+    def test_stream_ends_with_result(self):
+        """The last event carries the same result execute() would return."""
+        agent = LangGraphAgent(model="mock-llm", llm=MockLLM(), max_iterations=3)
+        
+        events = list(agent.stream("Hello"))
+        
+        assert events[-1]["event"] == "result"
+        result = events[-1]["data"]
+        assert result["status"] in ["success", "incomplete"]
+        assert result["final_output"]
+        assert sum(1 for e in events if e["event"] == "result") == 1
+    
+    def test_stream_emits_tokens_before_result(self):
+        """LLM output is forwarded as token events."""
+        agent = LangGraphAgent(model="mock-llm", llm=MockLLM(), max_iterations=3)
+        
+        events = list(agent.stream("Hello"))
+        tokens = "".join(e["data"]["text"] for e in events if e["event"] == "token")
+        
+        assert events[0]["event"] == "token"
+        assert tokens == events[-1]["data"]["final_output"]
+    
+    def test_stream_emits_tool_calls_and_steps(self):
+        """Tool executions and reasoning steps are streamed as they happen."""
+        agent = LangGraphAgent(model="mock-llm", llm=MockLLM(), tools=[self._kb_tool()], max_iterations=3)
+        
+        events = list(agent.stream("What is LangGraph?"))
+        names = [e["event"] for e in events]
+        
+        assert "tool_call" in names
+        tool_event = next(e for e in events if e["event"] == "tool_call")
+        assert tool_event["data"]["tool"] == "search_knowledge_base"
+        assert tool_event["data"]["result"] == "LangGraph builds stateful agents."
+        steps = [e["data"]["step"] for e in events if e["event"] == "reasoning_step"]
+        assert steps == events[-1]["data"]["reasoning_steps"]
+    
+    def test_stream_stops_worker_when_consumer_goes_away(self):
+        """Closing the stream early stops the LLM read and the graph loop."""
+        produced = []
+        
+        class SlowLLM:
+            def stream(self, messages):
+                for i in range(500):
+                    produced.append(i)
+                    time.sleep(0.001)
+                    yield AIMessage(content="x")
+        
+        agent = LangGraphAgent(model="mock-llm", llm=SlowLLM(), max_iterations=3)
+        
+        stream = agent.stream("Hello")
+        assert next(stream)["event"] == "token"
+        stream.close()
+        for _ in range(500):
+            if agent._event_sink is None:
+                break
+            time.sleep(0.01)
+        
+        assert agent._event_sink is None
+        assert len(produced) < 500
+    
+    def test_execute_does_not_stream(self):
+        """Plain execute() keeps using invoke() and emits nothing."""
+        llm = MockLLM()
+        agent = LangGraphAgent(model="mock-llm", llm=llm, max_iterations=1)
+        
+        result = agent.execute("Hello")
+        
+        assert result.final_output
+        assert agent._event_sink is None
+
+
 # ============================================================================
 # Run Tests
 # ============================================================================
@@ -14,5 +14,51 @@ def test_artifact_store_duplicate_put():
     job_id = "job-123"
     artifact = {"foo": "bar"}
     ref1 = store.put(job_id, artifact)
-    with pytest.raises(ValueError):
-        store.put(job_id, artifact)  # Duplicate put for same job_id should fail
+    # Re-storing identical content for the same job is idempotent
+    assert store.put(job_id, artifact) == ref1
+    assert store.versions(job_id) == [ref1]
+
+def test_artifact_store_keeps_versions_per_job():
+    store = artifact_store.InMemoryArtifactStore()
+    ref1 = store.put("job-1", {"v": 1})
+    ref2 = store.put("job-1", {"v": 2})
+    assert store.versions("job-1") == [ref1, ref2]
+    assert store.latest("job-1") == ref2
+    assert store.get(ref1) == {"v": 1}
+
+def test_identical_artifacts_share_one_blob_until_released():
+    store = artifact_store.InMemoryArtifactStore()
+    shared = {"text": "same OCR output"}
+    ref_a = store.put("job-a", shared)
+    ref_b = store.put("job-b", dict(shared))
+    assert ref_a != ref_b
+    assert store.stats()["blobs"] == 1
+
+    store.delete(ref_a)
+    assert store.get(ref_b) == shared
+    with pytest.raises(KeyError):
+        store.get(ref_a)
+    store.delete_job("job-b")
+    assert store.stats() == {"jobs": 0, "refs": 0, "blobs": 0, "bytes": 0}
+
+def test_artifact_store_evicts_oldest_jobs():
+    store = artifact_store.InMemoryArtifactStore(max_jobs=2)
+    old = store.put("job-1", {"n": 1})
+    store.put("job-2", {"n": 1})
+    store.put("job-3", {"n": 3})
+    with pytest.raises(KeyError):
+        store.get(old)
+    assert store.stats()["blobs"] == 2
+
+def test_stored_artifacts_cannot_be_mutated_through_get_or_put():
+    store = artifact_store.InMemoryArtifactStore()
+    artifact = {"lines": ["a"]}
+    ref = store.put("job-1", artifact)
+    store.get(ref)["lines"].append("b")
+    artifact["lines"].append("c")
+    assert store.get(ref) == {"lines": ["a"]}
+
+def test_get_returns_the_value_that_was_put():
+    store = artifact_store.InMemoryArtifactStore()
+    artifact = {"pts": (1, 2), "m": {1: "a"}}
+    assert store.get(store.put("job-1", artifact)) == artifact
@@ -0,0 +1,97 @@
+import time
+
+from agentic_platform.audit.analysis import critical_path, latency_breakdown
+from agentic_platform.audit.audit_log import InMemoryAuditLog, event_record
+from agentic_platform.core.types import AuditEvent
+from agentic_platform.workflow import engine
+
+WORKFLOW = {
+    "nodes": [
+        {"id": "start", "type": "start"},
+        {"id": "fast", "type": "tool", "tool": "fast"},
+        {"id": "slow", "type": "tool", "tool": "slow"},
+        {"id": "end", "type": "end"}
+    ],
+    "edges": [
+        {"from": "start", "to": "fast"},
+        {"from": "fast", "to": "slow"},
+        {"from": "slow", "to": "end"}
+    ]
+}
+
+
+class SleepyToolClient:
+    def call(self, tool_name, args):
+        time.sleep(0.02 if tool_name == "slow" else 0.001)
+        return {"ok": True}
+
+
+def span(node_id, start, end, event_type="STEP_ENDED"):
+    return AuditEvent(event_type=event_type, job_id="job", node_id=node_id, timestamp="2026-01-31T00:00:00Z",
+                      status="ended", start_ns=start, end_ns=end, duration_ns=end - start)
+
+
+def test_engine_records_real_timestamps_and_durations():
+    log = InMemoryAuditLog()
+    result = engine.run(WORKFLOW, input_artifact={}, tool_client=SleepyToolClient(), audit_log=log)
+    events = log.get_events(result["job_id"])
+
+    assert all(e.timestamp.endswith("Z") and e.timestamp != "2026-01-31T00:00:00Z" for e in events)
+    slow_end = next(e for e in events if e.node_id == "slow" and e.event_type == "STEP_ENDED")
+    assert slow_end.duration_ns >= 20_000_000
+    assert slow_end.duration_ns == slow_end.end_ns - slow_end.start_ns
+    assert not hasattr(slow_end, "__dict__")
+
+    breakdown = latency_breakdown(events)
+    assert list(breakdown["nodes"]) == ["slow", "fast"]
+    assert breakdown["critical_path"] == ["fast", "slow"]
+    assert breakdown["total_ns"] == events[-1].duration_ns
+    assert breakdown["total_ns"] == breakdown["critical_path_ns"] + breakdown["overhead_ns"]
+
+
+def test_critical_path_follows_the_chain_that_finished_last():
+    # b and c overlap after a; d waits for c, the later of the two
+    spans = [{"node_id": n, "start_ns": s, "end_ns": e} for n, s, e in
+             [("a", 0, 10), ("b", 10, 15), ("c", 11, 30), ("d", 30, 40)]]
+
+    assert [s["node_id"] for s in critical_path(spans)] == ["a", "c", "d"]
+
+
+def started(node_id, start):
+    return AuditEvent(event_type="STEP_STARTED", job_id="job", node_id=node_id, timestamp="2026-01-31T00:00:00Z",
+                      status="started", start_ns=start)
+
+
+def test_breakdown_counts_errors_and_accepts_records():
+    events = [started("start", 0), started("ocr", 10), span("ocr", 10, 30, "STEP_ERRORED"),
+              started("ocr", 40), span("ocr", 40, 90), span("end", 0, 100)]
+
+    breakdown = latency_breakdown([event_record(e) for e in events])
+
+    assert list(breakdown["nodes"]) == ["ocr"]
+    assert breakdown["nodes"]["ocr"] == {"count": 2, "errors": 1, "total_ns": 70, "max_ns": 50}
+    assert breakdown["overhead_ns"] == 30
+
+
+class FailingToolClient:
+    def call(self, tool_name, args):
+        if tool_name == "slow":
+            raise RuntimeError("tool exploded")
+        return {"ok": True}
+
+
+def test_failed_job_keeps_every_tool_step():
+    log = InMemoryAuditLog()
+    try:
+        engine.run(WORKFLOW, input_artifact={}, tool_client=FailingToolClient(), audit_log=log)
+    except RuntimeError:
+        pass
+    job_id = log.job_ids()[0]
+    events = log.get_events(job_id)
+
+    breakdown = latency_breakdown(events)
+
+    assert set(breakdown["nodes"]) == {"fast", "slow"}
+    assert breakdown["nodes"]["slow"]["errors"] == 1
+    assert breakdown["critical_path"] == ["fast", "slow"]
+    assert breakdown["total_ns"] == events[-1].end_ns - events[0].start_ns
@@ -0,0 +1,95 @@
+from datetime import datetime, timezone
+
+import agentic_platform.audit.audit_log as audit_log_module
+from agentic_platform.audit.audit_log import InMemoryAuditLog, parse_timestamp
+from agentic_platform.core.types import AuditEvent
+
+
+def event(job_id, timestamp, event_type="STEP_STARTED", node_id="node-1"):
+    return AuditEvent(event_type=event_type, job_id=job_id, node_id=node_id,
+                      timestamp=timestamp, status="started")
+
+
+def test_get_events_only_returns_the_jobs_events():
+    log = InMemoryAuditLog()
+    for i in range(100):
+        log.emit(event(f"job-{i % 10}", f"2026-01-31T00:00:{i % 60:02d}Z"))
+
+    events = log.get_events("job-3")
+
+    assert len(events) == 10
+    assert {e.job_id for e in events} == {"job-3"}
+    assert log.get_events("missing") == []
+
+
+def test_time_range_queries():
+    log = InMemoryAuditLog()
+    log.emit(event("a", "2026-01-31T00:00:05Z", node_id="late"))
+    log.emit(event("a", "2026-01-31T00:00:01Z", node_id="early"))
+    log.emit(event("b", "2026-01-31T00:00:03Z"))
+    log.emit(event("b", "2026-01-31T00:01:00Z"))
+
+    window = log.get_events("a", since="2026-01-31T00:00:00Z", until="2026-01-31T00:00:10Z")
+    # Emit order is preserved within a job
+    assert [e.node_id for e in window] == ["late", "early"]
+    assert [e.node_id for e in log.get_events("a", since="2026-01-31T00:00:02Z")] == ["late"]
+
+    across = log.query(since="2026-01-31T00:00:02Z", until="2026-01-31T00:00:30Z")
+    assert [(e.job_id, e.timestamp) for e in across] == [("b", "2026-01-31T00:00:03Z"), ("a", "2026-01-31T00:00:05Z")]
+
+
+def test_trailing_z_parses_without_python_311(monkeypatch):
+    class Py310Datetime(datetime):
+        @classmethod
+        def fromisoformat(cls, value):
+            if value.endswith("Z"):
+                raise ValueError(f"Invalid isoformat string: {value!r}")
+            return super().fromisoformat(value)
+
+    monkeypatch.setattr(audit_log_module, "datetime", Py310Datetime)
+    assert parse_timestamp("2026-01-31T00:00:02Z") == datetime(2026, 1, 31, 0, 0, 2, tzinfo=timezone.utc)
+
+    log = InMemoryAuditLog()
+    log.emit(event("a", "2026-01-31T00:00:01Z", node_id="early"))
+    log.emit(event("a", "2026-01-31T00:00:05Z", node_id="late"))
+    assert [e.node_id for e in log.get_events("a", since="2026-01-31T00:00:02Z")] == ["late"]
+
+
+def test_completed_jobs_are_evicted_first():
+    log = InMemoryAuditLog(max_jobs=2)
+    log.emit(event("running", "2026-01-31T00:00:00Z"))
+    log.emit(event("done", "2026-01-31T00:00:01Z"))
+    log.mark_completed("done")
+
+    log.emit(event("new", "2026-01-31T00:00:02Z"))
+
+    assert log.job_ids() == ["running", "new"]
+    assert log.get_events("done") == []
+
+
+def test_completed_jobs_expire_after_ttl():
+    log = InMemoryAuditLog(completed_ttl=0)
+    log.emit(event("done", "2026-01-31T00:00:00Z"))
+    log.emit(event("running", "2026-01-31T00:00:00Z"))
+    log.mark_completed("done")
+
+    log.emit(event("running", "2026-01-31T00:00:01Z"))
+
+    assert log.job_ids() == ["running"]
+    assert len(log) == 2
+
+
+def test_page_cursors_span_jobs_and_skip_evicted_events():
+    log = InMemoryAuditLog(max_jobs=3)
+    for i in range(6):
+        log.emit(event(f"job-{i % 3}", f"2026-01-31T00:00:0{i}Z", event_type="STEP_ENDED" if i % 2 else "STEP_STARTED"))
+
+    first, cursor = log.page(limit=4)
+    rest, end = log.page(after=cursor, limit=4)
+    assert [e.timestamp[-3:-1] for e in first + rest] == ["00", "01", "02", "03", "04", "05"]
+    assert end is None
+    assert len(log.page(event_type="STEP_ENDED")[0]) == 3
+
+    log.mark_completed("job-0")
+    log.emit(event("job-3", "2026-01-31T00:00:06Z"))
+    assert [e.job_id for e in log.page()[0]] == ["job-1", "job-2", "job-1", "job-2", "job-3"]
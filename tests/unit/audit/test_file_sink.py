@@ -0,0 +1,98 @@
+import os
+
+from agentic_platform.audit.audit_log import InMemoryAuditLog
+from agentic_platform.audit.file_sink import FileAuditSink, close_audit_sinks, tenant_audit_sink
+from agentic_platform.core.types import AuditEvent
+
+
+def event(job_id, i=0):
+    return AuditEvent(event_type="STEP_STARTED", job_id=job_id, node_id=f"node-{i}",
+                      timestamp="2026-01-31T00:00:00Z", status="started")
+
+
+def test_events_survive_a_restart(tmp_path):
+    sink = FileAuditSink(tmp_path)
+    log = InMemoryAuditLog(sink=sink)
+    for i in range(1000):
+        log.emit(event(f"job-{i % 4}", i))
+    sink.close()
+
+    reopened = FileAuditSink(tmp_path)
+    records = list(reopened.iter_records(job_id="job-1"))
+    reopened.close()
+
+    assert len(records) == 250
+    assert records[0] == {"event_type": "STEP_STARTED", "job_id": "job-1", "node_id": "node-1",
+                          "timestamp": "2026-01-31T00:00:00Z", "status": "started",
+                          "start_ns": None, "end_ns": None, "duration_ns": None}
+    assert [r["node_id"] for r in records] == [f"node-{i}" for i in range(1, 1000, 4)]
+
+
+def test_writes_are_batched_and_segments_rotate(tmp_path):
+    sink = FileAuditSink(tmp_path, segment_bytes=4096, fsync=False)
+    for i in range(500):
+        sink.emit(event("job", i))
+    assert sink.flush(timeout=5)
+
+    assert sink.written == 500
+    assert len(sink.segments()) > 1
+    assert len(list(sink.iter_records())) == 500
+    sink.close()
+
+
+def test_torn_trailing_record_is_ignored(tmp_path):
+    sink = FileAuditSink(tmp_path)
+    sink.emit(event("job"))
+    sink.close()
+    with open(sink.segments()[-1], "ab") as f:
+        f.write(b'{"event_type":"STEP_ENDED","job_id":"job"')
+
+    assert len(list(FileAuditSink(tmp_path).iter_records("job"))) == 1
+
+
+def test_restart_after_torn_record_keeps_new_events(tmp_path):
+    sink = FileAuditSink(tmp_path)
+    sink.emit(event("job", "A"))
+    sink.close()
+    with open(sink.segments()[-1], "ab") as f:
+        f.write(b'{"event_type":"STEP_ENDED","job_id":"job"')
+
+    restarted = FileAuditSink(tmp_path)
+    restarted.emit(event("job", "B"))
+    restarted.close()
+
+    assert [r["node_id"] for r in restarted.iter_records("job")] == ["node-A", "node-B"]
+
+
+def test_failed_write_is_cut_back_before_the_next_batch(tmp_path, monkeypatch):
+    sink = FileAuditSink(tmp_path)
+    sink.emit(event("job", "A"))
+    assert sink.flush(timeout=5)
+
+    real_fsync = os.fsync
+    calls = []
+
+    def fail_once(fd):
+        calls.append(fd)
+        if len(calls) == 1:
+            raise OSError("disk full")
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fail_once)
+    sink.emit(event("job", "lost"))
+    assert sink.flush(timeout=5)
+    sink.emit(event("job", "B"))
+    sink.close()
+
+    assert sink.failed == 1
+    assert [r["node_id"] for r in sink.iter_records("job")] == ["node-A", "node-B"]
+
+
+def test_only_compliance_tenants_get_a_sink(tmp_path, monkeypatch):
+    monkeypatch.setenv("AUDIT_LOG_DIR", str(tmp_path))
+
+    assert tenant_audit_sink("startup_inc") is None
+    sink = tenant_audit_sink("enterprise_corp")
+    assert sink is tenant_audit_sink("enterprise_corp")
+    assert sink.directory == tmp_path / "enterprise_corp"
+    close_audit_sinks()
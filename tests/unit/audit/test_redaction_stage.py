@@ -0,0 +1,55 @@
+from agentic_platform.audit.audit_log import InMemoryAuditLog
+from agentic_platform.audit.redaction import SYNC, RedactionStage, tenant_redaction_stage
+from agentic_platform.core.types import AuditEvent
+
+
+def event(job_id, node_id):
+    return AuditEvent(event_type="STEP_ENDED", job_id=job_id, node_id=node_id,
+                      timestamp="2026-01-31T00:00:00Z", status="ended")
+
+
+def test_async_stage_redacts_off_the_calling_thread_in_job_order():
+    stage = RedactionStage(workers=3)
+    shared = InMemoryAuditLog(redaction=stage)
+    request_log = InMemoryAuditLog(sink=shared)
+    for job in ("a", "b"):
+        for i in range(50):
+            request_log.emit(event(job, f"step-{i} mailed {job}{i}@corp.com"))
+        request_log.mark_completed(job)
+
+    # The request keeps its own trail; the shared store only ever sees redacted events
+    assert request_log.get_events("a")[0].node_id == "step-0 mailed a0@corp.com"
+    assert stage.flush(timeout=5)
+    stored = shared.get_events("a")
+    assert [e.node_id for e in stored] == [f"step-{i} mailed <REDACTED:EMAIL>" for i in range(50)]
+    assert set(shared._completed) == {"a", "b"}
+    stage.close()
+
+
+def test_sync_stage_redacts_before_emit_returns():
+    shared = InMemoryAuditLog(redaction=RedactionStage(mode=SYNC))
+
+    shared.emit(event("job", "call 555-123-4567"))
+
+    assert shared.get_events("job")[0].node_id == "call <REDACTED:PHONE>"
+
+
+def test_values_that_fail_to_redact_are_dropped():
+    class BrokenRedactor:
+        def redact_value(self, value):
+            raise ValueError("boom")
+
+    stage = RedactionStage(redactor=BrokenRedactor(), mode=SYNC)
+    delivered = []
+
+    stage.process({"text": "jane@corp.com"}, delivered.append)
+
+    assert delivered == []
+    assert stage.failed == 1
+
+
+def test_stage_is_configured_per_tenant():
+    assert tenant_redaction_stage("startup_inc") is None
+    stage = tenant_redaction_stage("enterprise_corp")
+    assert stage is tenant_redaction_stage("enterprise_corp")
+    assert stage.redact({"result": {"text": "jane@corp.com"}}) == {"result": {"text": "<REDACTED:EMAIL>"}}
@@ -0,0 +1,36 @@
+import pytest
+from agentic_platform.core.blobs import InMemoryBlobStore, is_blob_ref
+from agentic_platform.integrations.ocr import MockOCR
+from agentic_platform.integrations.base import OCRProvider
+
+
+def test_blob_store_put_get_discard():
+    store = InMemoryBlobStore()
+    ref = store.put(b"\x89PNG", "scan.png")
+    assert is_blob_ref(ref)
+    assert ref.endswith("/scan.png")
+    assert store.get(ref) == (b"\x89PNG", "scan.png")
+    store.discard(ref)
+    with pytest.raises(KeyError):
+        store.get(ref)
+    store.discard(ref)  # discarding twice is harmless
+
+
+def test_is_blob_ref_rejects_paths():
+    assert not is_blob_ref("sample_data/letter.jpg")
+    assert not is_blob_ref(None)
+
+
+def test_mock_ocr_accepts_bytes():
+    result = MockOCR().ocr_bytes(b"abc", "invoice.jpg")
+    assert "invoice.jpg" in result["text"]
+
+
+def test_default_ocr_bytes_delegates_to_ocr_image():
+    class PathOnlyOCR(OCRProvider):
+        def ocr_image(self, image_path):
+            with open(image_path, "rb") as f:
+                return {"text": f.read().decode(), "suffix": image_path[-4:]}
+
+    result = PathOnlyOCR().ocr_bytes(b"hello", "page.png")
+    assert result == {"text": "hello", "suffix": ".png"}
@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+from agentic_platform.integrations.base import Document
+from agentic_platform.integrations.knowledge_base import BM25KnowledgeBase
+from agentic_platform.integrations.lexical_index import BM25Index, tokenize
+
+DOCS = [
+    Document("a", "Deploy failed with ERR-4420 while rotating the database credentials"),
+    Document("b", "The database migration guide covers schema changes"),
+    Document("c", "Release notes for v2.1.0: faster OCR and new database drivers"),
+]
+
+
+def test_tokenizer_keeps_codes_and_their_parts():
+    assert tokenize("Got ERR-4420 on v2.1.0") == ["got", "err-4420", "err", "4420", "on", "v2.1.0", "v2", "1", "0"]
+
+
+def test_exact_terms_rank_their_document_first():
+    index = BM25Index()
+    index.add(DOCS)
+
+    assert [doc.id for doc, _ in index.search("ERR-4420")] == ["a"]
+    assert index.search("v2.1.0 release")[0][0].id == "c"
+    # "database" appears everywhere; the rarer "migration" decides the ranking
+    assert index.search("database migration")[0][0].id == "b"
+
+
+def test_scores_match_across_segments_and_merges():
+    single = BM25Index()
+    single.add(DOCS)
+    segmented = BM25Index(segment_size=1, max_segments=2)
+    segmented.add(DOCS)
+
+    expected = [(doc.id, round(score, 6)) for doc, score in single.search("database credentials")]
+    assert len(segmented.segments) <= 2
+    assert [(doc.id, round(score, 6)) for doc, score in segmented.search("database credentials")] == expected
+
+
+def test_remove_and_replace():
+    index = BM25Index(segment_size=2)
+    index.add(DOCS)
+    index.remove(["a"])
+    index.add([Document("b", "Nothing about migrations anymore, see ERR-4420")])
+
+    assert len(index) == 2
+    assert [doc.id for doc, _ in index.search("ERR-4420")] == ["b"]
+    assert index.search("schema") == []
+
+
+def test_segments_persist_and_reload(tmp_path):
+    kb = BM25KnowledgeBase(index_dir=tmp_path, segment_size=2)
+    kb.ingest(DOCS)
+    kb.remove(["c"])
+    kb.ingest([Document("d", "Incident report for ERR-9001")])
+
+    reopened = BM25KnowledgeBase(index_dir=tmp_path)
+
+    assert len(reopened.index) == 3
+    assert reopened.search_many(["ERR-9001"])[0][0].id == "d"
+    assert reopened.search_many(["v2.1.0"])[0] == []
+    hit = reopened.search_many(["ERR-4420"])[0][0]
+    assert hit.id == "a" and "ERR-4420" in hit.snippet
+    assert "[a]" in reopened.search("ERR-4420")
+
+
+def test_interrupted_save_does_not_shift_doc_numbers(tmp_path, monkeypatch):
+    index = BM25Index(directory=tmp_path)
+    index.add(DOCS[:1])
+    index.save()
+
+    # Crash after documents and arrays are written, before the manifest is replaced
+    crashing = BM25Index(directory=tmp_path)
+    crashing.add([Document("lost", "never committed ERR-7777")])
+    real_replace = os.replace
+
+    def fail_on_manifest(src, dst):
+        if str(dst).endswith("manifest.json"):
+            raise OSError("simulated crash")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", fail_on_manifest)
+    with pytest.raises(OSError):
+        crashing.save()
+    monkeypatch.setattr(os, "replace", real_replace)
+
+    recovered = BM25Index(directory=tmp_path)
+    recovered.add(DOCS[1:])
+    recovered.save()
+
+    reopened = BM25Index(directory=tmp_path)
+    assert len(reopened) == 3
+    assert reopened.search("never committed") == []
+    for doc in DOCS:
+        assert reopened.search(doc.text, k=1)[0][0].id == doc.id
@@ -0,0 +1,85 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from agentic_platform.core.tenancy import _current_tenant, set_current_tenant_id
+from agentic_platform.integrations.base import Document, SearchHit
+from agentic_platform.integrations.knowledge_base import (
+    BM25KnowledgeBase,
+    HybridKnowledgeBase,
+    LocalVectorKnowledgeBase,
+    normalize_query,
+    reciprocal_rank_fusion,
+)
+
+DOCS = [
+    Document("err", "Deploy failed with ERR-4420 while rotating credentials"),
+    Document("nn", "Neural networks are computing systems inspired by biological brains"),
+    Document("tf", "Transformers use self-attention over sequences"),
+]
+
+
+def _backend(*rankings):
+    backend = MagicMock()
+    backend.search_many.side_effect = lambda queries, k: [
+        [SearchHit(doc_id, 1.0, doc_id) for doc_id in rankings[0]] for _ in queries
+    ]
+    return backend
+
+
+def test_rrf_rewards_documents_ranked_by_several_backends():
+    fused = reciprocal_rank_fusion(
+        [[SearchHit("a", 9, ""), SearchHit("b", 8, "")], [SearchHit("b", 0.9, ""), SearchHit("c", 0.8, "")]],
+        k=3,
+    )
+    assert [h.id for h in fused] == ["b", "a", "c"]
+    assert abs(fused[0].score - (1 / 62 + 1 / 61)) < 1e-12
+
+
+def test_hybrid_combines_lexical_and_vector_backends():
+    kb = HybridKnowledgeBase([BM25KnowledgeBase(), LocalVectorKnowledgeBase()])
+    kb.ingest(DOCS)
+
+    assert kb.search_many(["ERR-4420"])[0][0].id == "err"
+    assert kb.search_many(["biological neural networks"])[0][0].id == "nn"
+    assert asyncio.run(kb.asearch("self-attention transformers"))[0].id == "tf"
+
+
+def test_near_identical_queries_are_served_from_cache():
+    backend = _backend(["a", "b"])
+    kb = HybridKnowledgeBase([backend])
+
+    kb.search_many(["Neural  Networks?"])
+    kb.search_many(["neural networks", "NEURAL networks!"])
+
+    assert normalize_query("Neural  Networks?") == "neural networks"
+    assert backend.search_many.call_count == 1
+    assert kb.hits == 2
+
+
+def test_cache_is_per_tenant_and_expires():
+    backend = _backend(["a"])
+    kb = HybridKnowledgeBase([backend], cache_ttl=0.05)
+    kb.search_many(["q"])
+    token = set_current_tenant_id("startup_inc")
+    try:
+        kb.search_many(["q"])
+    finally:
+        _current_tenant.reset(token)
+    assert backend.search_many.call_count == 2
+
+    kb.cache_ttl = 0
+    kb.clear_cache()
+    kb.search_many(["q"])
+    kb.search_many(["q"])
+    assert backend.search_many.call_count == 4
+
+
+def test_failing_backend_degrades_without_caching():
+    broken = MagicMock()
+    broken.search_many.side_effect = RuntimeError("index offline")
+    healthy = _backend(["a"])
+    kb = HybridKnowledgeBase([broken, healthy])
+
+    assert [h.id for h in kb.search_many(["q"])[0]] == ["a"]
+    kb.search_many(["q"])
+    assert healthy.search_many.call_count == 2
@@ -0,0 +1,75 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import jsonschema
+import pytest
+
+from agentic_platform.integrations.base import KnowledgeBaseProvider
+from agentic_platform.integrations.knowledge_base import EnterpriseKnowledgeBase, MockKnowledgeBase
+from agentic_platform.tools.tool_registry import ToolRegistry
+
+
+class TextOnlyKnowledgeBase(KnowledgeBaseProvider):
+    def search(self, query):
+        return f"Found 2 articles about '{query}'."
+
+
+def test_default_search_many_wraps_search_as_unranked_hits():
+    hits = TextOnlyKnowledgeBase().search_many(["neural network", "transformer"])
+
+    assert len(hits) == 2
+    assert hits[0][0].snippet == "Found 2 articles about 'neural network'."
+    assert hits[0][0].id != hits[1][0].id
+    assert hits[0][0].metadata == {"unranked": True}
+    assert asyncio.run(TextOnlyKnowledgeBase().asearch("langgraph"))[0].snippet.endswith("'langgraph'.")
+
+
+def test_mock_search_builds_on_per_document_hits():
+    kb = MockKnowledgeBase()
+    hits = kb.search_many(["neural network", "what is a transformer?"], k=2)
+
+    assert [h.id for h in hits[0]] == ["ML-101", "ML-102"]
+    assert hits[1][0].metadata["title"] == "Attention Is All You Need"
+    assert hits[0][0].score > hits[0][1].score
+    assert "'Neural Networks 101'" in kb.search("neural network")
+    assert kb.search("neural network").startswith("Found 3 articles: ")
+    assert kb.search("langgraph").startswith("Found 1 article: 'LangGraph Documentation'.")
+    assert asyncio.run(kb.asearch("langgraph"))[0].snippet.startswith("LangGraph is a library")
+
+
+def test_enterprise_pipelines_queries_in_one_round_trip():
+    kb = EnterpriseKnowledgeBase(pool_size=1, latency=0.1)
+
+    start = time.perf_counter()
+    results = kb.search_many([f"query {i}" for i in range(5)], k=2)
+
+    assert time.perf_counter() - start < 0.3
+    assert [len(hits) for hits in results] == [2] * 5
+    assert results[3][0].id == "DOC-8821" and "query 3" in results[3][0].snippet
+    assert kb._pool.get().round_trips == 1
+
+
+def test_enterprise_async_searches_share_the_pool():
+    kb = EnterpriseKnowledgeBase(pool_size=2, latency=0.1)
+
+    async def run():
+        return await asyncio.gather(*(kb.asearch(f"q{i}") for i in range(4)))
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+
+    # Four searches over two connections: two rounds, not four
+    assert time.perf_counter() - start < 0.35
+    assert [hits[0].id for hits in results] == ["DOC-8821"] * 4
+    assert kb._pool.qsize() == 2
+
+
+def test_search_tool_accepts_several_queries():
+    with patch("agentic_platform.integrations.factory.get_knowledge_base_provider", return_value=MockKnowledgeBase()):
+        registry = ToolRegistry()
+        result = registry.call("search_knowledge_base", {"queries": ["neural network", "transformer"]})
+        assert "Top Matches for 'neural network'" in result
+        assert "Top Matches for 'transformer'" in result
+        with pytest.raises(jsonschema.ValidationError):
+            registry.call("search_knowledge_base", {})
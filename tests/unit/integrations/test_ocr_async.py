@@ -0,0 +1,68 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+from agentic_platform.integrations.base import OCRProvider
+from agentic_platform.integrations.ocr import GoogleCloudVisionOCR, MockOCR, PreprocessOptions
+from agentic_platform.integrations.ocr_cache import CachingOCRProvider, OCRResultCache
+from agentic_platform.tools.google_vision_ocr import GoogleVisionOCR
+from agentic_platform.tools.vision_client_pool import VisionClientPool
+
+
+def test_async_mock_calls_overlap():
+    ocr = MockOCR(latency=0.2)
+
+    async def run():
+        return await asyncio.gather(*(ocr.aocr_bytes(b"img", f"{i}.jpg") for i in range(10)))
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    assert len(results) == 10
+    assert time.perf_counter() - start < 1.0
+
+
+def test_default_async_falls_back_to_thread(tmp_path):
+    class SyncOnly(MockOCR):
+        aocr_image = OCRProvider.aocr_image
+
+    image = tmp_path / "a.jpg"
+    image.write_bytes(b"img")
+    result = asyncio.run(SyncOnly().aocr_image(str(image)))
+    assert result["text"]
+
+
+def _async_client(text="hello"):
+    annotation = MagicMock(description=text, confidence=0.0)
+    response = MagicMock(text_annotations=[annotation])
+    response.error.message = ""
+    response.full_text_annotation.pages = []
+    client = MagicMock()
+    client.batch_annotate_images = AsyncMock(return_value=MagicMock(responses=[response]))
+    return client
+
+
+def test_google_async_path_uses_async_client():
+    client = _async_client()
+    pool = MagicMock(spec=VisionClientPool)
+    pool.get.return_value = client
+    provider = GoogleCloudVisionOCR(preprocess=PreprocessOptions(enabled=False))
+    provider.client = GoogleVisionOCR(pool=pool)
+
+    result = asyncio.run(provider.aocr_bytes(b"img", "a.jpg"))
+
+    assert result["text"] == "hello"
+    client.batch_annotate_images.assert_awaited_once()
+    assert pool.get.call_args.kwargs["loop"] is not None
+
+
+def test_caching_provider_async_hits_cache():
+    inner = MockOCR()
+    inner.aocr_bytes = AsyncMock(return_value={"text": "x", "confidence": 0.9})
+    provider = CachingOCRProvider(inner, OCRResultCache())
+
+    async def run():
+        await provider.aocr_bytes(b"same", "a.jpg")
+        return await provider.aocr_bytes(b"same", "b.jpg")
+
+    assert asyncio.run(run())["text"] == "x"
+    assert inner.aocr_bytes.await_count == 1
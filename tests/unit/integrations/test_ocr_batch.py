@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+from agentic_platform.integrations.base import OCRProvider
+from agentic_platform.integrations.ocr import GoogleCloudVisionOCR, MockOCR, PreprocessOptions
+from agentic_platform.integrations.ocr_cache import CachingOCRProvider, OCRResultCache
+
+
+class RecordingOCR(OCRProvider):
+    def __init__(self):
+        self.calls = []
+
+    def ocr_image(self, image_path):
+        self.calls.append(("image", image_path))
+        return {"text": image_path}
+
+    def ocr_bytes(self, content, filename=""):
+        self.calls.append(("bytes", filename))
+        return {"text": content.decode()}
+
+
+def test_default_batch_dispatches_each_item_type():
+    provider = RecordingOCR()
+    results = provider.ocr_batch(["a.jpg", b"raw", (b"named", "n.jpg")])
+    assert results == [{"text": "a.jpg"}, {"text": "raw"}, {"text": "named"}]
+    assert provider.calls == [("image", "a.jpg"), ("bytes", ""), ("bytes", "n.jpg")]
+
+
+def test_mock_batch_matches_single_calls():
+    mock = MockOCR()
+    results = mock.ocr_batch(["/data/a.jpg", (b"xyz", "b.png"), b"1234"])
+    assert results == [mock.ocr_image("/data/a.jpg"), mock.ocr_bytes(b"xyz", "b.png"), mock.ocr_bytes(b"1234")]
+
+
+def test_mock_reports_confidence_from_its_blocks():
+    result = MockOCR().ocr_bytes(b"page", "page.jpg")
+    assert result["confidence"] == 0.97
+    assert result["confidence_stats"]["count"] == 2
+    assert result["confidence_stats"]["low_confidence_count"] == 0
+
+
+def test_google_batch_reads_preprocesses_and_sends_one_batch(tmp_path):
+    path = tmp_path / "page.jpg"
+    path.write_bytes(b"page")
+    with patch("agentic_platform.integrations.ocr.OriginalGoogleOCR") as client_cls:
+        client = client_cls.return_value
+        client.ocr_batch_bytes.side_effect = lambda items: [{"text": c.decode()} for c, _ in items]
+        client.ocr_image.return_value = {"text": "", "error": "missing"}
+        provider = GoogleCloudVisionOCR(preprocess=PreprocessOptions(enabled=False))
+
+        results = provider.ocr_batch([str(path), str(tmp_path / "missing.jpg"), (b"upload", "u.jpg")])
+
+    assert results == [{"text": "page"}, {"text": "", "error": "missing"}, {"text": "upload"}]
+    client.ocr_batch_bytes.assert_called_once_with([(b"page", "page.jpg"), (b"upload", "u.jpg")])
+
+
+def test_cached_batch_sends_only_misses():
+    inner = RecordingOCR()
+    provider = CachingOCRProvider(inner, OCRResultCache())
+    provider.ocr_bytes(b"seen", "seen.jpg")
+
+    results = provider.ocr_batch([(b"seen", "again.jpg"), (b"new", "new.jpg")])
+
+    assert results == [{"text": "seen"}, {"text": "new"}]
+    assert inner.calls == [("bytes", "seen.jpg"), ("bytes", "new.jpg")]
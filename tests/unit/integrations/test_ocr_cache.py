@@ -0,0 +1,139 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentic_platform.core.tenancy import set_current_tenant_id, _current_tenant
+from agentic_platform.integrations.base import OCRProvider
+from agentic_platform.integrations.ocr_cache import CachingOCRProvider, OCRResultCache, cache_scope
+
+
+class CountingOCR(OCRProvider):
+    def __init__(self, result=None, options=None):
+        self.calls = 0
+        self.result = result or {"text": "hello", "confidence": 0.9}
+        self.options = options or {}
+
+    def ocr_image(self, image_path):
+        raise AssertionError("ocr_bytes should be used")
+
+    def ocr_bytes(self, content, filename=""):
+        self.calls += 1
+        return dict(self.result)
+
+    def cache_options(self):
+        return self.options
+
+
+@pytest.fixture
+def tenant():
+    tokens = []
+
+    def use(tenant_id):
+        tokens.append(set_current_tenant_id(tenant_id))
+
+    yield use
+    for token in reversed(tokens):
+        _current_tenant.reset(token)
+
+
+def test_repeat_bytes_hit_the_cache():
+    inner = CountingOCR()
+    provider = CachingOCRProvider(inner, OCRResultCache())
+
+    first = provider.ocr_bytes(b"image", "a.jpg")
+    first["text"] = "mutated by caller"
+    assert provider.ocr_bytes(b"image", "b.jpg") == {"text": "hello", "confidence": 0.9}
+    assert inner.calls == 1
+    assert provider.cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+
+def test_nested_fields_of_cached_results_are_not_shared():
+    def result():
+        return {"text": "hello", "blocks": [{"text": "hello", "confidence": 0.9}], "confidence_stats": {"mean": 0.9}}
+
+    inner = CountingOCR(result())
+    provider = CachingOCRProvider(inner, OCRResultCache())
+
+    first = provider.ocr_bytes(b"image")
+    first["blocks"][0]["text"] = "mutated by caller"
+    first["confidence_stats"]["mean"] = 0.0
+    second = provider.ocr_bytes(b"image")
+    second["blocks"].append({"text": "extra"})
+
+    assert provider.ocr_bytes(b"image") == result()
+    assert inner.calls == 1
+
+
+def test_ocr_image_is_keyed_by_content(tmp_path):
+    (tmp_path / "a.jpg").write_bytes(b"same")
+    (tmp_path / "b.jpg").write_bytes(b"same")
+    inner = CountingOCR()
+    provider = CachingOCRProvider(inner, OCRResultCache())
+
+    provider.ocr_image(str(tmp_path / "a.jpg"))
+    provider.ocr_image(str(tmp_path / "b.jpg"))
+    assert inner.calls == 1
+
+
+def test_options_are_part_of_the_key():
+    cache = OCRResultCache()
+    CachingOCRProvider(CountingOCR(options={"max_side": 1024}), cache).ocr_bytes(b"image")
+    inner = CountingOCR(options={"max_side": 2048})
+    CachingOCRProvider(inner, cache).ocr_bytes(b"image")
+    assert inner.calls == 1
+
+
+@pytest.mark.parametrize("result", [
+    {"text": "", "confidence": 0.0, "error": "quota exceeded"},
+    {"text": "demo", "confidence": 0.98, "mock": True},
+])
+def test_errors_and_fallbacks_are_not_cached(result):
+    inner = CountingOCR(result=result)
+    provider = CachingOCRProvider(inner, OCRResultCache())
+    provider.ocr_bytes(b"image")
+    provider.ocr_bytes(b"image")
+    assert inner.calls == 2
+
+
+def test_isolated_tenants_do_not_share_results(tenant):
+    cache = OCRResultCache()
+    inner = CountingOCR()
+    provider = CachingOCRProvider(inner, cache)
+
+    provider.ocr_bytes(b"image")  # default tenant, shared scope
+    tenant("startup_inc")
+    provider.ocr_bytes(b"image")
+    assert inner.calls == 1
+
+    tenant("enterprise_corp")
+    provider.ocr_bytes(b"image")
+    provider.ocr_bytes(b"image")
+    assert inner.calls == 2
+    assert cache_scope("enterprise_corp") == "tenant:enterprise_corp"
+
+
+def test_tenant_can_opt_out(monkeypatch):
+    config = MagicMock(features={"ocr_cache": False})
+    monkeypatch.setattr("agentic_platform.integrations.ocr_cache.TenantRegistry.get_config", lambda t: config)
+    inner = CountingOCR()
+    provider = CachingOCRProvider(inner, OCRResultCache())
+    provider.ocr_bytes(b"image")
+    provider.ocr_bytes(b"image")
+    assert inner.calls == 2
+
+
+def test_lru_tier_is_bounded():
+    cache = OCRResultCache(max_entries=2)
+    for i in range(3):
+        cache.put("*", f"k{i}", {"text": str(i)})
+    assert cache.get("*", "k0") is None
+    assert cache.get("*", "k2") == {"text": "2"}
+
+
+def test_sqlite_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "ocr.db")
+    OCRResultCache(path=path).put("*", "key", {"text": "persisted", "confidence": 1.0})
+
+    reopened = OCRResultCache(path=path)
+    assert reopened.get("*", "key") == {"text": "persisted", "confidence": 1.0}
+    assert reopened.stats()["entries"] == 1
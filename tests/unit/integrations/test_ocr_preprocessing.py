@@ -0,0 +1,95 @@
+import io
+from unittest.mock import MagicMock, patch
+
+from PIL import Image
+
+from agentic_platform.core.tenancy import set_current_tenant_id, _current_tenant
+from agentic_platform.integrations.ocr import GoogleCloudVisionOCR, PreprocessOptions, preprocess_image
+
+
+def make_jpeg(size=(3000, 2000), exif_orientation=None, dpi=None):
+    img = Image.new("RGB", size, "red")
+    kwargs = {"quality": 95}
+    if exif_orientation:
+        exif = Image.Exif()
+        exif[0x0112] = exif_orientation
+        kwargs["exif"] = exif.tobytes()
+    if dpi:
+        kwargs["dpi"] = (dpi, dpi)
+    out = io.BytesIO()
+    img.save(out, "JPEG", **kwargs)
+    return out.getvalue()
+
+
+def open_bytes(content):
+    return Image.open(io.BytesIO(content))
+
+
+def test_downscales_grayscales_and_shrinks():
+    content = make_jpeg()
+    result = preprocess_image(content, PreprocessOptions(max_side=1000))
+
+    img = open_bytes(result)
+    assert img.size == (1000, 667)
+    assert img.mode == "L"
+    assert len(result) < len(content)
+
+
+def test_strips_exif_after_applying_orientation():
+    # Orientation 6: stored landscape, displayed rotated 90 degrees
+    content = make_jpeg(size=(400, 200), exif_orientation=6)
+    img = open_bytes(preprocess_image(content, PreprocessOptions(max_side=100)))
+    assert img.size == (50, 100)
+    assert not img.getexif()
+
+
+def test_target_dpi_downscales_high_resolution_scans():
+    content = make_jpeg(size=(1200, 600), dpi=600)
+    img = open_bytes(preprocess_image(content, PreprocessOptions(target_dpi=300)))
+    assert img.size == (600, 300)
+
+
+def test_returns_original_when_disabled_or_not_an_image():
+    content = make_jpeg(size=(100, 100))
+    assert preprocess_image(content, PreprocessOptions(enabled=False)) is content
+    assert preprocess_image(b"%PDF-1.4", PreprocessOptions()) == b"%PDF-1.4"
+
+
+def test_options_resolved_per_tenant():
+    assert PreprocessOptions.for_tenant("default") == PreprocessOptions()
+    enterprise = PreprocessOptions.for_tenant("enterprise_corp")
+    assert enterprise.max_side == 3072
+
+
+def test_tenant_can_disable_preprocessing():
+    config = MagicMock(features={"ocr_preprocessing": False})
+    with patch("agentic_platform.integrations.ocr.TenantRegistry.get_config", return_value=config):
+        assert PreprocessOptions.for_tenant("acme").enabled is False
+
+
+def test_google_provider_sends_preprocessed_bytes(tmp_path):
+    path = tmp_path / "scan.jpg"
+    path.write_bytes(make_jpeg())
+    with patch("agentic_platform.integrations.ocr.OriginalGoogleOCR") as client_cls:
+        client = client_cls.return_value
+        client.ocr_bytes.return_value = {"text": "ok", "confidence": 1.0}
+        provider = GoogleCloudVisionOCR(preprocess=PreprocessOptions(max_side=500))
+
+        assert provider.ocr_image(str(path)) == {"text": "ok", "confidence": 1.0}
+
+    sent, filename = client.ocr_bytes.call_args.args
+    assert filename == "scan.jpg"
+    assert open_bytes(sent).size == (500, 333)
+
+
+def test_google_provider_uses_current_tenant_options():
+    with patch("agentic_platform.integrations.ocr.OriginalGoogleOCR") as client_cls:
+        provider = GoogleCloudVisionOCR()
+        token = set_current_tenant_id("enterprise_corp")
+        try:
+            with patch("agentic_platform.integrations.ocr.preprocess_image", side_effect=lambda c, o: c) as pre:
+                provider.ocr_bytes(b"img", "a.jpg")
+        finally:
+            _current_tenant.reset(token)
+    assert pre.call_args.args[1].max_side == 3072
+    client_cls.return_value.ocr_bytes.assert_called_once_with(b"img", "a.jpg")
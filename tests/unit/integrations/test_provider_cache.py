@@ -0,0 +1,142 @@
+import dataclasses
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from agentic_platform.core.tenancy import TenantRegistry, _current_tenant, set_current_tenant_id
+from agentic_platform.integrations import factory
+from agentic_platform.integrations.provider_cache import ProviderCache
+
+
+def test_concurrent_misses_build_once():
+    cache = ProviderCache()
+    calls = []
+
+    def build():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("k", build))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len({id(r) for r in results}) == 1
+
+
+def test_lru_bound_and_idle_eviction_close_providers():
+    cache = ProviderCache(max_entries=2, idle_timeout=60)
+    providers = {key: MagicMock() for key in "abc"}
+    for key in "abc":
+        cache.get(key, lambda key=key: providers[key])
+    providers["a"].close.assert_called_once()
+    assert cache.stats()["entries"] == 2
+
+    cache.idle_timeout = 0
+    time.sleep(0.01)
+    cache.get("d", MagicMock)
+    providers["b"].close.assert_called_once()
+    providers["c"].close.assert_called_once()
+
+
+def test_warmup_hooks_run_on_new_providers_only():
+    cache = ProviderCache()
+    hook = MagicMock()
+    cache.add_warmup_hook(hook)
+
+    provider = cache.get("k", object)
+    cache.get("k", object)
+
+    hook.assert_called_once_with("k", provider)
+
+
+def test_factory_keys_on_resolved_tenant():
+    factory.provider_cache.clear()
+    token = set_current_tenant_id("startup_inc")
+    try:
+        startup = factory.get_knowledge_base_provider()
+        assert factory.get_knowledge_base_provider() is startup
+    finally:
+        _current_tenant.reset(token)
+
+    # The default tenant must not inherit the first caller's provider
+    assert factory.get_knowledge_base_provider() is not startup
+    # Unknown tenants fall back to the default config and share its provider
+    assert factory.get_knowledge_base_provider("nobody") is factory.get_knowledge_base_provider("default")
+    factory.provider_cache.clear()
+
+
+def test_config_change_builds_a_new_provider():
+    factory.provider_cache.clear()
+    before = factory.get_knowledge_base_provider("startup_inc")
+    changed = dataclasses.replace(TenantRegistry._tenants["startup_inc"], features={"max_requests": 5})
+    with patch.dict(TenantRegistry._tenants, {"startup_inc": changed}):
+        assert factory.get_knowledge_base_provider("startup_inc") is not before
+    factory.provider_cache.clear()
+
+
+def test_warm_up_builds_every_tenant():
+    factory.provider_cache.clear()
+    factory.warm_up_providers(["startup_inc"])
+    assert factory.provider_cache.stats() == {"entries": 2, "hits": 0, "misses": 2}
+    factory.provider_cache.clear()
+
+
+def test_failed_build_keeps_waiters_serialized():
+    cache = ProviderCache()
+    running, overlaps, attempts = [], [], []
+    release = threading.Event()
+
+    def build():
+        attempts.append(1)
+        if running:
+            overlaps.append(1)
+        running.append(1)
+        try:
+            if len(attempts) == 1:
+                release.wait(1)
+                raise RuntimeError("backend down")
+            time.sleep(0.2)
+            return object()
+        finally:
+            running.pop()
+
+    def call():
+        try:
+            cache.get("k", build)
+        except RuntimeError:
+            pass
+
+    first = threading.Thread(target=call)
+    first.start()
+    time.sleep(0.02)
+    waiters = [threading.Thread(target=call) for _ in range(3)]
+    for t in waiters:
+        t.start()
+    time.sleep(0.02)
+    release.set()
+    time.sleep(0.05)
+    # Arrives after the failure, while a waiter is rebuilding
+    late = threading.Thread(target=call)
+    late.start()
+    for t in [first, *waiters, late]:
+        t.join()
+
+    assert overlaps == []
+    assert len(attempts) == 2
+    assert cache._building == {}
+
+
+def test_per_call_ocr_credentials_bypass_the_cache(tmp_path):
+    factory.provider_cache.clear()
+    creds = tmp_path / "upload.json"
+    creds.write_text("{}")
+    with patch.object(factory, "_create_ocr_provider", side_effect=lambda config, creds: object()):
+        first = factory.get_ocr_provider("enterprise_corp", credentials_json=str(creds))
+        second = factory.get_ocr_provider("enterprise_corp", credentials_json=str(creds))
+    assert first is not second
+    assert factory.provider_cache.stats()["entries"] == 0
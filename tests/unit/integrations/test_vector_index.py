@@ -0,0 +1,74 @@
+import numpy as np
+
+from agentic_platform.integrations.base import Document
+from agentic_platform.integrations.knowledge_base import LocalVectorKnowledgeBase
+from agentic_platform.integrations.vector_index import HashingEmbedder, VectorIndex
+
+DOCS = [
+    Document("nn", "Neural networks are computing systems inspired by biological brains", {"title": "Neural Networks 101"}),
+    Document("tf", "Transformers use self-attention to process sequential data in parallel"),
+    Document("lg", "LangGraph builds stateful multi-agent applications with LLMs"),
+]
+
+
+def test_embeddings_are_deterministic_unit_vectors():
+    embedder = HashingEmbedder(dim=256)
+    a = embedder.embed(["hello world", ""])
+    b = HashingEmbedder(dim=256).embed(["hello world"])
+
+    assert a.shape == (2, 256)
+    assert np.allclose(a[0], b[0])
+    assert abs(np.linalg.norm(a[0]) - 1.0) < 1e-5
+    assert not a[1].any()
+
+
+def test_search_ranks_the_matching_document_first():
+    kb = LocalVectorKnowledgeBase()
+    kb.ingest(DOCS)
+
+    hits = kb.search_many(["how do transformers use attention", "biological neural networks"], k=2)
+
+    assert [h[0].id for h in hits] == ["tf", "nn"]
+    assert hits[1][0].score > hits[1][1].score
+    assert "Neural Networks 101" in kb.search("neural networks")
+
+
+def test_reingesting_a_document_replaces_it():
+    kb = LocalVectorKnowledgeBase()
+    kb.ingest(DOCS)
+    kb.ingest([Document("nn", "Gradient boosting builds ensembles of decision trees")])
+
+    hits = kb.search_many(["decision trees"], k=5)[0]
+
+    assert len(hits) == 3
+    assert hits[0].id == "nn"
+    assert "Gradient boosting" in hits[0].snippet
+
+
+def test_index_persists_and_reloads_memory_mapped(tmp_path):
+    LocalVectorKnowledgeBase(index_dir=tmp_path).ingest(DOCS)
+
+    reopened = LocalVectorKnowledgeBase(index_dir=tmp_path)
+
+    assert isinstance(reopened.store.index._vectors, np.memmap)
+    assert reopened.search_many(["LangGraph agents"])[0][0].id == "lg"
+    reopened.ingest([Document("new", "Vector databases store embeddings")])
+    assert reopened.search_many(["vector databases"])[0][0].id == "new"
+
+
+def test_ivf_search_finds_nearest_neighbours():
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(2000, 32)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    index = VectorIndex(32, nprobe=8)
+    index.add(vectors)
+    exact_scores, exact_rows = index.search(vectors[:20], 5)
+
+    index.build_ivf(nlist=16)
+    index.add(vectors[:1] * -1)  # unpartitioned tail rows are still searched
+    scores, rows = index.search(vectors[:20], 5)
+
+    # Each query is its own nearest neighbour
+    assert (rows[:, 0] == np.arange(20)).all()
+    assert np.mean([len(set(a) & set(b)) / 5 for a, b in zip(rows, exact_rows)]) > 0.8
+    assert index.search(-vectors[:1], 1)[1][0, 0] == 2000
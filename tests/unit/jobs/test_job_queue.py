@@ -0,0 +1,126 @@
+import contextvars
+import threading
+import time
+import pytest
+from agentic_platform.core.tenancy import set_current_tenant_id, get_current_tenant_id
+from agentic_platform.jobs import JobQueue, QueueFullError, InMemoryJobStore, SQLiteJobStore, report_progress
+from agentic_platform.jobs.store import JobRecord, SUCCEEDED, FAILED, QUEUED, RUNNING
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request):
+    if request.param == "sqlite":
+        return SQLiteJobStore(":memory:")
+    return InMemoryJobStore()
+
+
+def wait_for(store, job_id, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        record = store.get(job_id)
+        if record.status in (SUCCEEDED, FAILED):
+            return record
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def test_job_store_roundtrip(store):
+    store.create(JobRecord(job_id="job-1", job_type="workflow"))
+    store.update("job-1", status=SUCCEEDED, result={"answer": 42})
+    record = store.get("job-1")
+    assert record.status == SUCCEEDED
+    assert record.result == {"answer": 42}
+    assert store.get("missing") is None
+    with pytest.raises(KeyError):
+        store.update("missing", status=FAILED)
+
+
+def test_queue_runs_job_and_stores_result(store):
+    jobs = JobQueue(store, workers=2)
+    record = jobs.submit("workflow", lambda: {"status": "completed"})
+    finished = wait_for(store, record.job_id)
+    jobs.shutdown()
+    assert finished.status == SUCCEEDED
+    assert finished.result == {"status": "completed"}
+    assert finished.started_at is not None and finished.finished_at >= finished.started_at
+
+
+def test_queue_records_failures(store):
+    def boom():
+        raise RuntimeError("tool exploded")
+
+    jobs = JobQueue(store, workers=1)
+    record = jobs.submit("agent", boom)
+    finished = wait_for(store, record.job_id)
+    jobs.shutdown()
+    assert finished.status == FAILED
+    assert "tool exploded" in finished.error
+
+
+def test_queue_full_raises():
+    store = InMemoryJobStore()
+    release = threading.Event()
+    jobs = JobQueue(store, workers=1, max_queue_size=1)
+    jobs.submit("agent", release.wait)  # occupies the worker
+    # Wait until the worker has picked up the first job
+    for _ in range(500):
+        if jobs.pending() == 0:
+            break
+        time.sleep(0.01)
+    jobs.submit("agent", lambda: None)  # fills the queue
+    with pytest.raises(QueueFullError):
+        jobs.submit("agent", lambda: None)
+    # The rejected job leaves no record behind
+    assert len(store._jobs) == 2
+    release.set()
+    jobs.shutdown()
+
+
+def test_in_memory_store_returns_snapshots():
+    store = InMemoryJobStore()
+    store.create(JobRecord(job_id="job-1", job_type="agent"))
+    snapshot = store.get("job-1")
+    store.update("job-1", status=RUNNING)
+    assert snapshot.status == QUEUED
+    assert store.get("job-1").status == RUNNING
+
+
+def test_job_runs_in_submitter_tenant_context():
+    store = InMemoryJobStore()
+    jobs = JobQueue(store, workers=1)
+
+    def submit_as_tenant():
+        set_current_tenant_id("enterprise_corp")
+        return jobs.submit("agent", get_current_tenant_id)
+
+    record = contextvars.copy_context().run(submit_as_tenant)
+    finished = wait_for(store, record.job_id)
+    jobs.shutdown()
+    assert finished.tenant_id == "enterprise_corp"
+    assert finished.result == "enterprise_corp"
+
+
+def test_in_memory_store_evicts_finished_jobs_first():
+    store = InMemoryJobStore(max_jobs=2)
+    store.create(JobRecord(job_id="a", job_type="agent", status=SUCCEEDED))
+    store.create(JobRecord(job_id="b", job_type="agent", status=QUEUED))
+    store.create(JobRecord(job_id="c", job_type="agent", status=QUEUED))
+    assert store.get("a") is None
+    assert store.get("b") is not None
+    assert store.get("c") is not None
+
+
+def test_job_reports_progress(store):
+    jobs = JobQueue(store, workers=1)
+
+    def work():
+        report_progress({"completed": 1, "total": 2})
+        return "done"
+
+    record = wait_for(store, jobs.submit("download_samples", work).job_id)
+    assert record.progress == {"completed": 1, "total": 2}
+    jobs.shutdown()
+
+
+def test_report_progress_outside_job_is_noop():
+    report_progress({"completed": 1})
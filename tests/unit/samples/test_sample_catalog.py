@@ -0,0 +1,74 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from agentic_platform.samples import SampleCatalog
+from agentic_platform.samples import catalog as catalog_module
+
+
+def write_image(path, size=(40, 30), color="white"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", size, color).save(path, "JPEG")
+
+
+@pytest.fixture
+def sample_dir(tmp_path):
+    write_image(tmp_path / "letter.jpg", size=(20, 10))
+    for n in (1, 2, 10):
+        write_image(tmp_path / "downloaded" / f"sample_{n}.jpg")
+    (tmp_path / "downloaded" / ".sample_3.jpg.part").write_bytes(b"partial")
+    return tmp_path
+
+
+def test_lists_curated_and_downloaded_with_metadata(sample_dir):
+    samples = SampleCatalog(sample_dir).snapshot().samples
+
+    letter = samples[0]
+    assert letter["path"] == "sample_data/letter.jpg"
+    assert (letter["width"], letter["height"]) == (20, 10)
+    # Curated files that are missing are listed without metadata
+    assert "sha256" not in samples[1]
+
+    downloaded = [s for s in samples if s.get("type") == "downloaded"]
+    assert [s["path"] for s in downloaded] == [
+        "sample_data/downloaded/sample_1.jpg",
+        "sample_data/downloaded/sample_2.jpg",
+        "sample_data/downloaded/sample_10.jpg",
+    ]
+    assert downloaded[2]["name"] == "Internet Sample 3"
+    assert downloaded[0]["size"] == os.path.getsize(sample_dir / "downloaded" / "sample_1.jpg")
+    assert len(downloaded[0]["sha256"]) == 64
+    assert downloaded[0]["thumbnail"] == "sample_data/downloaded/sample_1.jpg?w=256"
+
+
+def test_unchanged_catalog_is_served_without_rescanning(sample_dir):
+    catalog = SampleCatalog(sample_dir, poll_interval=60)
+    first = catalog.snapshot()
+    with patch.object(catalog, "_rebuild") as rebuild:
+        assert catalog.snapshot() is first
+    rebuild.assert_not_called()
+
+
+def test_only_changed_files_are_reindexed(sample_dir):
+    catalog = SampleCatalog(sample_dir, poll_interval=0)
+    first = catalog.snapshot()
+
+    write_image(sample_dir / "downloaded" / "sample_11.jpg", color="black")
+    with patch.object(catalog_module, "describe_file", wraps=catalog_module.describe_file) as describe:
+        second = catalog.snapshot()
+
+    assert [c.args[0].name for c in describe.call_args_list] == ["sample_11.jpg"]
+    assert len(second.samples) == len(first.samples) + 1
+    assert second.etag != first.etag
+
+
+def test_invalidate_forces_check_within_poll_interval(sample_dir):
+    catalog = SampleCatalog(sample_dir, poll_interval=60)
+    first = catalog.snapshot()
+    (sample_dir / "downloaded" / "sample_2.jpg").unlink()
+
+    assert catalog.snapshot() is first
+    catalog.invalidate()
+    assert len(catalog.snapshot().samples) == len(first.samples) - 1
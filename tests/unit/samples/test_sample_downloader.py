@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+import httpx
+
+from agentic_platform.samples import SampleDownloader, HostRateLimiter
+
+
+def make_transport(handler):
+    return httpx.MockTransport(handler)
+
+
+def test_downloads_batch_and_streams_to_disk(tmp_path):
+    def handler(request):
+        return httpx.Response(200, content=b"jpeg-bytes")
+
+    downloader = SampleDownloader(tmp_path, concurrency=4, per_host_interval=0, transport=make_transport(handler))
+    files = asyncio.run(downloader.download(3, "letter,paper"))
+
+    assert [f["path"] for f in files] == [f"sample_data/downloaded/sample_{i}.jpg" for i in (1, 2, 3)]
+    assert files[0]["name"] == "Internet Sample 1 (letter)"
+    assert files[1]["name"] == "Internet Sample 2 (paper)"
+    assert (tmp_path / "sample_2.jpg").read_bytes() == b"jpeg-bytes"
+    assert not list(tmp_path.glob(".*.part"))
+
+
+def test_falls_back_to_picsum_per_item(tmp_path):
+    def handler(request):
+        if request.url.host == "loremflickr.com" and request.url.path.endswith("/bad"):
+            return httpx.Response(503)
+        return httpx.Response(200, content=request.url.host.encode())
+
+    downloader = SampleDownloader(tmp_path, per_host_interval=0, transport=make_transport(handler))
+    files = asyncio.run(downloader.download(2, "bad,good"))
+
+    assert files[0]["name"] == "Random Sample 1"
+    assert (tmp_path / "sample_1.jpg").read_bytes() == b"picsum.photos"
+    assert files[1]["name"] == "Internet Sample 2 (good)"
+
+
+def test_failed_items_are_skipped_and_reported(tmp_path):
+    def handler(request):
+        return httpx.Response(500)
+
+    progress = []
+    downloader = SampleDownloader(tmp_path, per_host_interval=0, transport=make_transport(handler))
+    files = asyncio.run(downloader.download(2, "x", on_progress=lambda *args: progress.append(args)))
+
+    assert files == []
+    assert progress[-1] == (2, 2, 0, 2)
+    assert not list(tmp_path.iterdir())
+
+
+def test_concurrency_is_bounded(tmp_path):
+    in_flight = 0
+    peak = 0
+
+    class SlowTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, content=b"x")
+
+    downloader = SampleDownloader(tmp_path, concurrency=3, per_host_interval=0, transport=SlowTransport())
+    files = asyncio.run(downloader.download(10, "doc"))
+
+    assert len(files) == 10
+    assert peak == 3
+
+
+def test_rate_limiter_spaces_requests_per_host():
+    async def run():
+        limiter = HostRateLimiter(0.05)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.wait("a.example") for _ in range(3)), limiter.wait("b.example"))
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+    # Three requests to one host need two intervals; the other host is not delayed further
+    assert 0.09 <= elapsed < 0.3
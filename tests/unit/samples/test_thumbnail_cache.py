@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from agentic_platform.samples import ThumbnailCache
+from agentic_platform.samples import thumbnails as thumbnails_module
+
+
+@pytest.fixture
+def original(tmp_path):
+    path = tmp_path / "originals" / "big.jpg"
+    path.parent.mkdir()
+    Image.new("RGB", (800, 600), "red").save(path, "JPEG")
+    return path
+
+
+def test_renders_downscaled_copy_keeping_aspect_ratio(tmp_path, original):
+    cache = ThumbnailCache(tmp_path / "cache")
+    rendition = cache.get(original, width=200)
+
+    with Image.open(rendition.path) as img:
+        assert img.size == (200, 150)
+    assert rendition.path.parent.parent == tmp_path / "cache"
+    assert rendition.path.name.startswith(rendition.sha256)
+    assert rendition.path.stat().st_size < original.stat().st_size
+
+
+def test_never_upscales(tmp_path, original):
+    rendition = ThumbnailCache(tmp_path / "cache").get(original, width=2000, height=2000)
+    with Image.open(rendition.path) as img:
+        assert img.size == (800, 600)
+
+
+def test_repeat_requests_do_not_read_the_original(tmp_path, original):
+    hasher = patch.object(thumbnails_module, "file_sha256", wraps=thumbnails_module.file_sha256)
+    with hasher as file_sha256:
+        cache = ThumbnailCache(tmp_path / "cache")
+        first = cache.get(original, width=100)
+        with patch.object(thumbnails_module.Image, "open") as image_open:
+            assert cache.get(original, width=100) == first
+        image_open.assert_not_called()
+    assert file_sha256.call_count == 1
+
+
+def test_identical_originals_share_renditions(tmp_path, original):
+    copy = original.with_name("copy.jpg")
+    copy.write_bytes(original.read_bytes())
+    cache = ThumbnailCache(tmp_path / "cache")
+
+    first = cache.get(original, height=60)
+    with patch.object(cache, "_render") as render:
+        assert cache.get(copy, height=60).path == first.path
+    render.assert_not_called()
+
+
+def test_replaced_original_gets_new_rendition(tmp_path, original):
+    cache = ThumbnailCache(tmp_path / "cache")
+    first = cache.get(original, width=100)
+    Image.new("RGB", (400, 400), "blue").save(original, "JPEG")
+
+    second = cache.get(original, width=100)
+    assert second.sha256 != first.sha256
+    with Image.open(second.path) as img:
+        assert img.size == (100, 100)
@@ -4,9 +4,10 @@ Unit tests for GoogleVisionOCR adapter.
 Tests the OCR functionality with mocked Google Vision API responses.
 """
 
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
-from agentic_platform.tools.google_vision_ocr import GoogleVisionOCR
+from agentic_platform.tools.google_vision_ocr import GoogleVisionOCR, confidence_stats
 
 
 class TestGoogleVisionOCR:
@@ -43,6 +44,27 @@ class TestGoogleVisionOCR:
         # Average of 0.95 and 0.93 = 0.94
         assert abs(result["confidence"] - 0.94) < 0.01
 
+    @patch("agentic_platform.tools.google_vision_ocr.vision.ImageAnnotatorClient")
+    def test_ocr_bytes_sends_content_without_file_io(self, mock_client_class):
+        """ocr_bytes should pass in-memory content straight to the API."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        mock_full_text = MagicMock()
+        mock_full_text.description = "In-memory text"
+        mock_full_text.confidence = 0
+        mock_response = MagicMock()
+        mock_response.text_annotations = [mock_full_text]
+        mock_client.text_detection.return_value = mock_response
+
+        ocr = GoogleVisionOCR()
+        with patch("builtins.open", side_effect=AssertionError("no file I/O expected")):
+            result = ocr.ocr_bytes(b"image-bytes", "upload.jpg")
+
+        assert result["text"] == "In-memory text"
+        sent_image = mock_client.text_detection.call_args.kwargs["image"]
+        assert sent_image.content == b"image-bytes"
+
     @patch("agentic_platform.tools.google_vision_ocr.vision.ImageAnnotatorClient")
     def test_ocr_with_no_text(self, mock_client_class):
         """Test OCR when no text is detected."""
@@ -405,3 +427,81 @@ class TestGoogleVisionOCR:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestGoogleVisionOCRBatch:
+    """Tests for batch_annotate_images support."""
+
+    @staticmethod
+    def _response(text, error=""):
+        annotation = MagicMock()
+        annotation.description = text
+        annotation.confidence = 0
+        response = MagicMock()
+        response.text_annotations = [annotation] if text else []
+        response.error.message = error
+        return response
+
+    @patch("agentic_platform.tools.google_vision_ocr.vision.ImageAnnotatorClient")
+    def test_batches_sixteen_images_per_request(self, mock_client_class):
+        mock_client = mock_client_class.return_value
+        mock_client.batch_annotate_images.side_effect = lambda requests: MagicMock(
+            responses=[self._response(f"text {i}") for i in range(len(requests))]
+        )
+
+        ocr = GoogleVisionOCR()
+        results = ocr.ocr_batch_bytes([(b"img", f"{i}.jpg") for i in range(20)])
+
+        sizes = [len(c.kwargs["requests"]) for c in mock_client.batch_annotate_images.call_args_list]
+        assert sizes == [16, 4]
+        assert len(results) == 20
+        assert results[17] == {"text": "text 1", "confidence": 1.0}
+        mock_client.text_detection.assert_not_called()
+
+    @patch("agentic_platform.tools.google_vision_ocr.vision.ImageAnnotatorClient")
+    def test_per_image_errors_do_not_fail_the_batch(self, mock_client_class):
+        mock_client = mock_client_class.return_value
+        mock_client.batch_annotate_images.return_value = MagicMock(
+            responses=[self._response("ok"), self._response("", error="Bad image data")]
+        )
+
+        results = GoogleVisionOCR().ocr_batch_bytes([(b"a", "a.jpg"), (b"b", "b.jpg")])
+
+        assert results[0]["text"] == "ok"
+        assert results[1]["error"] == "Bad image data"
+
+
+class TestConfidenceStats:
+    """Tests for symbol-level confidence statistics."""
+
+    def test_low_confidence_runs_become_spans(self):
+        labels = ["a", "b", "c", "d", "e"]
+        values = np.array([0.9, 0.3, 0.4, 0.95, 0.5])
+
+        stats = confidence_stats(labels, values)
+
+        assert stats["count"] == 5
+        assert stats["min"] == 0.3
+        assert abs(stats["mean"] - 0.61) < 1e-9
+        assert stats["low_confidence_count"] == 3
+        assert [(s["start"], s["end"], s["text"]) for s in stats["low_confidence_spans"]] == [
+            (1, 3, "b c"), (4, 5, "e"),
+        ]
+        assert stats["low_confidence_spans"][0]["confidence"] == 0.35
+
+    def test_symbols_of_full_text_annotation_are_used(self):
+        """Word annotations without confidence fall back to the symbol tree."""
+        full = MagicMock(description="Hi", confidence=0)
+        word = MagicMock(description="Hi", confidence=0)
+        symbols = [MagicMock(text="H", confidence=0.9), MagicMock(text="i", confidence=0.5)]
+        response = MagicMock(text_annotations=[full, word])
+        response.full_text_annotation.pages = [
+            MagicMock(blocks=[MagicMock(paragraphs=[MagicMock(words=[MagicMock(symbols=symbols)])])])
+        ]
+
+        result = GoogleVisionOCR(pool=MagicMock())._parse_response(response, "hi.jpg")
+
+        assert abs(result["confidence"] - 0.7) < 1e-9
+        assert result["confidence_stats"]["low_confidence_spans"] == [
+            {"start": 1, "end": 2, "text": "i", "confidence": 0.5}
+        ]
@@ -1,6 +1,7 @@
 
 import pytest
 from agentic_platform.audit import audit_log
+from agentic_platform.core.types import AgentOutputEvent
 from agentic_platform.tools import PiiRedactor
 
 PII_EXAMPLES = [
@@ -20,3 +21,43 @@ def test_redact_pii_in_audit_event():
     event = {"message": "Contact: jane@company.com, 212-555-7890"}
     redacted = redactor.redact_event(event)
     assert redacted["message"] == "Contact: <REDACTED:EMAIL>, <REDACTED:PHONE>"
+
+
+def test_redact_nested_values_without_copying_clean_subtrees():
+    redactor = PiiRedactor()
+    clean = {"lines": ["no pii here"], "confidence": 0.9}
+    result = {"text": "ok", "meta": clean, "pages": [{"text": "mail bob@corp.io"}, ("555.123.4567", 1)]}
+
+    redacted = redactor.redact_value(result)
+
+    assert redacted["pages"] == [{"text": "mail <REDACTED:EMAIL>"}, ("<REDACTED:PHONE>", 1)]
+    assert redacted["meta"] is clean
+    assert result["pages"][0]["text"] == "mail bob@corp.io"  # input left untouched
+    assert redactor.redact_value(clean) is clean
+
+
+def test_redact_audit_event_dataclass():
+    redactor = PiiRedactor()
+    event = AgentOutputEvent(event_type="AGENT_OUTPUT", job_id="job-1", node_id="ocr",
+                                       timestamp="2026-01-31T00:00:00Z", status="output",
+                                       artifact_ref="reply to ann@example.org")
+
+    redacted = redactor.redact_event(event)
+
+    assert isinstance(redacted, AgentOutputEvent)
+    assert redacted.artifact_ref == "reply to <REDACTED:EMAIL>"
+    assert redactor.redact_event(redacted) is redacted
+
+
+def test_redact_stream_handles_matches_across_chunks():
+    redactor = PiiRedactor(max_token=64)
+    text = "Contact jane.doe@company.com or 212-555-7890 today. " * 20
+    for size in (1, 3, 7, 50):
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        assert "".join(redactor.redact_stream(chunks)) == redactor.redact(text)
+
+
+def test_custom_patterns_share_one_scan():
+    redactor = PiiRedactor({"SSN": r"\b\d{3}-\d{2}-\d{4}\b", "EMAIL": r"\S+@\S+"})
+
+    assert redactor.redact("ssn 123-45-6789, a@b") == "ssn <REDACTED:SSN>, <REDACTED:EMAIL>"
@@ -0,0 +1,139 @@
+import asyncio
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+from agentic_platform.core.tenancy import set_current_tenant_id, _current_tenant
+from agentic_platform.integrations import factory
+from agentic_platform.tools.google_vision_ocr import GoogleVisionOCR
+from agentic_platform.tools.vision_client_pool import VisionClientPool
+
+
+def test_reuses_one_client_per_credential_set():
+    client_cls = MagicMock()
+    pool = VisionClientPool()
+
+    first = pool.get(client_cls)
+    assert pool.get(client_cls) is first
+    assert client_cls.call_count == 1
+
+
+def test_rotated_credentials_get_a_new_client(tmp_path):
+    creds = tmp_path / "sa.json"
+    creds.write_text("{}")
+    client_cls = MagicMock(side_effect=lambda **kw: MagicMock())
+    pool = VisionClientPool()
+
+    with patch("agentic_platform.tools.vision_client_pool.service_account.Credentials.from_service_account_file"):
+        first = pool.get(client_cls, str(creds))
+        assert pool.get(client_cls, str(creds)) is first
+        creds.write_text('{"rotated": true}')
+        os.utime(creds, ns=(1, 1))
+        assert pool.get(client_cls, str(creds)) is not first
+    assert client_cls.call_count == 2
+
+
+def test_idle_clients_are_closed_and_replaced():
+    client_cls = MagicMock(side_effect=lambda **kw: MagicMock())
+    pool = VisionClientPool(idle_timeout=0)
+
+    first = pool.get(client_cls)
+    second = pool.get(client_cls)
+    assert second is not first
+    first.transport.close.assert_called_once()
+
+
+def test_failed_construction_is_remembered_briefly():
+    client_cls = MagicMock(side_effect=RuntimeError("no credentials"))
+    pool = VisionClientPool(failure_ttl=60)
+
+    assert pool.get(client_cls) is None
+    assert pool.get(client_cls) is None
+    assert client_cls.call_count == 1
+    assert pool.stats() == {"clients": 0, "created": 0}
+
+
+def test_concurrent_first_use_creates_one_client():
+    client_cls = MagicMock()
+    pool = VisionClientPool()
+    threads = [threading.Thread(target=pool.get, args=(client_cls,)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert client_cls.call_count == 1
+
+
+def test_ocr_instances_share_the_pooled_client():
+    pool = VisionClientPool()
+    with patch("agentic_platform.tools.google_vision_ocr.vision.ImageAnnotatorClient") as client_cls:
+        assert GoogleVisionOCR(pool=pool).client is GoogleVisionOCR(pool=pool).client
+    assert client_cls.call_count == 1
+
+
+def test_factory_resolves_tenant_before_caching():
+    factory.get_ocr_provider.cache_clear()
+    token = set_current_tenant_id("startup_inc")
+    try:
+        startup = factory.get_ocr_provider()
+    finally:
+        _current_tenant.reset(token)
+    default = factory.get_ocr_provider()
+
+    assert type(startup).__name__ == "MockOCR"
+    assert type(default).__name__ != "MockOCR"
+    factory.get_ocr_provider.cache_clear()
+
+
+def test_async_clients_are_keyed_by_event_loop():
+    client_cls = MagicMock(side_effect=lambda **kw: MagicMock())
+    pool = VisionClientPool()
+
+    async def get():
+        return pool.get(client_cls, loop=asyncio.get_running_loop())
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+    # The first loop is closed, so its client is dropped rather than reused
+    assert second is not first
+    assert pool.stats()["clients"] == 1
+
+
+def test_copies_of_one_credential_file_share_a_client(tmp_path):
+    client_cls = MagicMock(side_effect=lambda **kw: MagicMock())
+    pool = VisionClientPool()
+    paths = []
+    for name in ("upload-1.json", "upload-2.json"):
+        path = tmp_path / name
+        path.write_text('{"client_email": "ocr@example.com"}')
+        paths.append(str(path))
+
+    with patch("agentic_platform.tools.vision_client_pool.service_account.Credentials.from_service_account_file"):
+        assert pool.get(client_cls, paths[0]) is pool.get(client_cls, paths[1])
+    assert client_cls.call_count == 1
+
+
+def test_pool_is_bounded_and_closes_evicted_clients():
+    pool = VisionClientPool(max_entries=2)
+    classes = [MagicMock(side_effect=lambda **kw: MagicMock()) for _ in range(3)]
+    clients = [pool.get(cls) for cls in classes]
+
+    assert pool.stats()["clients"] == 2
+    clients[0].transport.close.assert_called_once()
+    clients[1].transport.close.assert_not_called()
+
+
+def test_slow_construction_does_not_block_other_credentials():
+    release = threading.Event()
+    slow_cls = MagicMock(side_effect=lambda **kw: release.wait(5) and MagicMock())
+    fast_cls = MagicMock()
+    pool = VisionClientPool()
+    slow = threading.Thread(target=pool.get, args=(slow_cls,))
+    slow.start()
+    try:
+        done = threading.Event()
+        threading.Thread(target=lambda: (pool.get(fast_cls), done.set())).start()
+        assert done.wait(1)
+    finally:
+        release.set()
+        slow.join()
@@ -190,3 +190,22 @@ def test_engine_persistence_save_and_resume():
     events = log.get_events(job_id=result2["job_id"])
     tool2_events = [e for e in events if getattr(e, "node_id", None) == "tool2"]
     assert tool2_events, "tool2 should have events after resume"
+
+def test_engine_accepts_compiled_workflow():
+    """A precompiled plan runs the same as its definition dict."""
+    wf_def = {
+        "nodes": [
+            {"id": "start", "type": "start"},
+            {"id": "tool1", "type": "tool", "tool": "dummy_tool"},
+            {"id": "end", "type": "end"}
+        ],
+        "edges": [
+            {"from": "start", "to": "tool1"},
+            {"from": "tool1", "to": "end"}
+        ]
+    }
+    plan = definition.compile_workflow(wf_def)
+    log = audit_log.InMemoryAuditLog()
+    result = engine.run(plan, input_artifact=None, tool_client=DummyToolClient(), audit_log=log)
+    assert result["status"] == "completed"
+    assert result["tool_results"] == [{"node_id": "tool1", "result": {"result": "ran dummy_tool"}}]
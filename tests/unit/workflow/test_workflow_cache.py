@@ -0,0 +1,78 @@
+import os
+import pytest
+from unittest.mock import patch
+from agentic_platform.workflow import definition
+from agentic_platform.workflow.cache import WorkflowCache
+
+WORKFLOW_YAML = """
+nodes:
+  - id: start
+    type: start
+  - id: ocr
+    type: tool
+    tool: ocr_page
+  - id: end
+    type: end
+edges:
+  - from: start
+    to: ocr
+  - from: ocr
+    to: end
+"""
+
+
+def test_compile_workflow_indexes_nodes_and_edges():
+    plan = definition.compile_workflow(definition.parse_workflow_text(WORKFLOW_YAML))
+    assert plan.start_node["id"] == "start"
+    assert plan.node_map["ocr"]["tool"] == "ocr_page"
+    assert [e["to"] for e in plan.outgoing["start"]] == ["ocr"]
+    assert "end" not in plan.outgoing
+
+
+def test_parse_workflow_text_rejects_invalid_documents():
+    with pytest.raises(ValueError):
+        definition.parse_workflow_text("")
+    with pytest.raises(ValueError):
+        definition.parse_workflow_text("- just\n- a list")
+    with pytest.raises(ValueError):
+        definition.parse_workflow_text("nodes: []")
+
+
+def test_load_text_skips_parsing_on_repeat_upload():
+    cache = WorkflowCache()
+    first = cache.load_text(WORKFLOW_YAML)
+    with patch("agentic_platform.workflow.cache.parse_workflow_text") as parse:
+        second = cache.load_text(WORKFLOW_YAML.encode("utf-8"))
+    parse.assert_not_called()
+    assert second is first
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+
+def test_load_file_reloads_when_file_changes(tmp_path):
+    path = tmp_path / "wf.yaml"
+    path.write_text(WORKFLOW_YAML)
+    cache = WorkflowCache()
+    first = cache.load_file(str(path))
+    assert cache.load_file(str(path)) is first
+
+    path.write_text(WORKFLOW_YAML.replace("ocr_page", "other_tool"))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = cache.load_file(str(path))
+    assert second is not first
+    assert second.node_map["ocr"]["tool"] == "other_tool"
+
+
+def test_cache_is_lru_bounded():
+    cache = WorkflowCache(max_entries=2)
+    docs = [WORKFLOW_YAML.replace("ocr_page", f"tool_{i}") for i in range(3)]
+    cache.load_text(docs[0])
+    cache.load_text(docs[1])
+    cache.load_text(docs[0])  # refresh docs[0]
+    cache.load_text(docs[2])  # evicts docs[1]
+    assert cache.stats()["entries"] == 2
+    misses = cache.stats()["misses"]
+    cache.load_text(docs[0])
+    assert cache.stats()["misses"] == misses
+    cache.load_text(docs[1])
+    assert cache.stats()["misses"] == misses + 1
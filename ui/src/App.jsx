@@ -523,13 +523,14 @@ function App() {
   // Load samples from backend on mount
   const loadSamplesFromBackend = async () => {
     try {
-      // Add timestamp to prevent caching
-      const res = await fetch(`${API_BASE_URL}/list-samples/?t=${Date.now()}`);
+      // The server sends ETag + no-cache, so the browser revalidates instead of refetching
+      const res = await fetch(`${API_BASE_URL}/list-samples/`);
       if (res.ok) {
         const data = await res.json();
         const mapped = data.samples.map((s, i) => ({
           ...s,
           url: `${API_BASE_URL}/${s.path}`,
+          thumbUrl: s.thumbnail ? `${API_BASE_URL}/${s.thumbnail}` : null,
           id: `sample-${i}`,
           displayName: s.name
         }));
@@ -1140,7 +1141,7 @@ function App() {
                           Preview (Click 'Run OCR' to process)
                         </Typography>
                         <Box sx={{ mt: 1, mb: 1, maxHeight: '200px', overflow: 'hidden', display: 'flex', justifyContent: 'center' }}>
-                          <img src={previewUrl} alt="Preview" style={{ maxWidth: '100%', maxHeight: '200px', objectFit: 'contain' }} />
+                          <img src={visibleSamples.find(s => s.url === previewUrl)?.thumbUrl || previewUrl} alt="Preview" style={{ maxWidth: '100%', maxHeight: '200px', objectFit: 'contain' }} />
                         </Box>
                         <Typography variant="caption" sx={{ display: 'block', wordBreak: 'break-all', fontSize: '0.7rem', color: '#888' }}>
                           Source: {previewUrl}